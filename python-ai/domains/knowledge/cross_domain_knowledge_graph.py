@@ -253,8 +253,10 @@ class CrossDomainKnowledgeGraph:
 
                 # Ajouter les résultats au domaine correspondant
                 for similar in similar_concepts:
-                    # Éviter les doublons
-                    if similar not in cross_domain_results[domain]:
+                    # Éviter les doublons (la certitude varie selon la requête)
+                    if similar.get("concept_id") not in {
+                        c.get("concept_id") for c in cross_domain_results[domain]
+                    }:
                         cross_domain_results[domain].append(similar)
 
         # Fusionner les résultats
@@ -1,5 +1,6 @@
 from typing import Dict, List, Any, Optional, Union, Set, Tuple
 import logging
+from datetime import datetime, timedelta
 from neo4j import GraphDatabase
 from neo4j.exceptions import Neo4jError
 
@@ -10,6 +11,15 @@ class KnowledgeGraph:
     Permet de stocker et récupérer des concepts et leurs relations.
     """
 
+    # Préfixe des métadonnées stockées sur les nœuds: une clé de métadonnée
+    # (issue d'un feedback utilisateur) ne peut pas écraser une propriété
+    # propre du concept (id, type, created_at...)
+    METADATA_PREFIX = "metadata_"
+
+    # Types des nœuds :Concept qui ne sont pas des connaissances (URLs sources,
+    # lacunes identifiées), exclus des concepts récents
+    NON_CONCEPT_TYPES = ("url", "knowledge_gap")
+
     def __init__(self, uri: str, username: str, password: str, database: str = "neo4j"):
         """
         Initialise la connexion au graphe de connaissances Neo4j.
@@ -54,6 +64,91 @@ class KnowledgeGraph:
             self.logger.error(f"Erreur lors de l'ajout du concept: {e}")
             return False
 
+    def add_concepts(self, concepts: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Ajoute ou met à jour plusieurs concepts en une seule transaction.
+
+        Args:
+            concepts (Dict[str, Dict[str, Any]]): Propriétés des concepts, par identifiant
+
+        Returns:
+            int: Nombre de concepts traités
+        """
+        if not concepts:
+            return 0
+
+        query = """
+        UNWIND $concepts AS concept
+        MERGE (c:Concept {id: concept.id})
+        SET c += concept.properties
+        RETURN count(*) as count
+        """
+
+        parameters = [
+            {"id": concept_id, "properties": properties}
+            for concept_id, properties in concepts.items()
+        ]
+
+        try:
+            with self.driver.session(database=self.database) as session:
+                return session.execute_write(
+                    lambda tx: tx.run(query, concepts=parameters).single()["count"]
+                )
+        except Neo4jError as e:
+            self.logger.error(f"Erreur lors de l'ajout des concepts: {e}")
+            return 0
+
+    def update_concept_metadata_field(
+        self, concept_id: str, key: str, value: Any
+    ) -> bool:
+        """
+        Met à jour une seule métadonnée d'un concept sans relire ni réécrire le
+        reste du nœud. La métadonnée est stockée sous la propriété
+        METADATA_PREFIX + key.
+
+        Args:
+            concept_id (str): ID du concept
+            key (str): Clé de la métadonnée
+            value (Any): Nouvelle valeur
+
+        Returns:
+            bool: True si le concept a été mis à jour
+        """
+        query = """
+        MATCH (c:Concept {id: $concept_id})
+        SET c += $properties
+        RETURN c.id as id
+        """
+        try:
+            with self.driver.session(database=self.database) as session:
+                result = session.run(
+                    query,
+                    concept_id=concept_id,
+                    properties={f"{self.METADATA_PREFIX}{key}": value},
+                )
+                return result.single() is not None
+        except Neo4jError as e:
+            self.logger.error(f"Erreur lors de la mise à jour du concept: {e}")
+            return False
+
+    @classmethod
+    def get_concept_metadata(cls, concept: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Extrait les métadonnées des propriétés d'un concept.
+
+        Args:
+            concept (Dict[str, Any]): Propriétés du concept
+
+        Returns:
+            Dict[str, Any]: Métadonnées, indexées par clé (sans préfixe)
+        """
+        prefix = cls.METADATA_PREFIX
+        return {
+            key[len(prefix) :]: value
+            for key, value in concept.items()
+            if key.startswith(prefix)
+        }
+
     def add_relationship(
         self,
         source_id: str,
@@ -76,15 +171,13 @@ class KnowledgeGraph:
         if properties is None:
             properties = {}
 
-        query = """
-        MATCH (source:Concept {id: $source_id})
-        MATCH (target:Concept {id: $target_id})
+        query = f"""
+        MATCH (source:Concept {{id: $source_id}})
+        MATCH (target:Concept {{id: $target_id}})
         MERGE (source)-[r:`{relation_type}`]->(target)
         SET r += $properties
         RETURN r
-        """.format(
-            relation_type=relation_type
-        )
+        """
 
         try:
             with self.driver.session(database=self.database) as session:
@@ -99,6 +192,70 @@ class KnowledgeGraph:
             self.logger.error(f"Erreur lors de la création de la relation: {e}")
             return False
 
+    def create_missing_relationships(
+        self,
+        relation_type: str,
+        relationships: List[Dict[str, Any]],
+        bidirectional: bool = False,
+    ) -> List[Tuple[str, str]]:
+        """
+        Crée en une seule transaction les relations qui n'existent pas encore.
+        Les relations existantes sont laissées intactes: MERGE fait office de
+        vérification d'existence.
+
+        Args:
+            relation_type (str): Type de relation
+            relationships (List[Dict[str, Any]]): Relations à créer, chacune avec les
+                clés "source_id", "target_id" et optionnellement "properties"
+            bidirectional (bool, optional): Créer aussi la relation inverse. Par défaut à False.
+
+        Returns:
+            List[Tuple[str, str]]: Couples (source, cible) nouvellement créés
+        """
+        if not relationships:
+            return []
+
+        # timestamp() est constant au sein d'une requête: seules les relations
+        # créées par celle-ci portent la valeur courante
+        reverse_clause = (
+            f"""
+        MERGE (target)-[reverse:`{relation_type}`]->(source)
+        ON CREATE SET reverse += rel.properties, reverse.created_at = timestamp()"""
+            if bidirectional
+            else ""
+        )
+        query = f"""
+        UNWIND $relationships AS rel
+        MATCH (source:Concept {{id: rel.source_id}})
+        MATCH (target:Concept {{id: rel.target_id}})
+        MERGE (source)-[r:`{relation_type}`]->(target)
+        ON CREATE SET r += rel.properties, r.created_at = timestamp(){reverse_clause}
+        WITH rel, r
+        WHERE r.created_at = timestamp()
+        RETURN rel.source_id as source_id, rel.target_id as target_id
+        """
+
+        parameters = [
+            {
+                "source_id": relationship["source_id"],
+                "target_id": relationship["target_id"],
+                "properties": relationship.get("properties") or {},
+            }
+            for relationship in relationships
+        ]
+
+        try:
+            with self.driver.session(database=self.database) as session:
+                return session.execute_write(
+                    lambda tx: [
+                        (record["source_id"], record["target_id"])
+                        for record in tx.run(query, relationships=parameters)
+                    ]
+                )
+        except Neo4jError as e:
+            self.logger.error(f"Erreur lors de la création des relations: {e}")
+            return []
+
     def get_concept(self, concept_id: str) -> Optional[Dict[str, Any]]:
         """
         Récupère un concept par son ID.
@@ -124,6 +281,74 @@ class KnowledgeGraph:
             self.logger.error(f"Erreur lors de la récupération du concept: {e}")
             return None
 
+    def get_concepts(self, concept_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Récupère plusieurs concepts en une seule requête.
+
+        Args:
+            concept_ids (List[str]): IDs des concepts à récupérer
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Données des concepts trouvés, indexées par ID
+        """
+        if not concept_ids:
+            return {}
+
+        query = """
+        MATCH (c:Concept)
+        WHERE c.id IN $concept_ids
+        RETURN c
+        """
+        try:
+            with self.driver.session(database=self.database) as session:
+                result = session.run(query, concept_ids=list(concept_ids))
+                concepts = {}
+                for record in result:
+                    concept = dict(record["c"])
+                    concepts[concept.get("id")] = concept
+                return concepts
+        except Neo4jError as e:
+            self.logger.error(f"Erreur lors de la récupération des concepts: {e}")
+            return {}
+
+    def get_recent_concept_ids(self, hours: int = 24, limit: int = 50) -> List[str]:
+        """
+        Récupère les IDs des concepts ajoutés récemment, sans charger leurs propriétés.
+
+        Args:
+            hours (int, optional): Fenêtre de temps en heures. Par défaut à 24.
+            limit (int, optional): Nombre maximum d'IDs. Par défaut à 50.
+
+        Returns:
+            List[str]: IDs des concepts, du plus récent au plus ancien
+        """
+        # Les concepts extraits ne portent que extracted_at, les autres
+        # timestamp; les horodatages ISO 8601 se comparent dans l'ordre
+        # chronologique
+        query = """
+        MATCH (c:Concept)
+        WITH c, coalesce(c.extracted_at, c.timestamp) AS added_at
+        WHERE added_at >= $since AND NOT coalesce(c.type, '') IN $excluded_types
+        RETURN c.id as id
+        ORDER BY added_at DESC
+        LIMIT $limit
+        """
+        since = (datetime.now() - timedelta(hours=hours)).isoformat()
+        try:
+            with self.driver.session(database=self.database) as session:
+                result = session.run(
+                    query,
+                    since=since,
+                    excluded_types=list(self.NON_CONCEPT_TYPES),
+                    limit=limit,
+                )
+                return [record["id"] for record in result]
+        except Neo4jError as e:
+            self.logger.error(
+                f"Erreur lors de la récupération des concepts récents: {e}"
+            )
+            return []
+
     def get_related_concepts(
         self, concept_id: str, relation_type: Optional[str] = None, max_depth: int = 1
     ) -> List[Dict[str, Any]]:
@@ -167,6 +392,55 @@ class KnowledgeGraph:
             )
             return []
 
+    def get_related_concepts_batch(
+        self,
+        concept_ids: List[str],
+        relation_type: Optional[str] = None,
+        max_depth: int = 1,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Récupère en une seule requête les concepts reliés à plusieurs concepts.
+
+        Args:
+            concept_ids (List[str]): IDs des concepts sources
+            relation_type (Optional[str], optional): Filtrer par type de relation
+            max_depth (int, optional): Profondeur maximale de traversée. Par défaut à 1.
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Concepts reliés, indexés par ID de
+            concept source (liste vide si aucun)
+        """
+        related_by_id = {concept_id: [] for concept_id in concept_ids}
+        if not related_by_id:
+            return related_by_id
+
+        relation_filter = f":`{relation_type}`" if relation_type else ""
+        query = f"""
+        UNWIND $concept_ids AS concept_id
+        MATCH (c:Concept {{id: concept_id}})-[r{relation_filter}*1..{max_depth}]->(related)
+        RETURN concept_id, related, r
+        """
+
+        try:
+            with self.driver.session(database=self.database) as session:
+                result = session.run(query, concept_ids=list(related_by_id))
+                for record in result:
+                    related_by_id[record["concept_id"]].append(
+                        {
+                            "concept": dict(record["related"]),
+                            "path": [
+                                {"type": r.type, "properties": dict(r)}
+                                for r in record["r"]
+                            ],
+                        }
+                    )
+                return related_by_id
+        except Neo4jError as e:
+            self.logger.error(
+                f"Erreur lors de la récupération des concepts reliés: {e}"
+            )
+            return {concept_id: [] for concept_id in related_by_id}
+
     def search_concepts(self, query_text: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Recherche des concepts par texte.
@@ -2,10 +2,81 @@ from typing import Dict, List, Any, Optional, Union, Tuple, Set
 import logging
 import re
 import json
+import math
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import Enum
+import numpy as np
 from .knowledge_graph import KnowledgeGraph
 from .vector_store import VectorStore
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from Levenshtein import distance as _levenshtein_distance
+except ImportError:
+    _levenshtein_distance = None
+
+
+if njit is not None:
+
+    # Signature explicite: compilation immédiate, sans inférence de types,
+    # et persistée dans __pycache__ grâce à cache=True
+    @njit("float32(float32[::1], float32[::1])", cache=True, fastmath=True)
+    def _cosine_similarity(a, b):
+        """Similarité cosinus entre deux vecteurs float32 (noyau compilé)."""
+        dot = 0.0
+        norm_a = 0.0
+        norm_b = 0.0
+        for i in range(a.size):
+            dot += a[i] * b[i]
+            norm_a += a[i] * a[i]
+            norm_b += b[i] * b[i]
+        return dot / (math.sqrt(norm_a) * math.sqrt(norm_b) + 1e-12)
+
+    @njit("int32(uint32[::1], uint32[::1])", cache=True)
+    def _levenshtein_kernel(a, b):
+        """Distance de Levenshtein entre deux séquences de points de code."""
+        m = b.size
+        previous = np.arange(m + 1).astype(np.int32)
+        current = np.empty(m + 1, dtype=np.int32)
+        for i in range(1, a.size + 1):
+            current[0] = i
+            for j in range(1, m + 1):
+                cost = 0 if a[i - 1] == b[j - 1] else 1
+                current[j] = min(
+                    previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost
+                )
+            previous, current = current, previous
+        return previous[m]
+
+    def _code_points(text: str) -> np.ndarray:
+        """Convertit une chaîne en tableau de points de code (UTF-32)."""
+        return np.frombuffer(bytearray(text.encode("utf-32-le")), dtype=np.uint32)
+
+    if _levenshtein_distance is None:
+
+        def _levenshtein_distance(str1: str, str2: str) -> int:
+            """Distance de Levenshtein via le noyau compilé."""
+            return int(_levenshtein_kernel(_code_points(str1), _code_points(str2)))
+
+else:
+
+    def _cosine_similarity(a, b):
+        """Similarité cosinus entre deux vecteurs float32."""
+        return float(
+            np.dot(a, b) / (math.sqrt(np.dot(a, a)) * math.sqrt(np.dot(b, b)) + 1e-12)
+        )
+
 
 class ValidationSeverity(str, Enum):
     """Niveaux de sévérité des problèmes de validation"""
@@ -32,18 +103,96 @@ class KnowledgeValidation:
     Permet de détecter et corriger les incohérences dans le graphe de connaissances.
     """
 
-    def __init__(self, knowledge_graph: KnowledgeGraph, vector_store: VectorStore):
+    # Nombre maximum de concepts examinés par règle
+    CONCEPT_SCAN_LIMIT = 1000
+
+    # Parcours des concepts partagé par les règles de complétude, des
+    # concepts orphelins et des doublons, borné côté base par $limit; le
+    # degré permet de filtrer les orphelins sans seconde requête
+    CONCEPT_SCAN_QUERY = """
+        MATCH (c:Concept)
+        RETURN c, size([(c)--() | 1]) AS degree
+        LIMIT $limit
+        """
+
+    # Règles qui examinent les concepts du parcours partagé
+    CONCEPT_SCAN_RULES = (
+        ValidationRule.CONCEPT_COMPLETENESS.value,
+        ValidationRule.ORPHANED_CONCEPTS.value,
+        ValidationRule.DUPLICATE_CONCEPTS.value,
+    )
+
+    # Chargement d'une liste de concepts avec leurs relations, pour les règles
+    # évaluables concept par concept (validate_concepts)
+    CONCEPTS_BY_ID_QUERY = """
+        UNWIND $concept_ids AS concept_id
+        MATCH (c:Concept {id: concept_id})
+        RETURN c,
+               size([(c)--() | 1]) AS degree,
+               size([(c)--(:Concept) | 1]) AS concept_degree
+        """
+
+    # Préfixe des projections GDS, suffixé d'un identifiant unique par appel
+    # pour que des validations concurrentes ne se partagent pas un graphe
+    HIERARCHY_GRAPH_PREFIX = "hier-subgraph"
+
+    # Requêtes de détection des boucles: texte statique et types de relations
+    # passés en paramètre, pour que Neo4j réutilise son plan en cache
+    HIERARCHY_EDGES_QUERY = """
+        MATCH (a:Concept)-[r]->(b:Concept)
+        WHERE type(r) IN $types
+        RETURN a.id as source_id, a.name as source_name,
+               b.id as target_id, b.name as target_name
+        """
+    GDS_PROJECT_QUERY = """
+        CALL gds.graph.project.cypher(
+            $graph_name,
+            'MATCH (c:Concept) RETURN id(c) AS id',
+            'MATCH (a)-[r]->(b) WHERE type(r) IN $types RETURN id(a) AS source, id(b) AS target',
+            {parameters: {types: $types}}
+        )
+        YIELD graphName
+        RETURN graphName
+        """
+    GDS_SCC_QUERY = """
+        CALL gds.scc.stream($graph_name)
+        YIELD componentId, nodeId
+        RETURN componentId,
+               gds.util.asNode(nodeId).id as concept_id,
+               gds.util.asNode(nodeId).name as concept_name
+        """
+    GDS_DROP_QUERY = (
+        "CALL gds.graph.drop($graph_name, false) YIELD graphName RETURN graphName"
+    )
+
+    def __init__(
+        self,
+        knowledge_graph: KnowledgeGraph,
+        vector_store: VectorStore,
+        *,
+        embedding_dtype: Any = np.float16,
+    ):
         """
         Initialise le service de validation de connaissances.
 
         Args:
             knowledge_graph (KnowledgeGraph): Instance du graphe de connaissances
             vector_store (VectorStore): Instance du stockage vectoriel
+            embedding_dtype (Any, optional): Type de stockage des embeddings en cache.
+                Par défaut à np.float16 (les calculs se font en float32).
         """
         self.kg = knowledge_graph
         self.vs = vector_store
+        self.embedding_dtype = np.dtype(embedding_dtype)
         self.logger = logging.getLogger(__name__)
         self.rules = self._initialize_validation_rules()
+        self._embedding_cache: Dict[str, np.ndarray] = {}
+        self._centroids: Dict[str, np.ndarray] = {}
+        self._gds_available: Optional[bool] = None
+        # Concepts (avec leur degré) chargés une seule fois pendant
+        # validate_knowledge_base
+        self._concept_cache: Optional[List[Tuple[Dict[str, Any], int]]] = None
+        self._cache_lock = threading.Lock()
 
     def _initialize_validation_rules(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -88,6 +237,51 @@ class KnowledgeValidation:
             },
         }
 
+    def clear_caches(self) -> None:
+        """Vide les caches utilisés pendant une passe de validation."""
+        with self._cache_lock:
+            self._embedding_cache.clear()
+        self._concept_cache = None
+
+    def _scan_concepts(self) -> List[Tuple[Dict[str, Any], int]]:
+        """
+        Charge au plus CONCEPT_SCAN_LIMIT concepts avec leur nombre de relations.
+
+        Returns:
+            List[Tuple[Dict[str, Any], int]]: Concepts et leur degré
+        """
+        with self.kg.driver.session(database=self.kg.database) as session:
+            result = session.run(self.CONCEPT_SCAN_QUERY, limit=self.CONCEPT_SCAN_LIMIT)
+            return [(dict(record["c"]), record["degree"]) for record in result]
+
+    def _fetch_concepts(self, selection: str = "all") -> List[Dict[str, Any]]:
+        """
+        Récupère les concepts du parcours partagé. Pendant
+        `validate_knowledge_base`, le parcours n'est exécuté qu'une fois pour
+        toutes les règles.
+
+        Args:
+            selection (str, optional): "all", "orphaned" (sans aucune relation)
+                ou "typed" (typés, hors domaines). Par défaut à "all".
+
+        Returns:
+            List[Dict[str, Any]]: Concepts sélectionnés
+        """
+        scanned = self._concept_cache
+        if scanned is None:
+            scanned = self._scan_concepts()
+
+        if selection == "orphaned":
+            return [concept for concept, degree in scanned if not degree]
+        if selection == "typed":
+            # Même sémantique que `NOT c.type = 'domain'` (type absent exclu)
+            return [
+                concept
+                for concept, _ in scanned
+                if concept.get("type") is not None and concept["type"] != "domain"
+            ]
+        return [concept for concept, _ in scanned]
+
     def validate_knowledge_base(self) -> Dict[str, Any]:
         """
         Exécute toutes les règles de validation activées sur la base de connaissances.
@@ -95,51 +289,200 @@ class KnowledgeValidation:
         Returns:
             Dict[str, Any]: Résumé des validations et problèmes détectés
         """
+        self.clear_caches()
+
         results = {
             "summary": {"total_issues": 0, "errors": 0, "warnings": 0, "info": 0},
             "issues": [],
         }
 
-        # Exécuter chaque règle de validation activée
+        dispatch = {
+            ValidationRule.CONCEPT_COMPLETENESS.value: self.validate_concept_completeness,
+            ValidationRule.RELATION_CONSISTENCY.value: self.validate_relation_consistency,
+            ValidationRule.ORPHANED_CONCEPTS.value: self.validate_orphaned_concepts,
+            ValidationRule.DUPLICATE_CONCEPTS.value: self.validate_duplicate_concepts,
+            ValidationRule.CIRCULAR_REFERENCES.value: self.validate_circular_references,
+            ValidationRule.SEMANTIC_CONSISTENCY.value: self.validate_semantic_consistency,
+        }
+
+        enabled_rules = []
         for rule_id, rule_config in self.rules.items():
             if not rule_config.get("enabled", False):
                 continue
-
-            self.logger.info(f"Exécution de la validation: {rule_id}")
-
-            if rule_id == ValidationRule.CONCEPT_COMPLETENESS.value:
-                issues = self.validate_concept_completeness()
-            elif rule_id == ValidationRule.RELATION_CONSISTENCY.value:
-                issues = self.validate_relation_consistency()
-            elif rule_id == ValidationRule.ORPHANED_CONCEPTS.value:
-                issues = self.validate_orphaned_concepts()
-            elif rule_id == ValidationRule.DUPLICATE_CONCEPTS.value:
-                issues = self.validate_duplicate_concepts()
-            elif rule_id == ValidationRule.CIRCULAR_REFERENCES.value:
-                issues = self.validate_circular_references()
-            elif rule_id == ValidationRule.SEMANTIC_CONSISTENCY.value:
-                issues = self.validate_semantic_consistency()
-            else:
+            if rule_id not in dispatch:
                 self.logger.warning(f"Règle de validation inconnue: {rule_id}")
                 continue
+            enabled_rules.append(rule_id)
 
-            # Mettre à jour les statistiques
-            for issue in issues:
-                severity = issue.get("severity", ValidationSeverity.INFO.value)
-                results["summary"]["total_issues"] += 1
+        if not enabled_rules:
+            return results
 
-                if severity == ValidationSeverity.ERROR.value:
-                    results["summary"]["errors"] += 1
-                elif severity == ValidationSeverity.WARNING.value:
-                    results["summary"]["warnings"] += 1
-                else:
-                    results["summary"]["info"] += 1
+        # Un seul parcours des concepts, partagé par les règles qui les
+        # examinent (chargé avant de lancer les règles en parallèle)
+        if any(rule_id in self.CONCEPT_SCAN_RULES for rule_id in enabled_rules):
+            try:
+                self._concept_cache = self._scan_concepts()
+            except Exception as e:
+                # Chaque règle retentera le chargement et signalera l'erreur
+                self.logger.error(f"Erreur lors du chargement des concepts: {e}")
+
+        # Les règles sont indépendantes et dominées par les allers-retours
+        # Neo4j/Weaviate: on les exécute en parallèle. Chaque règle ouvre sa
+        # propre session Neo4j, le driver étant partagé entre threads.
+        issues_by_rule = {}
+        with ThreadPoolExecutor(max_workers=len(enabled_rules)) as executor:
+            futures = {}
+            for rule_id in enabled_rules:
+                self.logger.info(f"Exécution de la validation: {rule_id}")
+                futures[executor.submit(dispatch[rule_id])] = rule_id
+
+            for future in as_completed(futures):
+                rule_id = futures[future]
+                try:
+                    issues_by_rule[rule_id] = future.result()
+                except Exception as e:
+                    self.logger.error(
+                        f"Erreur lors de l'exécution de la validation {rule_id}: {e}"
+                    )
+                    issues_by_rule[rule_id] = []
+
+        self._concept_cache = None
+
+        # Conserver l'ordre des règles pour un rapport déterministe
+        for rule_id in enabled_rules:
+            self._add_issues(results, issues_by_rule[rule_id])
+
+        return results
+
+    def validate_concepts(self, concept_ids: List[str]) -> Dict[str, Any]:
+        """
+        Exécute sur quelques concepts les règles évaluables concept par
+        concept (complétude, concepts orphelins, présence dans le stockage
+        vectoriel des concepts reliés), sans parcourir toute la base.
+
+        Args:
+            concept_ids (List[str]): IDs des concepts à valider
+
+        Returns:
+            Dict[str, Any]: Résumé des validations et problèmes détectés, au même
+            format que validate_knowledge_base
+        """
+        results = {
+            "summary": {"total_issues": 0, "errors": 0, "warnings": 0, "info": 0},
+            "issues": [],
+        }
+        if not concept_ids:
+            return results
+
+        try:
+            with self.kg.driver.session(database=self.kg.database) as session:
+                records = [
+                    (dict(record["c"]), record["degree"], record["concept_degree"])
+                    for record in session.run(
+                        self.CONCEPTS_BY_ID_QUERY, concept_ids=list(concept_ids)
+                    )
+                ]
+        except Exception as e:
+            self.logger.error(f"Erreur lors du chargement des concepts à valider: {e}")
+            return results
+
+        completeness = self.rules[ValidationRule.CONCEPT_COMPLETENESS.value]
+        orphaned = self.rules[ValidationRule.ORPHANED_CONCEPTS.value]
+        consistency = self.rules[ValidationRule.RELATION_CONSISTENCY.value]
+
+        # Concepts reliés à prévérifier en une seule requête dans Weaviate
+        vector_concepts = {}
+        if consistency.get("enabled", False):
+            related_ids = [
+                concept.get("id")
+                for concept, _, concept_degree in records
+                if concept_degree
+            ]
+            try:
+                vector_concepts = self.vs.get_concepts_bulk(related_ids)
+            except Exception as e:
+                self.logger.error(
+                    f"Erreur lors de la validation de cohérence des relations: {e}"
+                )
+                vector_concepts = None
+
+        issues = []
+        for concept, degree, concept_degree in records:
+            concept_id = concept.get("id")
+            concept_name = concept.get("name", "")
+
+            if completeness.get("enabled", False):
+                for field in completeness.get("required_fields", []):
+                    if not concept.get(field):
+                        issues.append(
+                            {
+                                "rule": ValidationRule.CONCEPT_COMPLETENESS.value,
+                                "severity": completeness["severity"],
+                                "concept_id": concept_id,
+                                "description": f"Champ obligatoire manquant: '{field}'",
+                                "fix_suggestion": f"Ajouter le champ '{field}' au concept",
+                            }
+                        )
 
-            # Ajouter les problèmes détectés
-            results["issues"].extend(issues)
+            if (
+                orphaned.get("enabled", False)
+                and not degree
+                and concept.get("type") != "domain"
+            ):
+                issues.append(
+                    {
+                        "rule": ValidationRule.ORPHANED_CONCEPTS.value,
+                        "severity": orphaned["severity"],
+                        "concept_id": concept_id,
+                        "concept_name": concept_name,
+                        "description": f"Concept orphelin sans aucune relation: '{concept_name}'",
+                        "fix_suggestion": "Ajouter des relations pertinentes ou supprimer le concept s'il n'est pas nécessaire",
+                    }
+                )
+
+            if (
+                vector_concepts is not None
+                and concept_degree
+                and concept_id not in vector_concepts
+                and consistency.get("enabled", False)
+            ):
+                # Corrigeable par fix_issues (synchronisation vectorielle)
+                issues.append(
+                    {
+                        "rule": ValidationRule.RELATION_CONSISTENCY.value,
+                        "severity": consistency["severity"],
+                        "concept_id": concept_id,
+                        "description": "Concept référencé dans une relation mais absent du stockage vectoriel",
+                        "fix_suggestion": "Synchroniser le stockage vectoriel avec le graphe de connaissances",
+                        "auto_fixable": True,
+                    }
+                )
 
+        self._add_issues(results, issues)
         return results
 
+    @staticmethod
+    def _add_issues(results: Dict[str, Any], issues: List[Dict[str, Any]]) -> None:
+        """
+        Ajoute des problèmes détectés à un résumé de validation.
+
+        Args:
+            results (Dict[str, Any]): Résumé à compléter
+            issues (List[Dict[str, Any]]): Problèmes détectés
+        """
+        for issue in issues:
+            severity = issue.get("severity", ValidationSeverity.INFO.value)
+            results["summary"]["total_issues"] += 1
+
+            if severity == ValidationSeverity.ERROR.value:
+                results["summary"]["errors"] += 1
+            elif severity == ValidationSeverity.WARNING.value:
+                results["summary"]["warnings"] += 1
+            else:
+                results["summary"]["info"] += 1
+
+        results["issues"].extend(issues)
+
     def validate_concept_completeness(self) -> List[Dict[str, Any]]:
         """
         Vérifie que les concepts ont tous les attributs requis.
@@ -151,32 +494,24 @@ class KnowledgeValidation:
         rule_config = self.rules[ValidationRule.CONCEPT_COMPLETENESS.value]
         required_fields = rule_config.get("required_fields", [])
 
-        query = """
-        MATCH (c:Concept)
-        RETURN c
-        LIMIT 1000
-        """
-
         try:
-            with self.kg.driver.session(database=self.kg.database) as session:
-                result = session.run(query)
+            concepts = self._fetch_concepts()
 
-                for record in result:
-                    concept = dict(record["c"])
-                    concept_id = concept.get("id")
+            for concept in concepts:
+                concept_id = concept.get("id")
 
-                    # Vérifier les champs obligatoires
-                    for field in required_fields:
-                        if field not in concept or not concept[field]:
-                            issues.append(
-                                {
-                                    "rule": ValidationRule.CONCEPT_COMPLETENESS.value,
-                                    "severity": rule_config["severity"],
-                                    "concept_id": concept_id,
-                                    "description": f"Champ obligatoire manquant: '{field}'",
-                                    "fix_suggestion": f"Ajouter le champ '{field}' au concept",
-                                }
-                            )
+                # Vérifier les champs obligatoires
+                for field in required_fields:
+                    if field not in concept or not concept[field]:
+                        issues.append(
+                            {
+                                "rule": ValidationRule.CONCEPT_COMPLETENESS.value,
+                                "severity": rule_config["severity"],
+                                "concept_id": concept_id,
+                                "description": f"Champ obligatoire manquant: '{field}'",
+                                "fix_suggestion": f"Ajouter le champ '{field}' au concept",
+                            }
+                        )
         except Exception as e:
             self.logger.error(
                 f"Erreur lors de la validation de complétude des concepts: {e}"
@@ -246,36 +581,27 @@ class KnowledgeValidation:
         issues = []
         rule_config = self.rules[ValidationRule.ORPHANED_CONCEPTS.value]
 
-        query = """
-        MATCH (c:Concept)
-        WHERE NOT (c)--()
-        RETURN c
-        LIMIT 1000
-        """
-
         try:
-            with self.kg.driver.session(database=self.kg.database) as session:
-                result = session.run(query)
-
-                for record in result:
-                    concept = dict(record["c"])
-                    concept_id = concept.get("id")
-                    concept_name = concept.get("name", "")
-
-                    # Ignorer les concepts de type domaine
-                    if concept.get("type") == "domain":
-                        continue
-
-                    issues.append(
-                        {
-                            "rule": ValidationRule.ORPHANED_CONCEPTS.value,
-                            "severity": rule_config["severity"],
-                            "concept_id": concept_id,
-                            "concept_name": concept_name,
-                            "description": f"Concept orphelin sans aucune relation: '{concept_name}'",
-                            "fix_suggestion": "Ajouter des relations pertinentes ou supprimer le concept s'il n'est pas nécessaire",
-                        }
-                    )
+            orphans = self._fetch_concepts("orphaned")
+
+            for concept in orphans:
+                concept_id = concept.get("id")
+                concept_name = concept.get("name", "")
+
+                # Ignorer les concepts de type domaine
+                if concept.get("type") == "domain":
+                    continue
+
+                issues.append(
+                    {
+                        "rule": ValidationRule.ORPHANED_CONCEPTS.value,
+                        "severity": rule_config["severity"],
+                        "concept_id": concept_id,
+                        "concept_name": concept_name,
+                        "description": f"Concept orphelin sans aucune relation: '{concept_name}'",
+                        "fix_suggestion": "Ajouter des relations pertinentes ou supprimer le concept s'il n'est pas nécessaire",
+                    }
+                )
         except Exception as e:
             self.logger.error(
                 f"Erreur lors de la validation des concepts orphelins: {e}"
@@ -294,55 +620,49 @@ class KnowledgeValidation:
         rule_config = self.rules[ValidationRule.DUPLICATE_CONCEPTS.value]
         threshold = rule_config.get("similarity_threshold", 0.92)
 
-        # Récupérer tous les concepts
-        query = """
-        MATCH (c:Concept)
-        WHERE NOT c.type = 'domain'
-        RETURN c
-        LIMIT 1000
-        """
-
         try:
-            with self.kg.driver.session(database=self.kg.database) as session:
-                result = session.run(query)
-                concepts = []
-
-                for record in result:
-                    concept = dict(record["c"])
-                    concepts.append(concept)
-
-                # Pour chaque paire de concepts, vérifier la similarité textuelle et vectorielle
-                pairs_checked = set()
-
-                for i, concept1 in enumerate(concepts):
-                    concept1_id = concept1.get("id")
-                    concept1_name = concept1.get("name", "")
-                    concept1_desc = concept1.get("description", "")
-
-                    # Générer l'embedding pour le concept1
-                    vector1 = self._get_concept_embedding(
-                        concept1_id, concept1_name, concept1_desc
-                    )
-                    if not vector1:
-                        continue
-
-                    for j in range(i + 1, len(concepts)):
-                        concept2 = concepts[j]
-                        concept2_id = concept2.get("id")
-
-                        # Éviter les paires déjà vérifiées
-                        pair_key = tuple(sorted([concept1_id, concept2_id]))
-                        if pair_key in pairs_checked:
-                            continue
-
-                        pairs_checked.add(pair_key)
-
-                        concept2_name = concept2.get("name", "")
-                        concept2_desc = concept2.get("description", "")
-
+            # Récupérer les concepts typés, hors domaines
+            concepts = self._fetch_concepts("typed")
+
+            # Noms normalisés une seule fois (et leurs longueurs, pour
+            # élaguer les paires sans calculer la distance de Levenshtein)
+            normalized_names = [
+                (concept.get("name") or "").lower().strip() for concept in concepts
+            ]
+            name_lengths = [len(name) for name in normalized_names]
+
+            # Pour chaque paire de concepts, vérifier la similarité textuelle et vectorielle
+            # (j > i: chaque paire n'est visitée qu'une seule fois)
+            for i, concept1 in enumerate(concepts):
+                concept1_id = concept1.get("id")
+                concept1_name = concept1.get("name", "")
+                concept1_desc = concept1.get("description", "")
+
+                # Générer l'embedding pour le concept1
+                vector1 = self._get_concept_embedding(
+                    concept1_id, concept1_name, concept1_desc
+                )
+                if vector1 is None:
+                    continue
+
+                for j in range(i + 1, len(concepts)):
+                    concept2 = concepts[j]
+                    concept2_id = concept2.get("id")
+                    concept2_name = concept2.get("name", "")
+                    concept2_desc = concept2.get("description", "")
+
+                    # La similarité de Levenshtein normalisée est bornée par
+                    # 1 - |Δlongueur| / longueur max: inutile de la calculer
+                    # si cette borne est déjà sous le seuil. La borne est
+                    # calculée comme la similarité, pour qu'une paire exactement
+                    # au seuil ne soit pas écartée par un arrondi
+                    len1 = name_lengths[i]
+                    len2 = name_lengths[j]
+                    max_len = max(len1, len2)
+                    if not max_len or 1.0 - abs(len1 - len2) / max_len >= threshold:
                         # Vérifier la similarité des noms si disponible
-                        name_similarity = self._string_similarity(
-                            concept1_name, concept2_name
+                        name_similarity = self._fast_string_similarity(
+                            normalized_names[i], normalized_names[j], len1, len2
                         )
                         if name_similarity >= threshold:
                             issues.append(
@@ -357,33 +677,28 @@ class KnowledgeValidation:
                             )
                             continue
 
-                        # Générer l'embedding pour le concept2
-                        vector2 = self._get_concept_embedding(
-                            concept2_id, concept2_name, concept2_desc
-                        )
-                        if not vector2:
-                            continue
-
-                        # Calculer la similarité vectorielle
-                        from sklearn.metrics.pairwise import cosine_similarity
-                        import numpy as np
+                    # Générer l'embedding pour le concept2
+                    vector2 = self._get_concept_embedding(
+                        concept2_id, concept2_name, concept2_desc
+                    )
+                    if vector2 is None:
+                        continue
 
-                        vec1 = np.array(vector1).reshape(1, -1)
-                        vec2 = np.array(vector2).reshape(1, -1)
-                        similarity = float(cosine_similarity(vec1, vec2)[0][0])
+                    # Calculer la similarité vectorielle
+                    similarity = float(_cosine_similarity(vector1, vector2))
 
-                        if similarity >= threshold:
-                            issues.append(
-                                {
-                                    "rule": ValidationRule.DUPLICATE_CONCEPTS.value,
-                                    "severity": rule_config["severity"],
-                                    "concept_id": concept1_id,
-                                    "duplicate_id": concept2_id,
-                                    "similarity": similarity,
-                                    "description": f"Concepts sémantiquement très similaires ({similarity:.3f})",
-                                    "fix_suggestion": f"Vérifier si les concepts {concept1_id} et {concept2_id} doivent être fusionnés",
-                                }
-                            )
+                    if similarity >= threshold:
+                        issues.append(
+                            {
+                                "rule": ValidationRule.DUPLICATE_CONCEPTS.value,
+                                "severity": rule_config["severity"],
+                                "concept_id": concept1_id,
+                                "duplicate_id": concept2_id,
+                                "similarity": similarity,
+                                "description": f"Concepts sémantiquement très similaires ({similarity:.3f})",
+                                "fix_suggestion": f"Vérifier si les concepts {concept1_id} et {concept2_id} doivent être fusionnés",
+                            }
+                        )
         except Exception as e:
             self.logger.error(
                 f"Erreur lors de la validation des concepts dupliqués: {e}"
@@ -404,41 +719,178 @@ class KnowledgeValidation:
             "hierarchy_relations", ["PART_OF", "TYPE_OF"]
         )
 
-        # Construire la clause Cypher pour les types de relations hiérarchiques
-        relation_types = "|".join([f"`{r}`" for r in hierarchy_relations])
-
-        query = f"""
-        MATCH path = (c:Concept)-[:{relation_types}*2..10]->(c)
-        RETURN c.id as concept_id, c.name as concept_name, [rel in relationships(path) | type(rel)] as relation_path
-        LIMIT 100
-        """
-
+        # Une composante fortement connexe de plus d'un noeud est une boucle:
+        # on énumère toutes les boucles en un seul passage linéaire (Tarjan)
+        # au lieu d'énumérer les chemins de longueur variable.
         try:
-            with self.kg.driver.session(database=self.kg.database) as session:
-                result = session.run(query)
-
-                for record in result:
-                    concept_id = record["concept_id"]
-                    concept_name = record["concept_name"]
-                    relation_path = record["relation_path"]
-
-                    issues.append(
-                        {
-                            "rule": ValidationRule.CIRCULAR_REFERENCES.value,
-                            "severity": rule_config["severity"],
-                            "concept_id": concept_id,
-                            "concept_name": concept_name,
-                            "description": f"Référence circulaire détectée pour '{concept_name}' avec les relations: {relation_path}",
-                            "fix_suggestion": "Identifier et supprimer au moins une des relations dans la boucle",
-                        }
-                    )
+            components = self._find_hierarchy_cycles(hierarchy_relations)
         except Exception as e:
             self.logger.error(
                 f"Erreur lors de la validation des références circulaires: {e}"
             )
+            return issues
+
+        for members in components:
+            concept_id, concept_name = members[0]
+            member_names = [name or member_id for member_id, name in members]
+
+            issues.append(
+                {
+                    "rule": ValidationRule.CIRCULAR_REFERENCES.value,
+                    "severity": rule_config["severity"],
+                    "concept_id": concept_id,
+                    "concept_name": concept_name,
+                    "cycle_members": [member_id for member_id, _ in members],
+                    "description": f"Référence circulaire détectée entre {len(members)} concepts: {member_names}",
+                    "fix_suggestion": "Identifier et supprimer au moins une des relations dans la boucle",
+                }
+            )
 
         return issues
 
+    def _find_hierarchy_cycles(
+        self, hierarchy_relations: List[str]
+    ) -> List[List[Tuple[str, str]]]:
+        """
+        Identifie les composantes fortement connexes (plus d'un concept) du
+        sous-graphe hiérarchique. Utilise Neo4j GDS si le plugin est installé,
+        sinon applique l'algorithme de Tarjan sur la liste des arêtes.
+
+        Args:
+            hierarchy_relations (List[str]): Types de relations hiérarchiques
+
+        Returns:
+            List[List[Tuple[str, str]]]: Composantes sous forme de (id, nom)
+        """
+        # Ne sonder le plugin GDS qu'une seule fois
+        if self._gds_available is not False:
+            try:
+                components = self._find_hierarchy_cycles_gds(hierarchy_relations)
+                self._gds_available = True
+                return components
+            except Exception as e:
+                if self._gds_available:
+                    raise
+                self._gds_available = False
+                self.logger.info(f"GDS indisponible, calcul local des SCC: {e}")
+
+        names = {}
+        graph = {}
+        with self.kg.driver.session(database=self.kg.database) as session:
+            result = session.run(self.HIERARCHY_EDGES_QUERY, types=hierarchy_relations)
+
+            for record in result:
+                source_id = record["source_id"]
+                target_id = record["target_id"]
+                names[source_id] = record["source_name"]
+                names[target_id] = record["target_name"]
+                graph.setdefault(source_id, []).append(target_id)
+                graph.setdefault(target_id, [])
+
+        return [
+            [(node, names.get(node)) for node in component]
+            for component in self._strongly_connected_components(graph)
+            if len(component) > 1
+        ]
+
+    def _find_hierarchy_cycles_gds(
+        self, hierarchy_relations: List[str]
+    ) -> List[List[Tuple[str, str]]]:
+        """
+        Calcule les composantes fortement connexes via Neo4j Graph Data Science.
+
+        Args:
+            hierarchy_relations (List[str]): Types de relations hiérarchiques
+
+        Returns:
+            List[List[Tuple[str, str]]]: Composantes sous forme de (id, nom)
+        """
+        graph_name = f"{self.HIERARCHY_GRAPH_PREFIX}-{uuid.uuid4().hex}"
+
+        components = {}
+        with self.kg.driver.session(database=self.kg.database) as session:
+            try:
+                session.run(
+                    self.GDS_PROJECT_QUERY,
+                    graph_name=graph_name,
+                    types=hierarchy_relations,
+                ).consume()
+
+                result = session.run(self.GDS_SCC_QUERY, graph_name=graph_name)
+                for record in result:
+                    components.setdefault(record["componentId"], []).append(
+                        (record["concept_id"], record["concept_name"])
+                    )
+            finally:
+                session.run(self.GDS_DROP_QUERY, graph_name=graph_name).consume()
+
+        return [members for members in components.values() if len(members) > 1]
+
+    @staticmethod
+    def _strongly_connected_components(graph: Dict[str, List[str]]) -> List[List[str]]:
+        """
+        Algorithme de Tarjan (version itérative) pour les composantes
+        fortement connexes, en O(V+E).
+
+        Args:
+            graph (Dict[str, List[str]]): Liste d'adjacence
+
+        Returns:
+            List[List[str]]: Composantes fortement connexes
+        """
+        index = {}
+        lowlink = {}
+        on_stack = set()
+        stack = []
+        components = []
+        counter = 0
+
+        for root in graph:
+            if root in index:
+                continue
+
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(graph[root]))]
+
+            while work:
+                node, successors = work[-1]
+                advanced = False
+
+                for successor in successors:
+                    if successor not in index:
+                        index[successor] = lowlink[successor] = counter
+                        counter += 1
+                        stack.append(successor)
+                        on_stack.add(successor)
+                        work.append((successor, iter(graph[successor])))
+                        advanced = True
+                        break
+                    if successor in on_stack:
+                        lowlink[node] = min(lowlink[node], index[successor])
+
+                if advanced:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+        return components
+
     def validate_semantic_consistency(self) -> List[Dict[str, Any]]:
         """
         Vérifie la cohérence sémantique des relations.
@@ -459,44 +911,113 @@ class KnowledgeValidation:
 
         try:
             with self.kg.driver.session(database=self.kg.database) as session:
-                result = session.run(query)
-
-                for record in result:
-                    source_id = record["source_id"]
-                    source_name = record["source_name"]
-                    target_id = record["target_id"]
-                    target_name = record["target_name"]
-                    relation_type = record["relation_type"]
-
-                    # Pour chaque relation, vérifier la cohérence sémantique
-                    # On utilise un système simple basé sur les embeddings pour estimer
-                    # si la relation est sémantiquement cohérente
-                    consistency_score = self._check_relation_consistency(
-                        source_id, source_name, target_id, target_name, relation_type
-                    )
-
-                    if consistency_score < 0.5:  # Seuil arbitraire de cohérence
-                        issues.append(
-                            {
-                                "rule": ValidationRule.SEMANTIC_CONSISTENCY.value,
-                                "severity": rule_config["severity"],
-                                "source_id": source_id,
-                                "source_name": source_name,
-                                "target_id": target_id,
-                                "target_name": target_name,
-                                "relation_type": relation_type,
-                                "consistency_score": consistency_score,
-                                "description": f"Relation potentiellement incohérente: '{source_name}' -{relation_type}-> '{target_name}' (score: {consistency_score:.2f})",
-                                "fix_suggestion": "Vérifier si cette relation est appropriée ou si un autre type de relation serait plus adapté",
-                            }
-                        )
+                records = [dict(record) for record in session.run(query)]
         except Exception as e:
             self.logger.error(
                 f"Erreur lors de la validation de la cohérence sémantique: {e}"
             )
+            return issues
+
+        # Regrouper les relations par type avec leur vecteur (cible - source)
+        grouped = {}
+        for record in records:
+            source_embedding = self._get_concept_embedding(
+                record["source_id"], record["source_name"]
+            )
+            target_embedding = self._get_concept_embedding(
+                record["target_id"], record["target_name"]
+            )
+
+            # Pas assez d'information pour juger la relation
+            if source_embedding is None or target_embedding is None:
+                continue
+
+            relation_records, differences = grouped.setdefault(
+                record["relation_type"], ([], [])
+            )
+            relation_records.append(record)
+            differences.append(target_embedding - source_embedding)
+
+        # Une matrice (N, d) par type de relation, comparée en un seul produit
+        # matriciel au déplacement moyen observé pour ce type
+        matrices = {
+            relation_type: np.vstack(differences)
+            for relation_type, (_, differences) in grouped.items()
+        }
+        self._compute_relation_centroids(matrices)
+
+        for relation_type, (relation_records, _) in grouped.items():
+            centroid = self._centroids.get(relation_type)
+            if centroid is None:
+                continue
+
+            scores = self._normalize_rows(matrices[relation_type]) @ centroid
+
+            for record, consistency_score in zip(relation_records, scores):
+                consistency_score = float(consistency_score)
+                if consistency_score >= 0.5:  # Seuil arbitraire de cohérence
+                    continue
+
+                source_name = record["source_name"]
+                target_name = record["target_name"]
+                issues.append(
+                    {
+                        "rule": ValidationRule.SEMANTIC_CONSISTENCY.value,
+                        "severity": rule_config["severity"],
+                        "source_id": record["source_id"],
+                        "source_name": source_name,
+                        "target_id": record["target_id"],
+                        "target_name": target_name,
+                        "relation_type": relation_type,
+                        "consistency_score": consistency_score,
+                        "description": f"Relation potentiellement incohérente: '{source_name}' -{relation_type}-> '{target_name}' (score: {consistency_score:.2f})",
+                        "fix_suggestion": "Vérifier si cette relation est appropriée ou si un autre type de relation serait plus adapté",
+                    }
+                )
 
         return issues
 
+    def _compute_relation_centroids(
+        self, differences: Dict[str, np.ndarray]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calcule, pour chaque type de relation, le centroïde normalisé des
+        vecteurs (cible - source) observés.
+
+        Args:
+            differences (Dict[str, np.ndarray]): Matrices (N, d) par type de relation
+
+        Returns:
+            Dict[str, np.ndarray]: Centroïdes normalisés par type de relation
+        """
+        centroids = {}
+        for relation_type, matrix in differences.items():
+            centroid = matrix.mean(axis=0)
+            norm = np.linalg.norm(centroid)
+
+            # Déplacements qui s'annulent: aucune direction de référence
+            if norm < 1e-12:
+                continue
+
+            centroids[relation_type] = (centroid / norm).astype(np.float32)
+
+        self._centroids = centroids
+        return centroids
+
+    @staticmethod
+    def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+        """
+        Normalise chaque ligne d'une matrice (norme L2).
+
+        Args:
+            matrix (np.ndarray): Matrice à normaliser
+
+        Returns:
+            np.ndarray: Matrice dont les lignes sont de norme 1 (ou nulles)
+        """
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.maximum(norms, 1e-12)
+
     def fix_issues(
         self, issues: List[Dict[str, Any]], auto_fix: bool = False
     ) -> Dict[str, Any]:
@@ -512,6 +1033,19 @@ class KnowledgeValidation:
         """
         results = {"fixed": [], "manual_fix_required": [], "failed": []}
 
+        # Synchroniser en lot les concepts absents du stockage vectoriel; un
+        # échec ne doit pas empêcher les autres corrections
+        missing_concepts, synced = {}, False
+        sync_error = None
+        if auto_fix:
+            try:
+                missing_concepts, synced = self._sync_missing_vectors(issues)
+            except Exception as e:
+                self.logger.error(
+                    f"Erreur lors de la synchronisation du stockage vectoriel: {e}"
+                )
+                sync_error = str(e)
+
         for issue in issues:
             rule = issue.get("rule")
 
@@ -524,18 +1058,12 @@ class KnowledgeValidation:
                 elif rule == ValidationRule.RELATION_CONSISTENCY.value and auto_fix:
                     # Synchroniser le stockage vectoriel avec le graphe
                     concept_id = issue.get("concept_id")
-                    if concept_id:
-                        concept = self.kg.get_concept(concept_id)
+                    if sync_error is not None:
+                        results["failed"].append({**issue, "error": sync_error})
+                    elif concept_id:
+                        concept = missing_concepts.get(concept_id)
                         if concept:
-                            # Ajouter au stockage vectoriel
-                            success = self.vs.add_concept(
-                                concept_id=concept_id,
-                                name=concept.get("name", ""),
-                                description=concept.get("description", ""),
-                                category=concept.get("category", "general"),
-                            )
-
-                            if success:
+                            if synced:
                                 results["fixed"].append(
                                     {
                                         **issue,
@@ -608,6 +1136,48 @@ class KnowledgeValidation:
 
         return results
 
+    def _sync_missing_vectors(
+        self, issues: List[Dict[str, Any]]
+    ) -> Tuple[Dict[str, Dict[str, Any]], bool]:
+        """
+        Ajoute en un seul lot au stockage vectoriel les concepts signalés
+        par la règle de cohérence des relations.
+
+        Args:
+            issues (List[Dict[str, Any]]): Liste des problèmes à corriger
+
+        Returns:
+            Tuple[Dict[str, Dict[str, Any]], bool]: Concepts trouvés dans le graphe
+            (indexés par ID) et succès de l'import par lot
+        """
+        concept_ids = list(
+            dict.fromkeys(
+                issue["concept_id"]
+                for issue in issues
+                if issue.get("rule") == ValidationRule.RELATION_CONSISTENCY.value
+                and issue.get("concept_id")
+            )
+        )
+        if not concept_ids:
+            return {}, False
+
+        concepts = self.kg.get_concepts(concept_ids)
+        if not concepts:
+            return concepts, False
+
+        success = self.vs.add_concepts(
+            [
+                {
+                    "concept_id": concept_id,
+                    "name": concept.get("name", ""),
+                    "description": concept.get("description", ""),
+                    "category": concept.get("category", "general"),
+                }
+                for concept_id, concept in concepts.items()
+            ]
+        )
+        return concepts, success
+
     def export_validation_report(self, results: Dict[str, Any], filepath: str) -> bool:
         """
         Exporte les résultats de validation dans un fichier JSON.
@@ -620,8 +1190,18 @@ class KnowledgeValidation:
             bool: True si l'exportation a réussi
         """
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(results, f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                # Encodeur natif: nettement plus rapide pour les gros rapports
+                with open(filepath, "wb") as f:
+                    f.write(
+                        orjson.dumps(
+                            results,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                        )
+                    )
+            else:
+                with open(filepath, "w", encoding="utf-8") as f:
+                    json.dump(results, f, ensure_ascii=False, indent=2)
             return True
         except Exception as e:
             self.logger.error(f"Erreur lors de l'exportation du rapport: {e}")
@@ -648,33 +1228,49 @@ class KnowledgeValidation:
         str1 = str1.lower().strip()
         str2 = str2.lower().strip()
 
+        return self._fast_string_similarity(str1, str2, len(str1), len(str2))
+
+    @staticmethod
+    def _fast_string_similarity(str1: str, str2: str, len1: int, len2: int) -> float:
+        """
+        Similarité de Levenshtein normalisée entre deux chaînes déjà normalisées
+        (minuscules, sans espaces en bordure), dont les longueurs sont connues.
+
+        Args:
+            str1 (str): Première chaîne normalisée
+            str2 (str): Deuxième chaîne normalisée
+            len1 (int): Longueur de la première chaîne
+            len2 (int): Longueur de la deuxième chaîne
+
+        Returns:
+            float: Score de similarité entre 0 et 1
+        """
         if str1 == str2:
             return 1.0
+        if not len1 or not len2:
+            return 0.0
 
-        # Importer la fonction de distance de Levenshtein
-        try:
-            import Levenshtein
-
-            distance = Levenshtein.distance(str1, str2)
-            max_len = max(len(str1), len(str2))
-            return 1.0 - (distance / max_len)
-        except ImportError:
-            # Fallback simple si le module n'est pas disponible
-            # Compare les premiers caractères comme estimation grossière
-            min_len = min(len(str1), len(str2))
-            common_prefix_len = 0
-            for i in range(min_len):
-                if str1[i] == str2[i]:
-                    common_prefix_len += 1
-                else:
-                    break
-            return common_prefix_len / max(len(str1), len(str2))
+        max_len = len1 if len1 > len2 else len2
+
+        if _levenshtein_distance is not None:
+            return 1.0 - (_levenshtein_distance(str1, str2) / max_len)
+
+        # Fallback simple si aucune implémentation n'est disponible
+        # Compare les premiers caractères comme estimation grossière
+        common_prefix_len = 0
+        for char1, char2 in zip(str1, str2):
+            if char1 != char2:
+                break
+            common_prefix_len += 1
+        return common_prefix_len / max_len
 
     def _get_concept_embedding(
         self, concept_id: str, name: str = "", description: str = ""
-    ) -> Optional[List[float]]:
+    ) -> Optional[np.ndarray]:
         """
-        Récupère l'embedding d'un concept.
+        Récupère l'embedding d'un concept (mis en cache par ID de concept).
+        Le cache conserve les vecteurs en `embedding_dtype`; le vecteur
+        retourné est toujours en float32 pour les calculs.
 
         Args:
             concept_id (str): ID du concept
@@ -682,77 +1278,32 @@ class KnowledgeValidation:
             description (str, optional): Description du concept si disponible
 
         Returns:
-            Optional[List[float]]: Embedding du concept
+            Optional[np.ndarray]: Embedding du concept
         """
+        with self._cache_lock:
+            cached = self._embedding_cache.get(concept_id)
+        if cached is not None:
+            return cached.astype(np.float32, copy=False)
+
+        embedding = None
+
         # Essayer de récupérer depuis le stockage vectoriel
         concept = self.vs.get_concept(concept_id)
         if concept:
             text = f"{concept.get('name', '')}: {concept.get('description', '')}"
-            return self.vs.get_embedding(text)
-
+            embedding = self.vs.get_embedding(text)
         # Générer à partir des données fournies si disponibles
-        if name or description:
+        elif name or description:
             text = f"{name}: {description}"
-            return self.vs.get_embedding(text)
-
-        return None
-
-    def _check_relation_consistency(
-        self,
-        source_id: str,
-        source_name: str,
-        target_id: str,
-        target_name: str,
-        relation_type: str,
-    ) -> float:
-        """
-        Vérifie la cohérence sémantique d'une relation.
+            embedding = self.vs.get_embedding(text)
 
-        Args:
-            source_id (str): ID du concept source
-            source_name (str): Nom du concept source
-            target_id (str): ID du concept cible
-            target_name (str): Nom du concept cible
-            relation_type (str): Type de relation
+        if embedding is None:
+            return None
 
-        Returns:
-            float: Score de cohérence entre 0 et 1
-        """
-        # Modèle de vérification simple basé sur la similarité vectorielle
-        # et des heuristiques spécifiques au type de relation
-
-        # Obtenir les embeddings
-        source_embedding = self._get_concept_embedding(source_id, source_name)
-        target_embedding = self._get_concept_embedding(target_id, target_name)
-
-        if not source_embedding or not target_embedding:
-            return 0.5  # Valeur par défaut si pas assez d'information
-
-        # Calculer la similarité de base
-        from sklearn.metrics.pairwise import cosine_similarity
-        import numpy as np
-
-        vec1 = np.array(source_embedding).reshape(1, -1)
-        vec2 = np.array(target_embedding).reshape(1, -1)
-        similarity = float(cosine_similarity(vec1, vec2)[0][0])
-
-        # Ajuster selon le type de relation
-        if relation_type == "SIMILAR_TO":
-            # Pour "SIMILAR_TO", la similarité devrait être élevée
-            return similarity
-        elif relation_type in ("PART_OF", "TYPE_OF"):
-            # Pour les relations hiérarchiques, une certaine similarité est attendue
-            # mais pas trop élevée (sinon ils seraient plutôt "SIMILAR_TO")
-            if 0.3 <= similarity <= 0.8:
-                return 0.8  # Bonne cohérence
-            else:
-                return max(0.3, min(similarity, 0.6))  # Limiter entre 0.3 et 0.6
-        elif relation_type == "CAUSES":
-            # Pas d'heuristique spéciale, mais maintenir un seuil minimum
-            return max(0.4, similarity)
-        else:
-            # Pour les autres types, utiliser la similarité comme indicateur de base
-            return similarity
+        vector = embedding.astype(self.embedding_dtype, copy=False)
+        with self._cache_lock:
+            self._embedding_cache[concept_id] = vector
+        return vector.astype(np.float32, copy=False)
 
     def _merge_duplicate_concepts(self, primary_id: str, duplicate_id: str) -> bool:
         """
@@ -1,11 +1,50 @@
 from typing import Dict, List, Any, Optional, Union, Set, Tuple
 import logging
 import re
-from sklearn.metrics.pairwise import cosine_similarity
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from .knowledge_graph import KnowledgeGraph
 from .vector_store import VectorStore
 
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    hyperscan = None
+
+try:
+    from numba import njit, types as nb_types
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+
+    # Les embeddings mis en cache sont en lecture seule: la signature les
+    # accepte directement (les tableaux modifiables s'y convertissent)
+    _QUANTIZED_VECTOR = nb_types.Array(nb_types.int8, 1, "C", readonly=True)
+
+    @njit(nb_types.int32(_QUANTIZED_VECTOR, _QUANTIZED_VECTOR), cache=True)
+    def _int8_dot(a, b):
+        """Produit scalaire de deux vecteurs int8, accumulé en entiers (noyau compilé)."""
+        dot = 0
+        for i in range(a.size):
+            dot += np.int32(a[i]) * np.int32(b[i])
+        return dot
+
+else:
+
+    def _int8_dot(a, b):
+        """Produit scalaire de deux vecteurs int8, accumulé en entiers."""
+        return int(np.dot(a.astype(np.int32), b.astype(np.int32)))
+
+
+# Embedding quantifié en int8: valeurs entre -127 et 127 et échelle associée
+QuantizedEmbedding = Tuple[np.ndarray, float]
+
+# Drapeaux globaux en tête d'un motif, ex. "(?i)"
+_LEADING_FLAGS = re.compile(r"^\(\?([aiLmsux]+)\)")
+
 
 class RelationshipDiscovery:
     """
@@ -13,6 +52,27 @@ class RelationshipDiscovery:
     Utilise l'analyse vectorielle et textuelle pour suggérer des relations potentielles.
     """
 
+    # Nombre maximal d'embeddings conservés en cache (par ID de concept),
+    # quantifiés en int8
+    EMBEDDING_CACHE_SIZE = 16384
+
+    # Nombre d'IDs de concepts récupérés par requête au stockage vectoriel
+    CONCEPT_FETCH_BATCH_SIZE = 500
+
+    # Nombre maximal de concepts examinés par passe de découverte
+    CONCEPT_SCAN_LIMIT = 1000
+
+    # Nombre de threads pour les appels concurrents aux services (encodeur,
+    # Weaviate, Neo4j), qui sont limités par les entrées/sorties
+    DISCOVERY_WORKERS = 8
+
+    # Au-delà de ce nombre de concepts, la recherche exhaustive des paires
+    # similaires est déléguée à l'index vectoriel (HNSW) de Weaviate
+    EXACT_SEARCH_MAX_CONCEPTS = 5000
+
+    # Nombre maximal de voisins renvoyés par concept par l'index vectoriel
+    RANGE_SEARCH_LIMIT = 100
+
     def __init__(self, knowledge_graph: KnowledgeGraph, vector_store: VectorStore):
         """
         Initialise le service de découverte de relations.
@@ -25,6 +85,8 @@ class RelationshipDiscovery:
         self.vs = vector_store
         self.logger = logging.getLogger(__name__)
         self.relation_types = self._initialize_relation_types()
+        self._embedding_cache: "OrderedDict[str, QuantizedEmbedding]" = OrderedDict()
+        self._refresh_scanners()
 
     def _initialize_relation_types(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -82,6 +144,108 @@ class RelationshipDiscovery:
             },
         }
 
+    def _refresh_scanners(self) -> None:
+        """
+        Recompile les motifs de tous les types de relations et précalcule
+        leurs seuils. Appelé à l'initialisation et à chaque ajout de type.
+        """
+        self._thresholds = {
+            relation_type: relation_info.get("threshold", 0.7)
+            for relation_type, relation_info in self.relation_types.items()
+        }
+        self._relation_patterns = [
+            (relation_type, re.compile(pattern))
+            for relation_type, relation_info in self.relation_types.items()
+            for pattern in relation_info.get("patterns", [])
+        ]
+        self._scanner = self._build_scanner()
+
+    def _build_scanner(self) -> Optional[Any]:
+        """
+        Compile les motifs de tous les types de relations dans une seule base
+        Hyperscan, utilisée comme préfiltre: un parcours du texte indique les
+        motifs susceptibles de correspondre, seuls ceux-ci sont ensuite
+        évalués par `re`.
+
+        Returns:
+            Optional[Any]: Base compilée (identifiant de motif = indice dans
+            _relation_patterns), ou None si Hyperscan est indisponible
+        """
+        if hyperscan is None or not self._relation_patterns:
+            return None
+
+        expressions = []
+        flags = []
+        for _, regex in self._relation_patterns:
+            # Mode préfiltre: aucun faux négatif, même pour les constructions
+            # que Hyperscan ne prend pas en charge; une seule alerte par motif
+            pattern_flags = (
+                hyperscan.HS_FLAG_UTF8
+                | hyperscan.HS_FLAG_UCP
+                | hyperscan.HS_FLAG_PREFILTER
+                | hyperscan.HS_FLAG_SINGLEMATCH
+            )
+            pattern = regex.pattern
+            leading = _LEADING_FLAGS.match(pattern)
+            if leading:
+                if "i" in leading.group(1):
+                    pattern_flags |= hyperscan.HS_FLAG_CASELESS
+                pattern = pattern[leading.end() :]
+
+            expressions.append(pattern.encode("utf-8"))
+            flags.append(pattern_flags)
+
+        try:
+            database = hyperscan.Database()
+            database.compile(
+                expressions=expressions,
+                ids=list(range(len(expressions))),
+                elements=len(expressions),
+                flags=flags,
+            )
+        except hyperscan.error as e:
+            self.logger.warning(
+                f"Compilation Hyperscan impossible, repli sur les regex: {e}"
+            )
+            return None
+
+        return database
+
+    def _scan_relation_patterns(self, text: str) -> List[Tuple[str, int, int]]:
+        """
+        Recherche dans un texte les motifs de tous les types de relations.
+        Chaque motif est évalué indépendamment: les correspondances de motifs
+        différents peuvent se chevaucher.
+
+        Args:
+            text (str): Texte à analyser
+
+        Returns:
+            List[Tuple[str, int, int]]: Correspondances (type de relation,
+            début, fin), dans l'ordre des motifs
+        """
+        candidates = range(len(self._relation_patterns))
+
+        # Préfiltrer les motifs en un seul parcours Hyperscan
+        if self._scanner is not None:
+            matched_ids = set()
+
+            def on_match(pattern_id, start, end, flags, context):
+                matched_ids.add(pattern_id)
+
+            self._scanner.scan(text.encode("utf-8"), match_event_handler=on_match)
+            candidates = sorted(matched_ids)
+
+        matches = []
+        for pattern_id in candidates:
+            relation_type, regex = self._relation_patterns[pattern_id]
+            matches.extend(
+                (relation_type, match.start(), match.end())
+                for match in regex.finditer(text)
+            )
+
+        return matches
+
     def add_relation_type(
         self,
         name: str,
@@ -107,19 +271,34 @@ class RelationshipDiscovery:
             self.logger.warning(f"Le type de relation '{name}' existe déjà")
             return False
 
-        self.relation_types[name] = {
+        relation_info = {
             "threshold": threshold,
             "description": description,
             "bidirectional": bidirectional,
         }
 
         if patterns:
-            self.relation_types[name]["patterns"] = patterns
+            try:
+                for pattern in patterns:
+                    re.compile(pattern)
+            except re.error as e:
+                self.logger.error(f"Motif invalide pour le type '{name}': {e}")
+                return False
+
+            relation_info["patterns"] = patterns
+
+        self.relation_types[name] = relation_info
+
+        self._refresh_scanners()
 
         return True
 
     def discover_similar_concepts(
-        self, limit: int = 100, threshold: float = 0.85, batch_size: int = 20
+        self,
+        limit: int = 100,
+        threshold: float = 0.85,
+        batch_size: int = 20,
+        scan_limit: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Découvre des concepts similaires basés sur la proximité vectorielle.
@@ -128,12 +307,14 @@ class RelationshipDiscovery:
             limit (int, optional): Nombre maximal de relations à créer. Par défaut à 100.
             threshold (float, optional): Seuil de similarité. Par défaut à 0.85.
             batch_size (int, optional): Taille de lot pour le traitement. Par défaut à 20.
+            scan_limit (Optional[int], optional): Nombre maximal de concepts examinés.
+                Par défaut à CONCEPT_SCAN_LIMIT.
 
         Returns:
             List[Dict[str, Any]]: Liste des relations découvertes
         """
-        # Trouver tous les concepts
-        all_concepts = self._get_all_concepts()
+        # Trouver les concepts à examiner
+        all_concepts = self._get_all_concepts(scan_limit or self.CONCEPT_SCAN_LIMIT)
         self.logger.info(
             f"Découverte de concepts similaires parmi {len(all_concepts)} concepts"
         )
@@ -142,84 +323,185 @@ class RelationshipDiscovery:
             self.logger.warning("Pas assez de concepts pour découvrir des similarités")
             return []
 
-        discovered_relations = []
-        pairs_checked = set()
+        # Embeddings de tous les concepts, alignés avec leurs IDs: les vecteurs
+        # déjà stockés sont récupérés par lots, les autres encodés en parallèle
+        embeddings = self._fetch_stored_embeddings(
+            [c.get("concept_id") for c in all_concepts if c.get("concept_id")]
+        )
+        missing = [c for c in all_concepts if c.get("concept_id") not in embeddings]
+        with ThreadPoolExecutor(max_workers=self.DISCOVERY_WORKERS) as executor:
+            embeddings.update(
+                zip(
+                    [c.get("concept_id") for c in missing],
+                    executor.map(self._get_concept_embedding, missing),
+                )
+            )
 
-        # Traiter par lots pour éviter de surcharger la mémoire
-        for i in range(0, len(all_concepts), batch_size):
-            batch = all_concepts[i : i + batch_size]
+        concept_ids = []
+        concept_embeddings = []
+        for concept in all_concepts:
+            concept_id = concept.get("concept_id")
+            concept_embedding = embeddings.get(concept_id)
+            if not concept_id or concept_embedding is None:
+                continue
 
-            # Pour chaque concept dans le lot
-            for idx, concept in enumerate(batch):
-                concept_id = concept.get("concept_id")
-                if not concept_id:
-                    continue
+            concept_ids.append(concept_id)
+            concept_embeddings.append(concept_embedding)
+
+        if len(concept_ids) < 2:
+            return []
 
-                # Récupérer l'embedding
-                concept_embedding = self._get_concept_embedding(concept)
-                if not concept_embedding:
+        if len(concept_ids) <= self.EXACT_SEARCH_MAX_CONCEPTS:
+            candidate_pairs, candidate_scores = self._similar_pairs(
+                np.vstack(concept_embeddings), threshold, batch_size
+            )
+        else:
+            candidate_pairs, candidate_scores = self._range_search_pairs(
+                concept_ids, concept_embeddings, threshold
+            )
+
+        bidirectional = self.relation_types["SIMILAR_TO"]["bidirectional"]
+        discovered_relations = []
+
+        # Parcourir les paires de la plus similaire à la moins similaire et
+        # les écrire par lots: MERGE ne crée que les relations absentes, et
+        # l'on continue tant que la limite de nouvelles relations n'est pas
+        # atteinte
+        order = np.argsort(-candidate_scores, kind="stable")
+        position = 0
+        while len(discovered_relations) < limit and position < len(order):
+            batch = []
+            while len(batch) < limit - len(discovered_relations) and position < len(
+                order
+            ):
+                pair_index = order[position]
+                position += 1
+
+                idx, j = candidate_pairs[pair_index]
+                if concept_ids[idx] == concept_ids[j]:
                     continue
 
-                # Comparer avec tous les autres concepts
-                for j in range(idx + 1, len(batch)):
-                    other_concept = batch[j]
-                    other_id = other_concept.get("concept_id")
+                batch.append(
+                    {
+                        "source": concept_ids[idx],
+                        "target": concept_ids[j],
+                        "relation_type": "SIMILAR_TO",
+                        "similarity": float(min(1.0, candidate_scores[pair_index])),
+                    }
+                )
+
+            # Créer les relations (et leurs inverses si la relation est
+            # bidirectionnelle) en une seule transaction
+            created = set(
+                self.kg.create_missing_relationships(
+                    "SIMILAR_TO",
+                    [
+                        {
+                            "source_id": relation["source"],
+                            "target_id": relation["target"],
+                            "properties": {
+                                "similarity": relation["similarity"],
+                                "discovered": True,
+                            },
+                        }
+                        for relation in batch
+                    ],
+                    bidirectional=bidirectional,
+                )
+            )
+            discovered_relations.extend(
+                relation
+                for relation in batch
+                if (relation["source"], relation["target"]) in created
+            )
 
-                    if not other_id or concept_id == other_id:
-                        continue
+        return discovered_relations
 
-                    # Éviter les paires déjà vérifiées
-                    pair_key = tuple(sorted([concept_id, other_id]))
-                    if pair_key in pairs_checked:
-                        continue
+    def _similar_pairs(
+        self, embeddings: np.ndarray, threshold: float, batch_size: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Recherche toutes les paires de concepts dont la similarité atteint le
+        seuil. Chaque lot de lignes est comparé, en un seul produit matriciel,
+        aux concepts qui le suivent: seul le triangle supérieur est calculé.
 
-                    pairs_checked.add(pair_key)
+        Args:
+            embeddings (np.ndarray): Matrice (N, D) d'embeddings normalisés
+            threshold (float): Seuil de similarité
+            batch_size (int): Nombre de lignes traitées par produit matriciel
 
-                    # Vérifier si une relation existe déjà
-                    if self._relation_exists(concept_id, other_id, "SIMILAR_TO"):
-                        continue
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Paires d'indices (i < j) sans doublon
+            et leurs scores de similarité
+        """
+        count = embeddings.shape[0]
+        batch_size = max(1, batch_size)
 
-                    # Récupérer l'embedding de l'autre concept
-                    other_embedding = self._get_concept_embedding(other_concept)
-                    if not other_embedding:
-                        continue
+        pairs = [np.empty((0, 2), dtype=np.intp)]
+        scores = [np.empty(0, dtype=embeddings.dtype)]
+        for start in range(0, count, batch_size):
+            similarities = embeddings[start : start + batch_size] @ embeddings[start:].T
 
-                    # Calculer la similarité
-                    similarity = self._calculate_similarity(
-                        concept_embedding, other_embedding
-                    )
+            # Ne garder que j > i: la diagonale et le triangle inférieur du
+            # bloc sont masqués, chaque paire n'est donc produite qu'une fois
+            similarities[np.tril_indices(similarities.shape[0])] = -np.inf
 
-                    if similarity >= threshold:
-                        # Créer la relation
-                        self.kg.add_relationship(
-                            concept_id,
-                            other_id,
-                            "SIMILAR_TO",
-                            {"similarity": similarity, "discovered": True},
-                        )
-
-                        # Si la relation est bidirectionnelle, créer dans l'autre sens aussi
-                        if self.relation_types["SIMILAR_TO"]["bidirectional"]:
-                            self.kg.add_relationship(
-                                other_id,
-                                concept_id,
-                                "SIMILAR_TO",
-                                {"similarity": similarity, "discovered": True},
-                            )
-
-                        discovered_relations.append(
-                            {
-                                "source": concept_id,
-                                "target": other_id,
-                                "relation_type": "SIMILAR_TO",
-                                "similarity": similarity,
-                            }
-                        )
-
-                        if len(discovered_relations) >= limit:
-                            return discovered_relations
+            rows, columns = np.nonzero(similarities >= threshold)
+            pairs.append(np.stack([start + rows, start + columns], axis=1))
+            scores.append(similarities[rows, columns])
 
-        return discovered_relations
+        return np.concatenate(pairs), np.concatenate(scores)
+
+    def _range_search_pairs(
+        self,
+        concept_ids: List[str],
+        embeddings: List[np.ndarray],
+        threshold: float,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Recherche les paires de concepts similaires avec une requête de rayon
+        par concept sur l'index vectoriel, au lieu de comparer toutes les paires.
+
+        Args:
+            concept_ids (List[str]): IDs des concepts
+            embeddings (List[np.ndarray]): Embeddings normalisés, alignés avec les IDs
+            threshold (float): Seuil de similarité
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Paires d'indices (i < j) sans doublon
+            et leurs scores de similarité
+        """
+        concept_index = {cid: idx for idx, cid in enumerate(concept_ids)}
+
+        with ThreadPoolExecutor(max_workers=self.DISCOVERY_WORKERS) as executor:
+            all_hits = executor.map(
+                self.vs.range_search,
+                embeddings,
+                [threshold] * len(embeddings),
+                [self.RANGE_SEARCH_LIMIT] * len(embeddings),
+            )
+
+            rows, columns, scores = [], [], []
+            for idx, hits in enumerate(all_hits):
+                for hit in hits:
+                    j = concept_index.get(hit["concept_id"])
+                    if j is None or j == idx:
+                        continue
+                    rows.append(min(idx, j))
+                    columns.append(max(idx, j))
+                    scores.append(hit["similarity"])
+
+        rows = np.asarray(rows, dtype=np.int64)
+        columns = np.asarray(columns, dtype=np.int64)
+        scores = np.asarray(scores, dtype=np.float32)
+
+        # Chaque paire peut être trouvée depuis ses deux extrémités: dédoublonner
+        # sur la clé entière (i << 32) | j
+        _, unique_index = np.unique((rows << 32) | columns, return_index=True)
+        return (
+            np.stack([rows[unique_index], columns[unique_index]], axis=1),
+            scores[unique_index],
+        )
 
     def discover_textual_relations(self, concept_id: str) -> List[Dict[str, Any]]:
         """
@@ -244,64 +526,78 @@ class RelationshipDiscovery:
         description = concept.get("description", "")
         text = f"{name}: {description}"
 
-        # Pour chaque type de relation ayant des motifs
-        for relation_type, relation_info in self.relation_types.items():
-            if "patterns" not in relation_info:
-                continue
+        # Rechercher les motifs de tous les types de relations en une passe
+        matches = []
+        for relation_type, match_start, match_end in self._scan_relation_patterns(text):
+            # Analyser le contexte autour de la correspondance
+            start = max(0, match_start - 50)
+            end = min(len(text), match_end + 50)
+            matches.append(
+                (relation_type, text[match_start:match_end], text[start:end])
+            )
 
-            patterns = relation_info["patterns"]
-            threshold = relation_info.get("threshold", 0.7)
+        if not matches:
+            return []
+
+        # Relations existantes du concept, récupérées une seule fois
+        existing_relations = self._existing_relations(concept_id)
+
+        # Rechercher en parallèle les concepts potentiellement reliés à chaque
+        # correspondance (une requête Weaviate par contexte)
+        with ThreadPoolExecutor(
+            max_workers=min(self.DISCOVERY_WORKERS, len(matches))
+        ) as executor:
+            all_targets = list(
+                executor.map(
+                    self._find_potential_targets,
+                    [context for _, _, context in matches],
+                    [concept_id] * len(matches),
+                    [relation_type for relation_type, _, _ in matches],
+                    [
+                        self._thresholds[relation_type]
+                        for relation_type, _, _ in matches
+                    ],
+                )
+            )
 
-            for pattern in patterns:
-                # Rechercher les correspondances
-                matches = re.finditer(pattern, text)
+        for (relation_type, match_text, context), potential_targets in zip(
+            matches, all_targets
+        ):
+            threshold = self._thresholds[relation_type]
 
-                for match in matches:
-                    # Analyser le contexte autour de la correspondance
-                    match_text = match.group(0)
-                    start = max(0, match.start() - 50)
-                    end = min(len(text), match.end() + 50)
-                    context = text[start:end]
+            # Ajouter les relations découvertes
+            for target in potential_targets:
+                target_id = target.get("concept_id")
+                confidence = target.get("confidence", 0.0)
 
-                    # Rechercher des concepts potentiellement reliés
-                    potential_targets = self._find_potential_targets(
-                        context, concept_id, relation_type, threshold
+                if target_id and confidence >= threshold:
+                    # Éviter d'ajouter des relations existantes
+                    if (relation_type, target_id) in existing_relations:
+                        continue
+                    existing_relations.add((relation_type, target_id))
+
+                    # Créer la relation
+                    self.kg.add_relationship(
+                        concept_id,
+                        target_id,
+                        relation_type,
+                        {
+                            "confidence": confidence,
+                            "discovered": True,
+                            "context": context,
+                        },
                     )
 
-                    # Ajouter les relations découvertes
-                    for target in potential_targets:
-                        target_id = target.get("concept_id")
-                        confidence = target.get("confidence", 0.0)
-
-                        if target_id and confidence >= threshold:
-                            # Éviter d'ajouter des relations existantes
-                            if self._relation_exists(
-                                concept_id, target_id, relation_type
-                            ):
-                                continue
-
-                            # Créer la relation
-                            self.kg.add_relationship(
-                                concept_id,
-                                target_id,
-                                relation_type,
-                                {
-                                    "confidence": confidence,
-                                    "discovered": True,
-                                    "context": context,
-                                },
-                            )
-
-                            discovered_relations.append(
-                                {
-                                    "source": concept_id,
-                                    "target": target_id,
-                                    "relation_type": relation_type,
-                                    "confidence": confidence,
-                                    "context": context,
-                                    "match": match_text,
-                                }
-                            )
+                    discovered_relations.append(
+                        {
+                            "source": concept_id,
+                            "target": target_id,
+                            "relation_type": relation_type,
+                            "confidence": confidence,
+                            "context": context,
+                            "match": match_text,
+                        }
+                    )
 
         return discovered_relations
 
@@ -323,15 +619,14 @@ class RelationshipDiscovery:
             self.logger.error(f"Concept non trouvé: {concept_id}")
             return []
 
-        # Récupérer l'embedding du concept
-        embedding = self._get_concept_embedding_by_id(concept_id)
-        if not embedding:
-            return []
+        # Embedding du concept, récupéré seulement si une certitude manque
+        embedding = None
 
         # Trouver des concepts similaires
         similar_concepts = self.vs.search_similar(
             query=f"{concept.get('name', '')}: {concept.get('description', '')}",
             limit=20,  # Chercher plus que nécessaire pour avoir plus d'options
+            fields=("concept_id", "name"),
         )
 
         # Filtrer le concept lui-même
@@ -339,6 +634,19 @@ class RelationshipDiscovery:
             c for c in similar_concepts if c.get("concept_id") != concept_id
         ]
 
+        # Relations existantes du concept, récupérées une seule fois
+        existing_relations = self._existing_relations(concept_id)
+
+        # Précharger en une requête les embeddings nécessaires aux candidats
+        # sans certitude
+        uncertain_ids = [
+            c["concept_id"]
+            for c in similar_concepts[:limit]
+            if c.get("concept_id") and c.get("certainty") is None
+        ]
+        if uncertain_ids:
+            self._preload_embeddings([concept_id] + uncertain_ids)
+
         # Suggérer des relations
         suggestions = []
 
@@ -349,15 +657,22 @@ class RelationshipDiscovery:
                 continue
 
             # Éviter de suggérer des relations existantes
-            if self._relation_exists(concept_id, target_id, "SIMILAR_TO"):
+            if ("SIMILAR_TO", target_id) in existing_relations:
                 continue
 
-            # Calculer la similarité plus précisément
-            target_embedding = self._get_concept_embedding_by_id(target_id)
-            if not target_embedding:
-                continue
+            # La certitude Weaviate vaut (1 + cos) / 2: la ramener à la
+            # similarité cosinus sans recalculer les embeddings
+            certainty = similar.get("certainty")
+            if certainty is not None:
+                similarity = max(0.0, min(1.0, 2.0 * float(certainty) - 1.0))
+            else:
+                if embedding is None:
+                    embedding = self._get_quantized_embedding_by_id(concept_id)
+                target_embedding = self._get_quantized_embedding_by_id(target_id)
+                if embedding is None or target_embedding is None:
+                    continue
 
-            similarity = self._calculate_similarity(embedding, target_embedding)
+                similarity = self._calculate_similarity(embedding, target_embedding)
 
             suggestions.append(
                 {
@@ -394,40 +709,59 @@ class RelationshipDiscovery:
 
         return suggestions[:limit]
 
-    def _get_all_concepts(self) -> List[Dict[str, Any]]:
+    def _get_all_concepts(self, limit: int) -> List[Dict[str, Any]]:
         """
-        Récupère tous les concepts du stockage vectoriel.
+        Récupère les concepts du stockage vectoriel, hors domaines.
+
+        Args:
+            limit (int): Nombre maximal de concepts
 
         Returns:
-            List[Dict[str, Any]]: Liste de tous les concepts
+            List[Dict[str, Any]]: Liste des concepts
         """
         query = """
         MATCH (c:Concept)
         WHERE NOT c.type = 'domain'
-        RETURN c
-        LIMIT 1000
+        RETURN c.id AS id
+        LIMIT $limit
         """
 
         try:
+            all_concepts = []
             with self.kg.driver.session(database=self.kg.database) as session:
-                result = session.run(query)
-                concept_ids = [dict(record["c"]) for record in result]
-
-                # Récupérer les détails complets depuis le stockage vectoriel
-                all_concepts = []
-                for concept in concept_ids:
-                    concept_id = concept.get("id")
-                    if concept_id:
-                        vector_data = self.vs.get_concept(concept_id)
-                        if vector_data:
-                            all_concepts.append(vector_data)
-
-                return all_concepts
+                # Parcourir les résultats au fil de l'eau et récupérer les
+                # détails depuis le stockage vectoriel par lots d'IDs
+                concept_ids = []
+                for record in session.run(query, limit=limit):
+                    if record["id"]:
+                        concept_ids.append(record["id"])
+
+                    if len(concept_ids) >= self.CONCEPT_FETCH_BATCH_SIZE:
+                        all_concepts.extend(self._fetch_concepts(concept_ids))
+                        concept_ids = []
+
+                all_concepts.extend(self._fetch_concepts(concept_ids))
+
+            return all_concepts
         except Exception as e:
             self.logger.error(f"Erreur lors de la récupération des concepts: {e}")
             return []
 
-    def _get_concept_embedding(self, concept: Dict[str, Any]) -> Optional[List[float]]:
+    def _fetch_concepts(self, concept_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Récupère un lot de concepts depuis le stockage vectoriel, dans l'ordre
+        des IDs demandés.
+
+        Args:
+            concept_ids (List[str]): IDs des concepts
+
+        Returns:
+            List[Dict[str, Any]]: Concepts trouvés
+        """
+        concepts = self.vs.get_concepts_bulk(concept_ids)
+        return [concepts[cid] for cid in concept_ids if cid in concepts]
+
+    def _get_concept_embedding(self, concept: Dict[str, Any]) -> Optional[np.ndarray]:
         """
         Récupère ou génère l'embedding d'un concept.
 
@@ -435,7 +769,7 @@ class RelationshipDiscovery:
             concept (Dict[str, Any]): Données du concept
 
         Returns:
-            Optional[List[float]]: Embedding du concept ou None
+            Optional[np.ndarray]: Embedding normalisé (float32) du concept ou None
         """
         concept_id = concept.get("concept_id")
         name = concept.get("name", "")
@@ -446,86 +780,208 @@ class RelationshipDiscovery:
 
         # Générer l'embedding du texte
         text = f"{name}: {description}"
-        return self.vs.get_embedding(text)
+        return self._normalize_embedding(self.vs.get_embedding(text))
 
-    def _get_concept_embedding_by_id(self, concept_id: str) -> Optional[List[float]]:
+    def _get_quantized_embedding_by_id(
+        self, concept_id: str
+    ) -> Optional[QuantizedEmbedding]:
         """
-        Récupère l'embedding d'un concept par son ID.
+        Récupère l'embedding quantifié d'un concept par son ID (mis en cache).
 
         Args:
             concept_id (str): ID du concept
 
         Returns:
-            Optional[List[float]]: Embedding du concept ou None
+            Optional[QuantizedEmbedding]: Embedding normalisé et quantifié en
+            int8 du concept, ou None
         """
+        cached = self._embedding_cache.get(concept_id)
+        if cached is not None:
+            self._embedding_cache.move_to_end(concept_id)
+            return cached
+
         # Récupérer le concept depuis le stockage vectoriel
         concept = self.vs.get_concept(concept_id)
-        if not concept:
+        if concept:
+            embedding = self._get_concept_embedding(concept)
+        else:
             # Essayer depuis le graphe de connaissances
             concept_data = self.kg.get_concept(concept_id)
-            if concept_data:
-                name = concept_data.get("name", "")
-                description = concept_data.get("description", "")
-                text = f"{name}: {description}"
-                return self.vs.get_embedding(text)
+            if not concept_data:
+                return None
+
+            name = concept_data.get("name", "")
+            description = concept_data.get("description", "")
+            text = f"{name}: {description}"
+            embedding = self._normalize_embedding(self.vs.get_embedding(text))
+
+        if embedding is None:
             return None
 
-        return self._get_concept_embedding(concept)
+        return self._cache_embedding(concept_id, embedding)
+
+    def _fetch_stored_embeddings(self, concept_ids: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Récupère par lots les vecteurs stockés des concepts, normalisés.
+
+        Args:
+            concept_ids (List[str]): IDs des concepts
+
+        Returns:
+            Dict[str, np.ndarray]: Embeddings normalisés (float32) des concepts
+            trouvés, indexés par ID
+        """
+        embeddings = {}
+        for start in range(0, len(concept_ids), self.CONCEPT_FETCH_BATCH_SIZE):
+            stored = self.vs.get_embeddings_bulk(
+                concept_ids[start : start + self.CONCEPT_FETCH_BATCH_SIZE]
+            )
+            for concept_id, vector in stored.items():
+                embedding = self._normalize_embedding(vector)
+                if embedding is not None:
+                    embeddings[concept_id] = embedding
+
+        return embeddings
+
+    def _preload_embeddings(self, concept_ids: List[str]) -> None:
+        """
+        Charge dans le cache, en une seule requête, les embeddings des concepts
+        qui n'y sont pas encore.
+
+        Args:
+            concept_ids (List[str]): IDs des concepts
+        """
+        missing = [cid for cid in concept_ids if cid not in self._embedding_cache]
+        for concept_id, embedding in self._fetch_stored_embeddings(missing).items():
+            self._cache_embedding(concept_id, embedding)
+
+    def _cache_embedding(
+        self, concept_id: str, embedding: np.ndarray
+    ) -> QuantizedEmbedding:
+        """
+        Quantifie un embedding et l'ajoute au cache LRU.
+
+        Args:
+            concept_id (str): ID du concept
+            embedding (np.ndarray): Embedding normalisé (float32)
+
+        Returns:
+            QuantizedEmbedding: Embedding quantifié mis en cache
+        """
+        quantized = self._quantize_embedding(embedding)
+        self._embedding_cache[concept_id] = quantized
+        self._embedding_cache.move_to_end(concept_id)
+        if len(self._embedding_cache) > self.EMBEDDING_CACHE_SIZE:
+            self._embedding_cache.popitem(last=False)
+
+        return quantized
+
+    @staticmethod
+    def _quantize_embedding(embedding: np.ndarray) -> QuantizedEmbedding:
+        """
+        Quantifie un embedding en int8 avec une échelle par vecteur.
+
+        Args:
+            embedding (np.ndarray): Embedding normalisé (float32)
+
+        Returns:
+            QuantizedEmbedding: Valeurs int8 (lecture seule) et échelle
+        """
+        scale = float(np.max(np.abs(embedding))) or 1.0
+        quantized = np.round(embedding * (127.0 / scale)).astype(np.int8)
+        quantized.setflags(write=False)
+        return quantized, scale
+
+    @staticmethod
+    def _normalize_embedding(embedding: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        """
+        Normalise un embedding float32 à une norme de 1.
+
+        Args:
+            embedding (Optional[np.ndarray]): Embedding brut (float32)
+
+        Returns:
+            Optional[np.ndarray]: Embedding normalisé (lecture seule) ou None
+        """
+        if embedding is None or embedding.size == 0:
+            return None
+
+        vector = embedding / (np.linalg.norm(embedding) + 1e-12)
+        vector.setflags(write=False)
+        return vector
 
     def _calculate_similarity(
-        self, embedding1: List[float], embedding2: List[float]
+        self, embedding1: QuantizedEmbedding, embedding2: QuantizedEmbedding
     ) -> float:
         """
-        Calcule la similarité cosinus entre deux embeddings.
+        Calcule la similarité cosinus entre deux embeddings normalisés et
+        quantifiés, par un produit scalaire entier.
 
         Args:
-            embedding1 (List[float]): Premier embedding
-            embedding2 (List[float]): Second embedding
+            embedding1 (QuantizedEmbedding): Premier embedding quantifié
+            embedding2 (QuantizedEmbedding): Second embedding quantifié
 
         Returns:
             float: Score de similarité entre 0 et 1
         """
         try:
-            # Convertir en tableaux numpy
-            vec1 = np.array(embedding1).reshape(1, -1)
-            vec2 = np.array(embedding2).reshape(1, -1)
-
-            # Calculer la similarité cosinus
-            similarity = cosine_similarity(vec1, vec2)[0][0]
+            (values1, scale1), (values2, scale2) = embedding1, embedding2
+            similarity = _int8_dot(values1, values2) * (scale1 * scale2) / (127 * 127)
 
             # Normaliser entre 0 et 1
-            return float(max(0.0, min(1.0, similarity)))
+            return max(0.0, min(1.0, similarity))
         except Exception as e:
             self.logger.error(f"Erreur lors du calcul de similarité: {e}")
             return 0.0
 
-    def _relation_exists(
-        self, source_id: str, target_id: str, relation_type: str
-    ) -> bool:
+    def _existing_relations(self, source_id: str) -> Set[Tuple[str, str]]:
         """
-        Vérifie si une relation existe déjà entre deux concepts.
+        Récupère en une seule requête les relations existantes d'un concept.
 
         Args:
             source_id (str): ID du concept source
-            target_id (str): ID du concept cible
-            relation_type (str): Type de relation
 
         Returns:
-            bool: True si la relation existe
+            Set[Tuple[str, str]]: Couples (type de relation, ID cible), y compris
+            les relations bidirectionnelles entrantes
         """
-        query = f"""
-        MATCH (source:Concept {{id: $source_id}})-[r:`{relation_type}`]->(target:Concept {{id: $target_id}})
-        RETURN count(r) as count
+        query = """
+        MATCH (source:Concept {id: $source_id})-[r]-(target:Concept)
+        RETURN type(r) as relation_type, target.id as target_id,
+               startNode(r) = source as outgoing
         """
 
         try:
             with self.kg.driver.session(database=self.kg.database) as session:
-                result = session.run(query, source_id=source_id, target_id=target_id)
-                record = result.single()
-                return record and record["count"] > 0
+                result = session.run(query, source_id=source_id)
+                return {
+                    (record["relation_type"], record["target_id"])
+                    for record in result
+                    if record["outgoing"]
+                    or self.relation_types.get(record["relation_type"], {}).get(
+                        "bidirectional"
+                    )
+                }
         except Exception as e:
-            self.logger.error(f"Erreur lors de la vérification de relation: {e}")
-            return False
+            self.logger.error(f"Erreur lors de la récupération des relations: {e}")
+            return set()
+
+    @staticmethod
+    def _parse_certainty(certainty: Any) -> float:
+        """
+        Convertit une certitude Weaviate en nombre, 0.0 si elle est absente ou
+        invalide.
+
+        Args:
+            certainty (Any): Certitude renvoyée par la recherche
+
+        Returns:
+            float: Certitude
+        """
+        try:
+            return float(certainty or 0.0)
+        except (TypeError, ValueError):
+            return 0.0
 
     def _find_potential_targets(
         self, context: str, source_id: str, relation_type: str, threshold: float
@@ -543,21 +999,25 @@ class RelationshipDiscovery:
             List[Dict[str, Any]]: Liste des cibles potentielles
         """
         # Rechercher des concepts similaires au contexte
-        search_results = self.vs.search_similar(query=context, limit=10)
+        search_results = self.vs.search_similar(
+            query=context, limit=10, fields=("concept_id",)
+        )
 
         # Filtrer le concept source
         candidates = [c for c in search_results if c.get("concept_id") != source_id]
 
-        # Calculer la confiance en fonction de la similarité
-        for candidate in candidates:
-            confidence = candidate.get("certainty", 0.0)
-            if isinstance(confidence, str):
-                try:
-                    confidence = float(confidence)
-                except ValueError:
-                    confidence = 0.0
+        if not candidates:
+            return []
 
-            candidate["confidence"] = confidence
+        # Calculer la confiance en fonction de la similarité, en une passe
+        confidences = np.fromiter(
+            (self._parse_certainty(c.get("certainty")) for c in candidates),
+            dtype=np.float64,
+            count=len(candidates),
+        )
 
         # Filtrer par seuil
-        return [c for c in candidates if c.get("confidence", 0.0) >= threshold]
+        return [
+            {**candidates[index], "confidence": float(confidences[index])}
+            for index in np.flatnonzero(confidences >= threshold)
+        ]
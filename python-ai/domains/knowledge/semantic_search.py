@@ -51,31 +51,34 @@ class SemanticSearch:
             self.logger.info("Aucun résultat trouvé dans la recherche vectorielle")
             return []
 
-        # Étape 2: Enrichissement avec le graphe de connaissances
-        enriched_results = []
-
-        for result in vector_results:
-            concept_id = result.get("concept_id")
-            enriched_result = {**result}
-
-            if enrich_with_relations and concept_id:
-                try:
-                    # Récupérer les relations depuis le graphe de connaissances
-                    related_concepts = self.knowledge_graph.get_related_concepts(
-                        concept_id=concept_id, max_depth=relation_depth
-                    )
-
-                    # Ajouter les concepts reliés au résultat
-                    enriched_result["related_concepts"] = related_concepts
-                except Exception as e:
-                    self.logger.error(
-                        f"Erreur lors de l'enrichissement des relations: {e}"
-                    )
-                    enriched_result["related_concepts"] = []
-
-            enriched_results.append(enriched_result)
-
-        return enriched_results
+        # Étape 2: Enrichissement avec le graphe de connaissances, en une
+        # seule requête pour tous les résultats
+        if not enrich_with_relations:
+            return vector_results
+
+        related_by_id = {}
+        if relation_depth > 0:
+            concept_ids = [
+                r["concept_id"] for r in vector_results if r.get("concept_id")
+            ]
+            try:
+                related_by_id = self.knowledge_graph.get_related_concepts_batch(
+                    concept_ids, max_depth=relation_depth
+                )
+            except Exception as e:
+                self.logger.error(f"Erreur lors de l'enrichissement des relations: {e}")
+
+        return [
+            (
+                {
+                    **result,
+                    "related_concepts": related_by_id.get(result["concept_id"], []),
+                }
+                if result.get("concept_id")
+                else {**result}
+            )
+            for result in vector_results
+        ]
 
     def search_by_concept(
         self,
@@ -103,9 +106,9 @@ class SemanticSearch:
         # Récupérer les vecteurs associés
         vector_data = self.vector_store.get_concept(concept_id)
 
-        # Récupérer les relations
+        # Récupérer les relations (aucune à une profondeur nulle)
         related = []
-        if relation_types:
+        if max_depth > 0 and relation_types:
             for relation_type in relation_types:
                 related_concepts = self.knowledge_graph.get_related_concepts(
                     concept_id=concept_id,
@@ -113,7 +116,7 @@ class SemanticSearch:
                     max_depth=max_depth,
                 )
                 related.extend(related_concepts)
-        else:
+        elif max_depth > 0:
             related = self.knowledge_graph.get_related_concepts(
                 concept_id=concept_id, max_depth=max_depth
             )
@@ -140,16 +143,24 @@ class SemanticSearch:
         Returns:
             List[Dict[str, Any]]: Liste des concepts similaires
         """
-        # Récupérer le concept depuis le stockage vectoriel
-        concept = self.vector_store.get_concept(concept_id)
+        # Récupérer le concept et son vecteur depuis le stockage vectoriel
+        concept = self.vector_store.get_concept(concept_id, include_vector=True)
         if not concept:
             self.logger.info(f"Concept non trouvé pour la similarité: {concept_id}")
             return []
 
-        # Utiliser le nom et la description pour la recherche
-        query = f"{concept.get('name', '')}: {concept.get('description', '')}"
+        # Rechercher avec le vecteur stocké, sans réencoder le concept; le
+        # concept lui-même est exclu par Weaviate et les résultats arrivent
+        # déjà triés par certitude
+        vector = concept.get("vector")
+        if vector is not None:
+            return self.vector_store.search_similar_by_vector(
+                vector, limit, exclude_concept_id=concept_id
+            )
 
-        # Exclure le concept lui-même des résultats
+        # Utiliser le nom et la description pour la recherche (un résultat de
+        # plus pour exclure le concept lui-même)
+        query = f"{concept.get('name', '')}: {concept.get('description', '')}"
         results = self.vector_store.search_similar(query, limit + 1)
 
         # Filtrer le concept d'origine
@@ -171,21 +182,21 @@ class SemanticSearch:
         Returns:
             List[Dict[str, Any]]: Résultats combinés
         """
-        all_results = []
-        concept_ids_seen = set()
-
-        for query in queries:
-            results = self.search(query, limit=limit, enrich_with_relations=False)
-
-            # Ajouter uniquement les nouveaux résultats
-            for result in results:
-                concept_id = result.get("concept_id")
-                if concept_id and concept_id not in concept_ids_seen:
-                    all_results.append(result)
-                    concept_ids_seen.add(concept_id)
+        # Encoder toutes les requêtes en un seul lot et les rechercher en parallèle
+        all_results = [
+            result
+            for results in self.vector_store.search_similar_batch(queries, limit)
+            for result in results
+            if result.get("concept_id")
+        ]
 
         # Trier les résultats par pertinence (si un score est disponible)
         if all_results and "certainty" in all_results[0]:
             all_results.sort(key=lambda x: x.get("certainty", 0), reverse=True)
 
-        return all_results
+        # Dédoublonner en gardant, pour chaque concept, son meilleur résultat
+        unique_results: Dict[str, Dict[str, Any]] = {}
+        for result in all_results:
+            unique_results.setdefault(result["concept_id"], result)
+
+        return list(unique_results.values())
@@ -1,10 +1,392 @@
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import Dict, List, Any, Optional, Union, Tuple, Iterator
+import hashlib
+import json
 import logging
+import os
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
+import torch
 import weaviate
-from weaviate.exceptions import WeaviateException
+from weaviate.exceptions import (
+    ObjectAlreadyExistsException,
+    UnexpectedStatusCodeException,
+    WeaviateException,
+)
 from sentence_transformers import SentenceTransformer
 
+try:
+    from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    from transformers import AutoTokenizer
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    ORTModelForFeatureExtraction = None
+
+try:
+    import diskcache
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    diskcache = None
+
+try:
+    import hnswlib
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    hnswlib = None
+
+
+class _EmbeddingCache:
+    """
+    Cache LRU à durée de vie limitée des embeddings, indexé par empreinte du
+    texte. Partagé entre threads, et adossé optionnellement à un cache disque
+    partagé entre processus et redémarrages.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1000,
+        ttl: float = 3600.0,
+        disk_path: Optional[str] = None,
+        namespace: str = "",
+    ):
+        """
+        Initialise le cache.
+
+        Args:
+            capacity (int, optional): Nombre maximal d'entrées. Par défaut à 1000.
+            ttl (float, optional): Durée de vie d'une entrée en secondes. Par défaut à 3600.
+            disk_path (Optional[str], optional): Répertoire du cache disque (diskcache). Par défaut à None (désactivé).
+            namespace (str, optional): Préfixe des clés disque (modèle d'encodage). Par défaut à "".
+        """
+        self.capacity = capacity
+        self.ttl = ttl
+        self.namespace = namespace
+        self._entries: "OrderedDict[str, Tuple[float, np.ndarray]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._disk = (
+            diskcache.Cache(disk_path) if disk_path and diskcache is not None else None
+        )
+
+    @staticmethod
+    def key(text: str) -> str:
+        """Empreinte SHA-1 d'un texte."""
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        """
+        Récupère l'embedding d'un texte s'il est en cache et n'a pas expiré.
+
+        Args:
+            text (str): Texte encodé
+
+        Returns:
+            Optional[np.ndarray]: Embedding en cache ou None
+        """
+        key = self.key(text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, embedding = entry
+                if time.monotonic() - stored_at <= self.ttl:
+                    self._entries.move_to_end(key)
+                    return embedding
+                del self._entries[key]
+
+        if self._disk is None:
+            return None
+
+        # Les octets float32 bruts sont relus sans copie (tableau en lecture seule)
+        data = self._disk.get(self._disk_key(text))
+        if data is None:
+            return None
+
+        embedding = np.frombuffer(data, dtype=np.float32)
+        self._put_memory(key, embedding)
+        return embedding
+
+    def put(self, text: str, embedding: np.ndarray) -> None:
+        """
+        Ajoute l'embedding d'un texte au cache.
+
+        Args:
+            text (str): Texte encodé
+            embedding (np.ndarray): Embedding (lecture seule)
+        """
+        self._put_memory(self.key(text), embedding)
+        if self._disk is not None:
+            self._disk.set(self._disk_key(text), embedding.tobytes(), expire=None)
+
+    def _put_memory(self, key: str, embedding: np.ndarray) -> None:
+        """Ajoute une entrée au cache mémoire en évinçant la plus ancienne."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), embedding)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def _disk_key(self, text: str) -> bytes:
+        """Empreinte SHA-1 binaire d'un texte, préfixée par le modèle d'encodage."""
+        return hashlib.sha1(f"{self.namespace}\0{text}".encode("utf-8")).digest()
+
+
+class _LocalIndex:
+    """
+    Copie en mémoire des concepts (vecteurs normalisés et propriétés) dans un
+    index HNSW hnswlib en produit scalaire, pour servir les recherches
+    vectorielles sans aller-retour réseau. Weaviate reste la référence pour
+    les écritures. Partagé entre threads.
+    """
+
+    # Capacité initiale de l'index, doublée à chaque dépassement
+    INITIAL_CAPACITY = 10000
+
+    def __init__(self, dim: int):
+        """
+        Initialise un index vide.
+
+        Args:
+            dim (int): Dimension des vecteurs
+        """
+        self.dim = dim
+        self._index = hnswlib.Index(space="ip", dim=dim)
+        self._index.init_index(
+            max_elements=self.INITIAL_CAPACITY, ef_construction=200, M=16
+        )
+        self._index.set_ef(64)
+        self._labels: Dict[str, int] = {}
+        self._concept_ids: Dict[int, str] = {}
+        self._properties: Dict[str, Dict[str, Any]] = {}
+        self._category_counts: Dict[Optional[str], int] = defaultdict(int)
+        self._next_label = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def add(
+        self, concept_id: str, vector: np.ndarray, properties: Dict[str, Any]
+    ) -> None:
+        """
+        Ajoute ou met à jour un concept.
+
+        Args:
+            concept_id (str): Identifiant du concept
+            vector (np.ndarray): Vecteur (norme 1)
+            properties (Dict[str, Any]): Propriétés du concept
+        """
+        with self._lock:
+            label = self._labels.get(concept_id)
+            if label is None:
+                label = self._next_label
+                self._next_label += 1
+                if label >= self._index.get_max_elements():
+                    self._index.resize_index(2 * self._index.get_max_elements())
+                self._labels[concept_id] = label
+                self._concept_ids[label] = concept_id
+            else:
+                self._category_counts[self._properties[concept_id].get("category")] -= 1
+
+            self._category_counts[properties.get("category")] += 1
+            self._index.add_items(
+                np.asarray(vector, dtype=np.float32).reshape(1, -1), [label]
+            )
+            self._properties[concept_id] = properties
+
+    def remove(self, concept_id: str) -> None:
+        """
+        Retire un concept de l'index.
+
+        Args:
+            concept_id (str): Identifiant du concept
+        """
+        with self._lock:
+            label = self._labels.pop(concept_id, None)
+            if label is None:
+                return
+            self._index.mark_deleted(label)
+            del self._concept_ids[label]
+            properties = self._properties.pop(concept_id)
+            self._category_counts[properties.get("category")] -= 1
+
+    def search(
+        self,
+        vector: np.ndarray,
+        limit: int,
+        min_certainty: float,
+        category: Optional[str] = None,
+        exclude_concept_id: Optional[str] = None,
+    ) -> Optional[List[Tuple[Dict[str, Any], float]]]:
+        """
+        Recherche les concepts les plus proches d'un vecteur.
+
+        Args:
+            vector (np.ndarray): Vecteur de la requête (norme 1)
+            limit (int): Nombre maximum de résultats
+            min_certainty (float): Certitude minimale, au sens de Weaviate ((1 + cos) / 2)
+            category (Optional[str], optional): Filtrer par catégorie. Par défaut à None.
+            exclude_concept_id (Optional[str], optional): Concept à exclure. Par défaut à None.
+
+        Returns:
+            Optional[List[Tuple[Dict[str, Any], float]]]: Propriétés et
+            certitude des concepts trouvés, par certitude décroissante, ou None
+            si le parcours filtré n'a pas pu aboutir
+        """
+        with self._lock:
+            # hnswlib exige au moins k éléments acceptés par le filtre
+            available = (
+                self._category_counts[category] if category else len(self._labels)
+            )
+            excluded = self._properties.get(exclude_concept_id)
+            if excluded is not None and (
+                category is None or excluded.get("category") == category
+            ):
+                available -= 1
+
+            k = min(limit, available)
+            if k <= 0:
+                return []
+
+            def _accept(label: int) -> bool:
+                concept_id = self._concept_ids.get(label)
+                if concept_id is None or concept_id == exclude_concept_id:
+                    return False
+                return (
+                    category is None
+                    or self._properties[concept_id].get("category") == category
+                )
+
+            try:
+                labels, distances = self._index.knn_query(
+                    np.asarray(vector, dtype=np.float32).reshape(1, -1),
+                    k=k,
+                    num_threads=1,
+                    filter=_accept if category or exclude_concept_id else None,
+                )
+            except RuntimeError:
+                # Filtre trop sélectif pour le graphe HNSW
+                return None
+
+            results = []
+            for label, distance in zip(labels[0], distances[0]):
+                # Distance "ip" de hnswlib: 1 - cos
+                certainty = 1.0 - float(distance) / 2.0
+                if certainty < min_certainty:
+                    break
+                concept_id = self._concept_ids[int(label)]
+                results.append((self._properties[concept_id], certainty))
+            return results
+
+
+class _OnnxEncoder:
+    """
+    Encodeur de phrases exécuté par ONNX Runtime (modèle exporté, éventuellement
+    quantifié en int8). Reproduit le pooling moyen de SentenceTransformer et
+    expose la même méthode ``encode``.
+    """
+
+    # Fichier du modèle quantifié produit par ORTQuantizer
+    QUANTIZED_FILE_NAME = "model_quantized.onnx"
+
+    # Longueur maximale des séquences (celle de all-MiniLM-L6-v2)
+    MAX_SEQ_LENGTH = 256
+
+    def __init__(
+        self, model_name: str, quantize: bool = True, cache_dir: Optional[str] = None
+    ):
+        """
+        Exporte (ou recharge) le modèle au format ONNX.
+
+        Args:
+            model_name (str): Nom du modèle SentenceTransformer
+            quantize (bool, optional): Quantifier dynamiquement le modèle en int8. Par défaut à True.
+            cache_dir (Optional[str], optional): Répertoire du modèle exporté. Par défaut dans le répertoire temporaire.
+        """
+        model_id = (
+            model_name if "/" in model_name else f"sentence-transformers/{model_name}"
+        )
+        variant = "int8" if quantize else "fp32"
+        export_dir = cache_dir or os.path.join(
+            tempfile.gettempdir(),
+            "lucie-onnx",
+            f"{model_id.replace('/', '--')}-{variant}",
+        )
+        file_name = self.QUANTIZED_FILE_NAME if quantize else "model.onnx"
+
+        if not os.path.exists(os.path.join(export_dir, file_name)):
+            model = ORTModelForFeatureExtraction.from_pretrained(
+                model_id, export=True, provider="CPUExecutionProvider"
+            )
+            model.save_pretrained(export_dir)
+            AutoTokenizer.from_pretrained(model_id).save_pretrained(export_dir)
+            if quantize:
+                ORTQuantizer.from_pretrained(model).quantize(
+                    save_dir=export_dir,
+                    quantization_config=AutoQuantizationConfig.avx512_vnni(
+                        is_static=False, per_channel=False
+                    ),
+                )
+
+        self.tokenizer = AutoTokenizer.from_pretrained(export_dir)
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            export_dir, file_name=file_name, provider="CPUExecutionProvider"
+        )
+
+    def encode(
+        self,
+        sentences: Union[str, List[str]],
+        batch_size: int = 32,
+        show_progress_bar: bool = False,
+        normalize_embeddings: bool = False,
+        **kwargs,
+    ) -> np.ndarray:
+        """
+        Encode un texte ou une liste de textes.
+
+        Args:
+            sentences (Union[str, List[str]]): Texte(s) à encoder
+            batch_size (int, optional): Taille des lots. Par défaut à 32.
+            show_progress_bar (bool, optional): Ignoré, pour compatibilité. Par défaut à False.
+            normalize_embeddings (bool, optional): Normaliser les vecteurs (norme L2). Par défaut à False.
+
+        Returns:
+            np.ndarray: Vecteur (texte seul) ou matrice (liste) d'embeddings float32
+        """
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+
+        # Les textes sont traités par longueur décroissante pour limiter le remplissage
+        order = sorted(range(len(texts)), key=lambda i: -len(texts[i]))
+        embeddings = np.zeros(
+            (len(texts), self.model.config.hidden_size), dtype=np.float32
+        )
+
+        for start in range(0, len(order), batch_size):
+            indices = order[start : start + batch_size]
+            inputs = self.tokenizer(
+                [texts[i] for i in indices],
+                padding=True,
+                truncation=True,
+                max_length=self.MAX_SEQ_LENGTH,
+                return_tensors="np",
+            )
+            token_embeddings = self.model(**inputs).last_hidden_state
+
+            # Pooling moyen sur les jetons réels (hors remplissage)
+            mask = inputs["attention_mask"][..., None].astype(np.float32)
+            pooled = (token_embeddings * mask).sum(axis=1) / np.maximum(
+                mask.sum(axis=1), 1e-9
+            )
+            if normalize_embeddings:
+                pooled /= np.maximum(
+                    np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12
+                )
+
+            embeddings[indices] = pooled
+
+        return embeddings[0] if single else embeddings
+
 
 class VectorStore:
     """
@@ -12,11 +394,40 @@ class VectorStore:
     Utilise Weaviate comme base de données vectorielle et SentenceTransformers pour les embeddings.
     """
 
+    # Nombre maximal de requêtes Weaviate lancées en parallèle
+    SEARCH_WORKERS = 8
+
+    # Filtres (catégorie...) appliqués pendant le parcours du graphe HNSW
+    # plutôt qu'avant, ce qui évite l'effondrement des performances sur les
+    # filtres très sélectifs (Weaviate >= 1.27)
+    VECTOR_INDEX_CONFIG = {"filterStrategy": "acorn"}
+
+    # Propriétés renvoyées par défaut par les recherches
+    CONCEPT_FIELDS = ("concept_id", "name", "description", "category", "source")
+
+    # Taille initiale des lots d'import (ajustée dynamiquement par le client)
+    IMPORT_BATCH_SIZE = 100
+
+    # Nombre de requêtes d'import envoyées en parallèle
+    IMPORT_WORKERS = 2
+
+    # Certitude minimale des résultats de recherche vectorielle
+    MIN_CERTAINTY = 0.7
+
+    # Taille des pages lors du parcours complet de la classe Concept
+    UUID_SCAN_PAGE_SIZE = 1000
+
     def __init__(
         self,
         weaviate_url: str,
         weaviate_api_key: Optional[str] = None,
         model_name: str = "all-MiniLM-L6-v2",
+        embedding_cache_size: int = 1000,
+        embedding_cache_ttl: float = 3600.0,
+        encoder_backend: str = "sentence-transformers",
+        embedding_cache_path: Optional[str] = None,
+        enable_fp16: bool = False,
+        local_index: bool = False,
     ):
         """
         Initialise le gestionnaire de stockage de vecteurs.
@@ -25,17 +436,51 @@ class VectorStore:
             weaviate_url (str): URL du serveur Weaviate
             weaviate_api_key (Optional[str], optional): Clé API Weaviate. Par défaut à None.
             model_name (str, optional): Nom du modèle SentenceTransformer. Par défaut à "all-MiniLM-L6-v2".
+            embedding_cache_size (int, optional): Nombre d'embeddings de textes gardés en cache. Par défaut à 1000.
+            embedding_cache_ttl (float, optional): Durée de vie en secondes d'un embedding en cache. Par défaut à 3600.
+            encoder_backend (str, optional): Moteur d'encodage: "sentence-transformers", "onnx"
+                ou "onnx-int8" (repli sur SentenceTransformer si ONNX Runtime est indisponible).
+                Par défaut à "sentence-transformers". Les embeddings diffèrent légèrement d'un
+                moteur à l'autre: changer de moteur impose de ré-encoder la classe Concept.
+            embedding_cache_path (Optional[str], optional): Répertoire d'un cache disque
+                des embeddings, partagé entre processus. Par défaut à None (désactivé).
+            enable_fp16 (bool, optional): Sur GPU, encoder en FP16 avec un modèle compilé
+                (torch.compile). Par défaut à False.
+            local_index (bool, optional): Servir les recherches vectorielles depuis une copie
+                HNSW en mémoire (hnswlib) chargée au démarrage; Weaviate reste la référence
+                des écritures, celles d'autres processus n'y sont pas reflétées. Par défaut à False.
         """
         self.logger = logging.getLogger(__name__)
 
         # Initialisation de l'encodeur de texte
-        try:
-            self.encoder = SentenceTransformer(model_name)
-        except Exception as e:
-            self.logger.error(
-                f"Erreur lors de l'initialisation du modèle d'embedding: {e}"
+        self.encoder_backend = encoder_backend
+        self.encoder = self._create_encoder(model_name, encoder_backend, enable_fp16)
+
+        if embedding_cache_path and diskcache is None:
+            self.logger.warning(
+                "diskcache n'est pas installé, cache disque des embeddings désactivé"
             )
-            raise
+        self._embedding_cache = _EmbeddingCache(
+            capacity=embedding_cache_size,
+            ttl=embedding_cache_ttl,
+            disk_path=embedding_cache_path,
+            namespace=f"{model_name}/{self.encoder_backend}",
+        )
+
+        # Table concept_id -> uuid Weaviate, remplie au fil des résolutions,
+        # qui permet les accès REST par uuid sans requête GraphQL
+        self._concept_uuids: Dict[str, str] = {}
+        self._concept_uuids_lock = threading.RLock()
+
+        # Gabarits GraphQL des recherches vectorielles, par forme de requête
+        self._search_templates: Dict[Tuple[Tuple[str, ...], bool, bool], str] = {}
+
+        # Index HNSW local (premier niveau des recherches), None si désactivé
+        # ou encore vide
+        self._use_local_index = local_index and hnswlib is not None
+        self._local_index: Optional[_LocalIndex] = None
+        if local_index and hnswlib is None:
+            self.logger.warning("hnswlib n'est pas installé, index local désactivé")
 
         # Connexion à Weaviate
         auth_config = (
@@ -55,12 +500,72 @@ class VectorStore:
         # Vérification de la classe Concept
         self._ensure_schema_exists()
 
+        if self._use_local_index:
+            self._load_local_index()
+
+    def _create_encoder(
+        self, model_name: str, encoder_backend: str, enable_fp16: bool = False
+    ) -> Any:
+        """
+        Crée l'encodeur de texte selon le moteur demandé. Sur GPU, le modèle
+        SentenceTransformer est toujours préféré au moteur ONNX (CPU); le moteur
+        réellement utilisé est reporté dans ``self.encoder_backend``.
+
+        Args:
+            model_name (str): Nom du modèle SentenceTransformer
+            encoder_backend (str): Moteur d'encodage
+            enable_fp16 (bool, optional): Sur GPU, encoder en FP16 avec un modèle compilé. Par défaut à False.
+
+        Returns:
+            Any: Objet exposant la méthode ``encode`` de SentenceTransformer
+        """
+        use_cuda = torch.cuda.is_available()
+
+        if encoder_backend.startswith("onnx") and not use_cuda:
+            if ORTModelForFeatureExtraction is None:
+                self.logger.warning(
+                    "optimum[onnxruntime] n'est pas installé, utilisation de SentenceTransformer"
+                )
+            else:
+                try:
+                    return _OnnxEncoder(
+                        model_name, quantize=encoder_backend == "onnx-int8"
+                    )
+                except Exception as e:
+                    self.logger.warning(
+                        f"Impossible de charger le modèle ONNX ({e}), utilisation de SentenceTransformer"
+                    )
+
+        try:
+            encoder = SentenceTransformer(model_name)
+        except Exception as e:
+            self.logger.error(
+                f"Erreur lors de l'initialisation du modèle d'embedding: {e}"
+            )
+            raise
+
+        self.encoder_backend = "sentence-transformers"
+        if use_cuda:
+            encoder = encoder.to("cuda")
+            if enable_fp16:
+                # Les embeddings produits restent convertis en float32 par
+                # _to_cached_array avant d'être mis en cache ou envoyés à Weaviate
+                encoder = encoder.half()
+                transformer = encoder._first_module()
+                # Mode par défaut: "reduce-overhead" (graphes CUDA) n'est pas
+                # sûr avec des encodages concurrents et des longueurs variables
+                transformer.auto_model = torch.compile(transformer.auto_model)
+                self.encoder_backend = "sentence-transformers-fp16"
+
+        return encoder
+
     def _ensure_schema_exists(self):
         """S'assure que le schéma nécessaire existe dans Weaviate."""
         concept_class = {
             "class": "Concept",
             "description": "Un concept de connaissances",
             "vectorizer": "none",  # Nous fournissons nos propres vecteurs
+            "vectorIndexConfig": self.VECTOR_INDEX_CONFIG,
             "properties": [
                 {
                     "name": "concept_id",
@@ -93,17 +598,33 @@ class VectorStore:
         try:
             # Vérifier si la classe existe déjà
             schema = self.client.schema.get()
-            existing_classes = (
-                [c["class"] for c in schema["classes"]] if "classes" in schema else []
-            )
+            existing_classes = {c["class"]: c for c in schema.get("classes") or []}
 
             if "Concept" not in existing_classes:
                 self.client.schema.create_class(concept_class)
                 self.logger.info("Classe 'Concept' créée dans Weaviate")
+                return
         except WeaviateException as e:
             self.logger.error(f"Erreur lors de la création du schéma: {e}")
             raise
 
+        # La stratégie de filtrage est modifiable sur une classe existante
+        index_config = existing_classes["Concept"].get("vectorIndexConfig") or {}
+        if (
+            index_config.get("filterStrategy")
+            == self.VECTOR_INDEX_CONFIG["filterStrategy"]
+        ):
+            return
+
+        try:
+            self.client.schema.update_config(
+                "Concept", {"vectorIndexConfig": self.VECTOR_INDEX_CONFIG}
+            )
+        except Exception as e:
+            self.logger.warning(
+                f"Impossible d'activer le filtrage ACORN sur la classe 'Concept': {e}"
+            )
+
     def add_concept(
         self,
         concept_id: str,
@@ -111,7 +632,7 @@ class VectorStore:
         description: str,
         category: str = "general",
         source: str = "manual",
-        custom_embedding: Optional[List[float]] = None,
+        custom_embedding: Optional[Union[List[float], np.ndarray]] = None,
     ) -> bool:
         """
         Ajoute un concept au stockage vectoriel.
@@ -122,7 +643,7 @@ class VectorStore:
             description (str): Description du concept
             category (str, optional): Catégorie du concept. Par défaut à "general".
             source (str, optional): Source du concept. Par défaut à "manual".
-            custom_embedding (Optional[List[float]], optional): Embedding personnalisé.
+            custom_embedding (Optional[Union[List[float], np.ndarray]], optional): Embedding personnalisé.
 
         Returns:
             bool: True si le concept a été ajouté avec succès
@@ -130,47 +651,189 @@ class VectorStore:
         try:
             # Générer l'embedding à partir du nom et de la description
             if custom_embedding is None:
-                text_to_encode = f"{name}: {description}"
-                embedding = self.encoder.encode(text_to_encode).tolist()
+                embedding = self.get_embedding(f"{name}: {description}")
+                if embedding is None:
+                    return False
             else:
-                embedding = custom_embedding
+                embedding = np.asarray(custom_embedding, dtype=np.float32)
 
-            # Vérifier si le concept existe déjà
-            existing = (
-                self.client.query.get("Concept", ["concept_id"])
-                .with_where(
-                    {
-                        "path": ["concept_id"],
-                        "operator": "Equal",
-                        "valueString": concept_id,
-                    }
+            data_object = {
+                "concept_id": concept_id,
+                "name": name,
+                "description": description,
+                "category": category,
+                "source": source,
+            }
+
+            # Remplacer le concept s'il existe déjà (y compris sous un uuid
+            # aléatoire), sinon le créer sous son uuid déterministe
+            object_uuid = self._find_concept_uuid(concept_id)
+            created = False
+            if object_uuid is None:
+                object_uuid = self._concept_uuid(concept_id)
+                try:
+                    self.client.data_object.create(
+                        class_name="Concept",
+                        data_object=data_object,
+                        uuid=object_uuid,
+                        vector=embedding,
+                    )
+                    created = True
+                except ObjectAlreadyExistsException:
+                    pass
+
+            if not created:
+                self.client.data_object.replace(
+                    data_object, "Concept", object_uuid, vector=embedding
                 )
-                .do()
+            self._concept_uuids[concept_id] = object_uuid
+            self._index_locally(concept_id, embedding, data_object)
+            return True
+        except Exception as e:
+            self.logger.error(f"Erreur lors de l'ajout du concept vectoriel: {e}")
+            return False
+
+    def add_concepts(self, concepts: List[Dict[str, Any]]) -> bool:
+        """
+        Ajoute plusieurs concepts au stockage vectoriel en un seul import par lot.
+
+        Args:
+            concepts (List[Dict[str, Any]]): Concepts à ajouter, chacun avec les clés
+                "concept_id", "name", "description" et optionnellement "category",
+                "source" et "custom_embedding"
+
+        Returns:
+            bool: True si tous les concepts ont été ajoutés avec succès
+        """
+        if not concepts:
+            return True
+
+        try:
+            # Encoder en un seul appel les concepts sans embedding personnalisé
+            to_encode = [c for c in concepts if c.get("custom_embedding") is None]
+            encoded = self.get_embeddings(
+                [f"{c.get('name', '')}: {c.get('description', '')}" for c in to_encode]
             )
+            if any(embedding is None for embedding in encoded):
+                return False
+            embeddings = {id(c): embedding for c, embedding in zip(to_encode, encoded)}
 
-            # Supprimer le concept existant si nécessaire
-            if "data" in existing and existing["data"]["Get"]["Concept"]:
-                self.delete_concept(concept_id)
+            failed_uuids = set()
+            errors = []
 
-            # Ajouter le concept avec son embedding
-            self.client.data_object.create(
-                class_name="Concept",
-                data_object={
-                    "concept_id": concept_id,
-                    "name": name,
-                    "description": description,
-                    "category": category,
-                    "source": source,
-                },
-                vector=embedding,
+            def _collect_errors(results):
+                for item in results or []:
+                    item_errors = item.get("result", {}).get("errors")
+                    if item_errors:
+                        failed_uuids.add(item.get("id"))
+                        errors.append(item_errors)
+
+            self.client.batch.configure(
+                batch_size=self.IMPORT_BATCH_SIZE,
+                dynamic=True,
+                num_workers=self.IMPORT_WORKERS,
+                callback=_collect_errors,
             )
+            imported = []
+            with self.client.batch as batch:
+                for concept in concepts:
+                    embedding = concept.get("custom_embedding")
+                    if embedding is None:
+                        embedding = embeddings[id(concept)]
+                    else:
+                        embedding = np.asarray(embedding, dtype=np.float32)
+
+                    object_uuid = self._concept_uuid(concept["concept_id"])
+                    data_object = {
+                        "concept_id": concept["concept_id"],
+                        "name": concept.get("name", ""),
+                        "description": concept.get("description", ""),
+                        "category": concept.get("category", "general"),
+                        "source": concept.get("source", "manual"),
+                    }
+                    batch.add_data_object(
+                        data_object=data_object,
+                        class_name="Concept",
+                        uuid=object_uuid,
+                        vector=embedding,
+                    )
+                    imported.append((object_uuid, data_object, embedding))
+
+            # L'import par lot remplace les objets de même uuid; les versions
+            # stockées sous un uuid aléatoire (antérieures aux uuid
+            # déterministes) ne sont supprimées qu'une fois leur remplaçant importé
+            imported = [item for item in imported if item[0] not in failed_uuids]
+            self._delete_legacy_concepts(
+                [data_object["concept_id"] for _, data_object, _ in imported]
+            )
+
+            with self._concept_uuids_lock:
+                for object_uuid, data_object, _ in imported:
+                    self._concept_uuids[data_object["concept_id"]] = object_uuid
+            for _, data_object, embedding in imported:
+                self._index_locally(data_object["concept_id"], embedding, data_object)
+
+            if errors:
+                self.logger.error(
+                    f"Erreurs lors de l'import par lot des concepts vectoriels: {errors}"
+                )
+                return False
             return True
         except Exception as e:
-            self.logger.error(f"Erreur lors de l'ajout du concept vectoriel: {e}")
+            self.logger.error(
+                f"Erreur lors de l'ajout par lot des concepts vectoriels: {e}"
+            )
             return False
 
+    def _delete_legacy_concepts(self, concept_ids: List[str]) -> None:
+        """
+        Supprime les versions de concepts stockées sous un uuid aléatoire,
+        c'est-à-dire différent de leur uuid déterministe.
+
+        Args:
+            concept_ids (List[str]): IDs des concepts à nettoyer
+        """
+        if not concept_ids:
+            return
+
+        # Au plus une version héritée par concept en plus de la version courante
+        result = (
+            self.client.query.get("Concept", ["concept_id", "_additional {id}"])
+            .with_where(self._concept_ids_filter(concept_ids))
+            .with_limit(2 * len(concept_ids))
+            .do()
+        )
+        legacy_uuids = [
+            concept["_additional"]["id"]
+            for concept in (result.get("data") or {}).get("Get", {}).get("Concept")
+            or []
+            if concept["_additional"]["id"] != self._concept_uuid(concept["concept_id"])
+        ]
+        if legacy_uuids:
+            self.client.batch.delete_objects(
+                class_name="Concept",
+                where={
+                    "path": ["id"],
+                    "operator": "ContainsAny",
+                    "valueTextArray": legacy_uuids,
+                },
+            )
+
+    @staticmethod
+    def _concept_ids_filter(concept_ids: List[str]) -> Dict[str, Any]:
+        """Filtre Weaviate sélectionnant des concepts par leurs IDs."""
+        return {
+            "path": ["concept_id"],
+            "operator": "ContainsAny",
+            "valueStringArray": list(concept_ids),
+        }
+
     def search_similar(
-        self, query: str, limit: int = 5, category: Optional[str] = None
+        self,
+        query: str,
+        limit: int = 5,
+        category: Optional[str] = None,
+        fields: Tuple[str, ...] = CONCEPT_FIELDS,
     ) -> List[Dict[str, Any]]:
         """
         Recherche des concepts similaires à la requête.
@@ -179,42 +842,256 @@ class VectorStore:
             query (str): Texte de la requête
             limit (int, optional): Nombre maximum de résultats. Par défaut à 5.
             category (Optional[str], optional): Filtrer par catégorie. Par défaut à None.
+            fields (Tuple[str, ...], optional): Propriétés à récupérer. Par défaut toutes.
 
         Returns:
-            List[Dict[str, Any]]: Liste des concepts similaires
+            List[Dict[str, Any]]: Liste des concepts similaires, avec leur
+            certitude ("certainty")
         """
-        try:
-            # Générer l'embedding de la requête
-            query_embedding = self.encoder.encode(query).tolist()
+        # Générer l'embedding de la requête
+        query_embedding = self.get_embedding(query)
+        if query_embedding is None:
+            return []
 
-            # Construire la requête Weaviate
-            weaviate_query = (
-                self.client.query.get(
-                    "Concept",
-                    ["concept_id", "name", "description", "category", "source"],
-                )
-                .with_near_vector({"vector": query_embedding, "certainty": 0.7})
-                .with_limit(limit)
+        return self.search_similar_by_vector(
+            query_embedding, limit, category, fields=fields
+        )
+
+    def search_similar_batch(
+        self,
+        queries: List[str],
+        limit: int = 5,
+        category: Optional[str] = None,
+        fields: Tuple[str, ...] = CONCEPT_FIELDS,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Recherche des concepts similaires à plusieurs requêtes: les requêtes
+        sont encodées en un seul lot, puis recherchées en parallèle.
+
+        Args:
+            queries (List[str]): Textes des requêtes
+            limit (int, optional): Nombre maximum de résultats par requête. Par défaut à 5.
+            category (Optional[str], optional): Filtrer par catégorie. Par défaut à None.
+            fields (Tuple[str, ...], optional): Propriétés à récupérer. Par défaut toutes.
+
+        Returns:
+            List[List[Dict[str, Any]]]: Concepts similaires de chaque requête,
+            dans l'ordre des requêtes
+        """
+        if not queries:
+            return []
+
+        embeddings = self.get_embeddings(queries)
+
+        def _search(embedding: Optional[np.ndarray]) -> List[Dict[str, Any]]:
+            if embedding is None:
+                return []
+            return self.search_similar_by_vector(
+                embedding, limit, category, fields=fields
             )
 
-            # Ajouter un filtre par catégorie si spécifié
-            if category:
-                weaviate_query = weaviate_query.with_where(
-                    {"path": ["category"], "operator": "Equal", "valueString": category}
-                )
+        with ThreadPoolExecutor(
+            max_workers=min(self.SEARCH_WORKERS, len(queries))
+        ) as executor:
+            return list(executor.map(_search, embeddings))
 
-            result = weaviate_query.do()
+    def search_similar_by_vector(
+        self,
+        vector: np.ndarray,
+        limit: int = 5,
+        category: Optional[str] = None,
+        exclude_concept_id: Optional[str] = None,
+        fields: Tuple[str, ...] = CONCEPT_FIELDS,
+    ) -> List[Dict[str, Any]]:
+        """
+        Recherche des concepts similaires à un vecteur, sans encodage.
+
+        Args:
+            vector (np.ndarray): Vecteur de la requête
+            limit (int, optional): Nombre maximum de résultats. Par défaut à 5.
+            category (Optional[str], optional): Filtrer par catégorie. Par défaut à None.
+            exclude_concept_id (Optional[str], optional): Concept à exclure des résultats. Par défaut à None.
+            fields (Tuple[str, ...], optional): Propriétés à récupérer (la certitude est
+                toujours renvoyée). Par défaut toutes.
+
+        Returns:
+            List[Dict[str, Any]]: Liste des concepts similaires, avec leur
+            certitude ("certainty")
+        """
+        # Servir la recherche depuis l'index local s'il est chargé
+        if self._local_index is not None:
+            hits = self._local_index.search(
+                self._unit_vector(vector),
+                limit,
+                self.MIN_CERTAINTY,
+                category=category,
+                exclude_concept_id=exclude_concept_id,
+            )
+            if hits is not None:
+                return [
+                    {
+                        **{field: properties.get(field) for field in fields},
+                        "certainty": certainty,
+                    }
+                    for properties, certainty in hits
+                ]
+
+        try:
+            # Remplir le gabarit GraphQL de cette forme de requête (les
+            # chaînes JSON sont des littéraux GraphQL valides)
+            template = self._search_template(
+                tuple(fields), bool(category), bool(exclude_concept_id)
+            )
+            result = self.client.query.raw(
+                template
+                % {
+                    "vector": json.dumps(np.asarray(vector, dtype=np.float32).tolist()),
+                    "limit": int(limit),
+                    "category": json.dumps(category),
+                    "exclude": json.dumps(exclude_concept_id),
+                }
+            )
 
             # Extraire les résultats
             if "data" in result and "Get" in result["data"]:
-                concepts = result["data"]["Get"]["Concept"]
+                concepts = result["data"]["Get"]["Concept"] or []
+
+                # Remonter la certitude au niveau du concept
+                for concept in concepts:
+                    additional = concept.pop("_additional", None) or {}
+                    if additional.get("certainty") is not None:
+                        concept["certainty"] = additional["certainty"]
+
                 return concepts
             return []
         except Exception as e:
             self.logger.error(f"Erreur lors de la recherche vectorielle: {e}")
             return []
 
-    def get_embedding(self, text: str) -> List[float]:
+    def _search_template(
+        self, fields: Tuple[str, ...], has_category: bool, has_exclusion: bool
+    ) -> str:
+        """
+        Construit (une seule fois par forme de requête) le gabarit GraphQL
+        d'une recherche vectorielle, à remplir par formatage ``%``.
+
+        Args:
+            fields (Tuple[str, ...]): Propriétés à récupérer
+            has_category (bool): Filtrer par catégorie
+            has_exclusion (bool): Exclure un concept
+
+        Returns:
+            str: Requête GraphQL avec les emplacements vector, limit, category et exclude
+        """
+        key = (fields, has_category, has_exclusion)
+        template = self._search_templates.get(key)
+        if template is not None:
+            return template
+
+        operands = []
+        if has_category:
+            operands.append(
+                '{path:["category"] operator:Equal valueString:%(category)s}'
+            )
+        if has_exclusion:
+            operands.append(
+                '{path:["concept_id"] operator:NotEqual valueString:%(exclude)s}'
+            )
+
+        if len(operands) == 1:
+            where = f" where:{operands[0]}"
+        elif operands:
+            where = f" where:{{operator:And operands:[{' '.join(operands)}]}}"
+        else:
+            where = ""
+
+        template = (
+            "{Get{Concept(nearVector:{vector:%(vector)s"
+            f" certainty:{self.MIN_CERTAINTY}}}"
+            f" limit:%(limit)d{where})"
+            f"{{{' '.join(fields)} _additional{{certainty}}}}}}}}"
+        )
+        self._search_templates[key] = template
+        return template
+
+    def get_embeddings_bulk(self, concept_ids: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Récupère en une seule requête les vecteurs stockés de plusieurs concepts.
+
+        Args:
+            concept_ids (List[str]): IDs des concepts
+
+        Returns:
+            Dict[str, np.ndarray]: Vecteurs (float32) des concepts trouvés, indexés par ID
+        """
+        if not concept_ids:
+            return {}
+
+        try:
+            result = (
+                self.client.query.get("Concept", ["concept_id", "_additional {vector}"])
+                .with_where(self._concept_ids_filter(concept_ids))
+                .with_limit(len(concept_ids))
+                .do()
+            )
+
+            if "data" in result and "Get" in result["data"]:
+                return {
+                    concept["concept_id"]: np.asarray(
+                        concept["_additional"]["vector"], dtype=np.float32
+                    )
+                    for concept in result["data"]["Get"]["Concept"] or []
+                    if concept.get("_additional", {}).get("vector")
+                }
+
+            return {}
+        except Exception as e:
+            self.logger.error(f"Erreur lors de la récupération des vecteurs: {e}")
+            return {}
+
+    def range_search(
+        self, embedding: np.ndarray, threshold: float, limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """
+        Recherche, via l'index vectoriel de Weaviate, les concepts dont la
+        similarité cosinus avec un embedding atteint un seuil.
+
+        Args:
+            embedding (np.ndarray): Embedding de référence
+            threshold (float): Similarité cosinus minimale
+            limit (int, optional): Nombre maximum de résultats. Par défaut à 100.
+
+        Returns:
+            List[Dict[str, Any]]: Concepts trouvés, avec les clés "concept_id"
+            et "similarity"
+        """
+        try:
+            # Avec la métrique cosinus, la distance Weaviate vaut 1 - cos
+            result = (
+                self.client.query.get(
+                    "Concept", ["concept_id", "_additional {distance}"]
+                )
+                .with_near_vector(
+                    {"vector": embedding.tolist(), "distance": 1.0 - threshold}
+                )
+                .with_limit(limit)
+                .do()
+            )
+
+            if "data" in result and "Get" in result["data"]:
+                return [
+                    {
+                        "concept_id": concept["concept_id"],
+                        "similarity": 1.0 - concept["_additional"]["distance"],
+                    }
+                    for concept in result["data"]["Get"]["Concept"] or []
+                ]
+            return []
+        except Exception as e:
+            self.logger.error(f"Erreur lors de la recherche par rayon: {e}")
+            return []
+
+    def get_embedding(self, text: str) -> Optional[np.ndarray]:
         """
         Génère l'embedding d'un texte.
 
@@ -222,26 +1099,182 @@ class VectorStore:
             text (str): Texte à encoder
 
         Returns:
-            List[float]: Vecteur d'embedding
+            Optional[np.ndarray]: Vecteur d'embedding contigu (float32, norme 1,
+            lecture seule) ou None en cas d'erreur
         """
+        cached = self._embedding_cache.get(text)
+        if cached is not None:
+            return cached
+
         try:
-            return self.encoder.encode(text).tolist()
+            embedding = self._to_cached_array(
+                self.encoder.encode(text, normalize_embeddings=True)
+            )
         except Exception as e:
             self.logger.error(f"Erreur lors de la génération de l'embedding: {e}")
-            return []
+            return None
 
-    def delete_concept(self, concept_id: str) -> bool:
+        self._embedding_cache.put(text, embedding)
+        return embedding
+
+    def get_embeddings(self, texts: List[str]) -> List[Optional[np.ndarray]]:
         """
-        Supprime un concept du stockage vectoriel.
+        Génère les embeddings de plusieurs textes: ceux absents du cache sont
+        encodés en un seul lot (l'encodeur les trie par longueur pour limiter
+        le remplissage).
 
         Args:
-            concept_id (str): Identifiant du concept à supprimer
+            texts (List[str]): Textes à encoder
 
         Returns:
-            bool: True si le concept a été supprimé avec succès
+            List[Optional[np.ndarray]]: Embeddings (float32, norme 1, lecture
+            seule) dans l'ordre des textes, None en cas d'erreur
+        """
+        embeddings = {text: self._embedding_cache.get(text) for text in texts}
+        missing = [text for text, embedding in embeddings.items() if embedding is None]
+
+        if missing:
+            try:
+                encoded = self.encoder.encode(
+                    missing,
+                    batch_size=64,
+                    show_progress_bar=False,
+                    normalize_embeddings=True,
+                )
+            except Exception as e:
+                self.logger.error(f"Erreur lors de la génération des embeddings: {e}")
+                encoded = []
+
+            for text, embedding in zip(missing, encoded):
+                embeddings[text] = self._to_cached_array(embedding)
+                self._embedding_cache.put(text, embeddings[text])
+
+        return [embeddings[text] for text in texts]
+
+    def warmup(self, queries: List[str]) -> None:
+        """
+        Pré-remplit le cache d'embeddings en encodant en un seul lot les
+        requêtes fréquentes qui n'y sont pas encore.
+
+        Args:
+            queries (List[str]): Requêtes à pré-encoder
+        """
+        self.get_embeddings(queries)
+
+    @staticmethod
+    def _to_cached_array(embedding: Any) -> np.ndarray:
+        """Convertit un embedding en tableau float32 contigu en lecture seule."""
+        array = np.array(embedding, dtype=np.float32, order="C")
+        array.setflags(write=False)
+        return array
+
+    def _scan_concepts(self, properties: List[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourt toute la classe Concept page par page avec un curseur.
+
+        Args:
+            properties (List[str]): Propriétés à récupérer (doivent inclure "_additional {id ...}")
+
+        Returns:
+            Iterator[Dict[str, Any]]: Concepts, page après page
+        """
+        after = None
+        while True:
+            query = self.client.query.get("Concept", properties).with_limit(
+                self.UUID_SCAN_PAGE_SIZE
+            )
+            if after is not None:
+                query = query.with_after(after)
+
+            result = query.do()
+            page = (result.get("data") or {}).get("Get", {}).get("Concept") or []
+
+            # Curseur lu avant de céder la page (l'appelant peut la modifier)
+            last_page = len(page) < self.UUID_SCAN_PAGE_SIZE
+            if not last_page:
+                after = page[-1]["_additional"]["id"]
+
+            yield from page
+            if last_page:
+                return
+
+    def _load_local_index(self) -> None:
+        """
+        Charge l'index HNSW local et la table concept_id -> uuid en un seul
+        parcours de la classe Concept. En cas d'échec, l'index local est
+        désactivé et les recherches passent par Weaviate.
         """
         try:
-            # Rechercher l'objet à supprimer
+            with self._concept_uuids_lock:
+                for concept in self._scan_concepts(
+                    [*self.CONCEPT_FIELDS, "_additional {id vector}"]
+                ):
+                    additional = concept.pop("_additional")
+                    self._concept_uuids.setdefault(
+                        concept["concept_id"], additional["id"]
+                    )
+                    if additional.get("vector"):
+                        self._index_locally(
+                            concept["concept_id"], additional["vector"], concept
+                        )
+
+            self.logger.info(
+                f"Index local chargé: {len(self._local_index or ())} concepts"
+            )
+        except Exception as e:
+            self.logger.error(f"Erreur lors du chargement de l'index local: {e}")
+            self._use_local_index = False
+            self._local_index = None
+
+    def _index_locally(
+        self, concept_id: str, vector: Any, properties: Dict[str, Any]
+    ) -> None:
+        """
+        Reporte un concept dans l'index local, s'il est activé.
+
+        Args:
+            concept_id (str): Identifiant du concept
+            vector (Any): Vecteur du concept
+            properties (Dict[str, Any]): Propriétés du concept
+        """
+        if not self._use_local_index:
+            return
+
+        vector = self._unit_vector(vector)
+        if self._local_index is None:
+            self._local_index = _LocalIndex(dim=vector.shape[0])
+        self._local_index.add(concept_id, vector, properties)
+
+    @staticmethod
+    def _unit_vector(vector: Any) -> np.ndarray:
+        """Convertit un vecteur en tableau float32 de norme 1."""
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    @staticmethod
+    def _concept_uuid(concept_id: str) -> str:
+        """uuid déterministe (uuid5) de l'objet Weaviate d'un concept."""
+        return str(uuid.uuid5(uuid.NAMESPACE_URL, f"concept/{concept_id}"))
+
+    def _find_concept_uuid(self, concept_id: str) -> Optional[str]:
+        """
+        Retrouve l'uuid Weaviate d'un concept: celui de la table en mémoire,
+        sinon son uuid déterministe s'il existe, sinon celui d'un objet importé
+        sous un uuid aléatoire (requête filtrée sur concept_id).
+
+        Args:
+            concept_id (str): Identifiant du concept
+
+        Returns:
+            Optional[str]: uuid de l'objet ou None si le concept n'existe pas
+        """
+        object_uuid = self._concept_uuids.get(concept_id)
+        if object_uuid is not None:
+            return object_uuid
+
+        object_uuid = self._concept_uuid(concept_id)
+        if not self.client.data_object.exists(object_uuid, class_name="Concept"):
             result = (
                 self.client.query.get("Concept", ["_additional {id}"])
                 .with_where(
@@ -251,58 +1284,127 @@ class VectorStore:
                         "valueString": concept_id,
                     }
                 )
+                .with_limit(1)
                 .do()
             )
+            page = (result.get("data") or {}).get("Get", {}).get("Concept") or []
+            if not page:
+                return None
+            object_uuid = page[0]["_additional"]["id"]
 
-            # Supprimer l'objet s'il existe
-            if (
-                "data" in result
-                and "Get" in result["data"]
-                and result["data"]["Get"]["Concept"]
-            ):
-                uuid = result["data"]["Get"]["Concept"][0]["_additional"]["id"]
-                self.client.data_object.delete(uuid, "Concept")
-                return True
+        with self._concept_uuids_lock:
+            self._concept_uuids[concept_id] = object_uuid
+        return object_uuid
+
+    def _resolve_concept_uuid(self, concept_id: str) -> str:
+        """
+        Retrouve l'uuid Weaviate d'un concept, ou son uuid déterministe s'il
+        n'existe pas.
+
+        Args:
+            concept_id (str): Identifiant du concept
 
+        Returns:
+            str: uuid de l'objet
+        """
+        return self._find_concept_uuid(concept_id) or self._concept_uuid(concept_id)
+
+    def delete_concept(self, concept_id: str) -> bool:
+        """
+        Supprime un concept du stockage vectoriel.
+
+        Args:
+            concept_id (str): Identifiant du concept à supprimer
+
+        Returns:
+            bool: True si le concept a été supprimé avec succès
+        """
+        try:
+            object_uuid = self._resolve_concept_uuid(concept_id)
+            self.client.data_object.delete(object_uuid, "Concept")
+            with self._concept_uuids_lock:
+                self._concept_uuids.pop(concept_id, None)
+            if self._local_index is not None:
+                self._local_index.remove(concept_id)
+            return True
+        except UnexpectedStatusCodeException as e:
+            if e.status_code == 404:
+                return False
+            self.logger.error(f"Erreur lors de la suppression du concept: {e}")
             return False
         except Exception as e:
             self.logger.error(f"Erreur lors de la suppression du concept: {e}")
             return False
 
-    def get_concept(self, concept_id: str) -> Optional[Dict[str, Any]]:
+    def get_concept(
+        self, concept_id: str, include_vector: bool = False
+    ) -> Optional[Dict[str, Any]]:
         """
         Récupère un concept par son ID.
 
         Args:
             concept_id (str): ID du concept à récupérer
+            include_vector (bool, optional): Inclure le vecteur stocké (clé "vector"). Par défaut à False.
 
         Returns:
             Optional[Dict[str, Any]]: Données du concept ou None si non trouvé
         """
+        try:
+            object_uuid = self._resolve_concept_uuid(concept_id)
+            result = self.client.data_object.get_by_id(
+                object_uuid, class_name="Concept", with_vector=include_vector
+            )
+            if not result:
+                # Concept inexistant ou entrée périmée (objet supprimé par un
+                # autre processus)
+                with self._concept_uuids_lock:
+                    self._concept_uuids.pop(concept_id, None)
+                return None
+
+            properties = result.get("properties") or {}
+            concept = {
+                key: properties.get(key)
+                for key in ["concept_id", "name", "description", "category", "source"]
+            }
+            if include_vector and result.get("vector"):
+                concept["vector"] = np.asarray(result["vector"], dtype=np.float32)
+
+            return concept
+        except Exception as e:
+            self.logger.error(f"Erreur lors de la récupération du concept: {e}")
+            return None
+
+    def get_concepts_bulk(self, concept_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Récupère plusieurs concepts par leurs IDs en une seule requête.
+
+        Args:
+            concept_ids (List[str]): IDs des concepts à récupérer
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Données des concepts trouvés, indexées par ID
+        """
+        if not concept_ids:
+            return {}
+
         try:
             result = (
                 self.client.query.get(
                     "Concept",
                     ["concept_id", "name", "description", "category", "source"],
                 )
-                .with_where(
-                    {
-                        "path": ["concept_id"],
-                        "operator": "Equal",
-                        "valueString": concept_id,
-                    }
-                )
+                .with_where(self._concept_ids_filter(concept_ids))
+                .with_limit(len(concept_ids))
                 .do()
             )
 
-            if (
-                "data" in result
-                and "Get" in result["data"]
-                and result["data"]["Get"]["Concept"]
-            ):
-                return result["data"]["Get"]["Concept"][0]
+            if "data" in result and "Get" in result["data"]:
+                return {
+                    concept["concept_id"]: concept
+                    for concept in result["data"]["Get"]["Concept"] or []
+                }
 
-            return None
+            return {}
         except Exception as e:
-            self.logger.error(f"Erreur lors de la récupération du concept: {e}")
-            return None
+            self.logger.error(f"Erreur lors de la récupération des concepts: {e}")
+            return {}
@@ -1,10 +1,24 @@
 from typing import Dict, List, Any, Optional, Union, Tuple, Set
 import logging
+import sqlite3
 import threading
 import time
 import json
+import heapq
+import itertools
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from collections import deque
+
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    ScalableBloomFilter = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    orjson = None
 
 from ..knowledge.knowledge_graph import KnowledgeGraph
 from ..knowledge.vector_store import VectorStore
@@ -22,6 +36,16 @@ class ContinuousLearning:
     de façon asynchrone et continue.
     """
 
+    # Cache des recherches de lacunes: nombre d'entrées et durée de vie (secondes)
+    GAP_QUERY_CACHE_SIZE = 512
+    GAP_QUERY_CACHE_TTL = 3600.0
+    # Nombre de concepts existants recherchés pour une lacune
+    GAP_SEARCH_LIMIT = 5
+    # Filtre de Bloom des lacunes déjà identifiées: capacité initiale et taux
+    # de faux positifs (une lacune nouvelle ignorée sur 10 000)
+    GAP_FILTER_CAPACITY = 10000
+    GAP_FILTER_ERROR_RATE = 1e-4
+
     def __init__(
         self,
         knowledge_graph: KnowledgeGraph,
@@ -33,6 +57,8 @@ class ContinuousLearning:
         cross_domain_kg: Optional[CrossDomainKnowledgeGraph] = None,
         learning_interval: int = 3600,  # 1 heure par défaut
         max_pending_sources: int = 100,
+        gap_signatures_path: Optional[str] = None,
+        validation_interval: int = 21600,  # 6 heures par défaut
     ):
         """
         Initialise le service d'apprentissage continu.
@@ -47,6 +73,10 @@ class ContinuousLearning:
             cross_domain_kg (Optional[CrossDomainKnowledgeGraph], optional): Gestionnaire de graphe multi-domaines
             learning_interval (int, optional): Intervalle entre deux cycles d'apprentissage en secondes. Par défaut à 3600.
             max_pending_sources (int, optional): Nombre maximum de sources en attente. Par défaut à 100.
+            gap_signatures_path (Optional[str], optional): Fichier SQLite conservant les lacunes identifiées
+                entre deux redémarrages. Par défaut à None (lacunes gardées en mémoire uniquement).
+            validation_interval (int, optional): Intervalle minimal entre deux validations des connaissances
+                récentes en secondes. Par défaut à 21600.
         """
         self.logger = logging.getLogger(__name__)
         self.kg = knowledge_graph
@@ -67,23 +97,49 @@ class ContinuousLearning:
             knowledge_graph, vector_store, cross_domain_kg
         )
         self.knowledge_validation = knowledge_validation or KnowledgeValidation(
-            knowledge_graph, vector_store, self.semantic_search
+            knowledge_graph, vector_store
         )
 
         # Paramètres de configuration
         self.learning_interval = learning_interval
+        self.validation_interval = validation_interval
         self.max_pending_sources = max_pending_sources
 
-        # État interne
-        self.pending_sources = deque(maxlen=max_pending_sources)
-        self.learning_queue = deque(maxlen=max_pending_sources * 2)
-        self.identified_gaps = set()
-        self.learning_sessions = []
+        # État interne: files de priorité (tas d'entrées (-priorité, ordre
+        # d'arrivée, élément)), les plus prioritaires en tête
+        self.pending_sources: List[Tuple[int, int, Dict[str, Any]]] = []
+        self._pending_urls: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+        self.learning_queue: List[Tuple[int, int, Dict[str, Any]]] = []
+        self._queue_counter = itertools.count()
+        # Les files sont alimentées par les threads de l'API et consommées par
+        # la boucle d'apprentissage: les sections critiques se limitent aux
+        # opérations sur les tas, les extractions se font hors verrou
+        self._queue_lock = threading.RLock()
+        # Seule l'appartenance est testée: un filtre de Bloom extensible, si
+        # disponible, borne la mémoire quel que soit le nombre de lacunes
+        self.identified_gaps = (
+            ScalableBloomFilter(
+                initial_capacity=self.GAP_FILTER_CAPACITY,
+                error_rate=self.GAP_FILTER_ERROR_RATE,
+            )
+            if ScalableBloomFilter is not None
+            else set()
+        )
+        self._gap_db = self._open_gap_db(gap_signatures_path)
+        self._gap_db_lock = threading.Lock()
+        # Historique borné aux 100 derniers cycles, sérialisés en JSON à l'ajout
+        self.learning_sessions: deque = deque(maxlen=100)
+        # Cache LRU des recherches de lacunes: requête -> (horodatage, résultats)
+        self._gap_query_cache: OrderedDict = OrderedDict()
+        self._gap_query_lock = threading.Lock()
 
         # Contrôle du thread d'apprentissage
         self.is_learning_active = False
         self.learning_thread = None
+        self._stop_event = threading.Event()
         self.last_learning_cycle = None
+        self._last_cycle_monotonic: Optional[float] = None
+        self._last_validation_monotonic: Optional[float] = None
 
     def start_continuous_learning(self) -> bool:
         """
@@ -97,6 +153,7 @@ class ContinuousLearning:
             return False
 
         self.is_learning_active = True
+        self._stop_event.clear()
         self.learning_thread = threading.Thread(
             target=self._continuous_learning_loop,
             daemon=True,
@@ -121,6 +178,7 @@ class ContinuousLearning:
             return False
 
         self.is_learning_active = False
+        self._stop_event.set()
         if self.learning_thread and self.learning_thread.is_alive():
             self.learning_thread.join(timeout=5.0)
 
@@ -141,37 +199,81 @@ class ContinuousLearning:
         Returns:
             Dict[str, Any]: Résultat de l'ajout
         """
-        # Vérifier si l'URL est déjà dans la file d'attente
-        for source in self.pending_sources:
-            if source["url"] == source_url:
-                self.logger.info(f"Source déjà en file d'attente: {source_url}")
-                return {
-                    "status": "already_queued",
-                    "position": list(self.pending_sources).index(source) + 1,
-                    "total_queued": len(self.pending_sources),
+        return self.add_learning_sources(
+            [{"url": source_url, "priority": priority, "domain": domain}]
+        )[0]
+
+    def add_learning_sources(
+        self, sources: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Ajoute plusieurs sources d'apprentissage à la file d'attente, en une
+        seule prise du verrou des files (ingestion en rafale).
+
+        Args:
+            sources (List[Dict[str, Any]]): Sources à ajouter, chacune avec la clé "url"
+                et optionnellement "priority" (1-10, 1 par défaut) et "domain" ("general" par défaut)
+
+        Returns:
+            List[Dict[str, Any]]: Résultat de l'ajout de chaque source, dans l'ordre
+        """
+        added_at = datetime.now().isoformat()
+        results = []
+        urgent = False
+
+        with self._queue_lock:
+            for source in sources:
+                source_url = source["url"]
+                priority = source.get("priority", 1)
+
+                # Vérifier si l'URL est déjà dans la file d'attente
+                queued = self._pending_urls.get(source_url)
+                if queued is not None:
+                    self.logger.info(f"Source déjà en file d'attente: {source_url}")
+                    results.append(
+                        {
+                            "status": "already_queued",
+                            "position": self._queue_position(
+                                self.pending_sources, queued
+                            ),
+                            "total_queued": len(self.pending_sources),
+                        }
+                    )
+                    continue
+
+                # Ajouter à la file d'attente
+                source_item = {
+                    "url": source_url,
+                    "priority": max(1, min(10, priority)),  # Entre 1 et 10
+                    "domain": source.get("domain", "general"),
+                    "added_at": added_at,
+                    "status": "pending",
                 }
 
-        # Ajouter à la file d'attente
-        source_item = {
-            "url": source_url,
-            "priority": max(1, min(10, priority)),  # Entre 1 et 10
-            "domain": domain,
-            "added_at": datetime.now().isoformat(),
-            "status": "pending",
-        }
+                entry, evicted = self._push_bounded(
+                    self.pending_sources, source_item, self.max_pending_sources
+                )
+                if evicted is not None:
+                    self._pending_urls.pop(evicted["url"], None)
+                self._pending_urls[source_url] = entry
 
-        self.pending_sources.append(source_item)
+                results.append(
+                    {
+                        "status": "queued",
+                        "position": self._queue_position(self.pending_sources, entry),
+                        "total_queued": len(self.pending_sources),
+                        "estimated_processing_time": self._estimate_processing_time(
+                            priority
+                        ),
+                    }
+                )
+                urgent = urgent or priority >= 8
 
-        # Déclencher un cycle d'apprentissage immédiat si la priorité est élevée
-        if priority >= 8 and not self.is_learning_active:
+        # Déclencher un cycle d'apprentissage immédiat si une priorité est élevée
+        if urgent and not self.is_learning_active:
             self.start_continuous_learning()
 
-        return {
-            "status": "queued",
-            "position": len(self.pending_sources),
-            "total_queued": len(self.pending_sources),
-            "estimated_processing_time": self._estimate_processing_time(priority),
-        }
+        return results
 
     def add_knowledge_gap(
         self, topic: str, description: str, priority: int = 5
@@ -192,7 +294,7 @@ class ContinuousLearning:
         )
 
         # Ajouter à la liste des lacunes identifiées
-        self.identified_gaps.add(gap_id)
+        self._remember_gaps([gap_id])
 
         # Ajouter à la file d'apprentissage
         learning_item = {
@@ -205,7 +307,11 @@ class ContinuousLearning:
             "status": "pending",
         }
 
-        self.learning_queue.append(learning_item)
+        with self._queue_lock:
+            entry, _ = self._push_bounded(
+                self.learning_queue, learning_item, self.max_pending_sources * 2
+            )
+            position = self._queue_position(self.learning_queue, entry)
 
         # Déclencher un cycle d'apprentissage immédiat si priorité élevée
         if priority >= 8 and not self.is_learning_active:
@@ -214,7 +320,7 @@ class ContinuousLearning:
         return {
             "status": "registered",
             "gap_id": gap_id,
-            "queue_position": len(self.learning_queue),
+            "queue_position": position,
         }
 
     def process_conversation_history(
@@ -237,38 +343,59 @@ class ContinuousLearning:
             gaps
         )
 
-        # Ajouter les lacunes à la file d'apprentissage
-        added_gaps = []
+        # Retenir les nouvelles lacunes: dédoublonner d'abord les signatures du
+        # lot, puis tester une seule fois chacune contre les lacunes connues
+        candidates: Dict[str, Dict[str, Any]] = {}
         for gap in prioritized_gaps:
-            if gap.get("gap_signature") not in self.identified_gaps:
-                gap_id = self.knowledge_gaps_identifier.register_knowledge_gap(
-                    " ".join(gap.get("missing_concepts", [])),
-                    f"Lacune identifiée dans la conversation: {gap.get('question', '')}",
-                )
+            candidates.setdefault(gap.get("gap_signature"), gap)
+        identified_gaps = self.identified_gaps
+        new_gaps = {
+            signature: gap
+            for signature, gap in candidates.items()
+            if signature not in identified_gaps
+        }
 
-                self.identified_gaps.add(gap.get("gap_signature"))
-
-                # Ajouter à la file d'apprentissage
-                learning_item = {
-                    "type": "knowledge_gap",
-                    "gap_id": gap_id,
-                    "topic": " ".join(gap.get("missing_concepts", [])),
-                    "description": f"Lacune identifiée dans la conversation",
-                    "priority": min(
-                        7, int(gap.get("priority_score", 5) / 2)
-                    ),  # Conversion vers une échelle 1-10
-                    "added_at": datetime.now().isoformat(),
-                    "status": "pending",
-                    "source": "conversation",
-                }
+        # Enregistrer toutes les lacunes en une seule écriture dans le graphe
+        topics = [
+            " ".join(gap.get("missing_concepts", [])) for gap in new_gaps.values()
+        ]
+        gap_ids = self.knowledge_gaps_identifier.register_knowledge_gaps_batch(
+            topics,
+            [
+                f"Lacune identifiée dans la conversation: {gap.get('question', '')}"
+                for gap in new_gaps.values()
+            ],
+        )
+        self._remember_gaps(list(new_gaps))
 
-                self.learning_queue.append(learning_item)
-                added_gaps.append(gap_id)
+        # Ajouter les lacunes à la file d'apprentissage
+        added_at = datetime.now().isoformat()
+        learning_items = [
+            {
+                "type": "knowledge_gap",
+                "gap_id": gap_id,
+                "topic": topic,
+                "description": f"Lacune identifiée dans la conversation",
+                "priority": min(
+                    7, int(gap.get("priority_score", 5) / 2)
+                ),  # Conversion vers une échelle 1-10
+                "added_at": added_at,
+                "status": "pending",
+                "source": "conversation",
+            }
+            for gap, gap_id, topic in zip(new_gaps.values(), gap_ids, topics)
+        ]
+
+        with self._queue_lock:
+            for learning_item in learning_items:
+                self._push_bounded(
+                    self.learning_queue, learning_item, self.max_pending_sources * 2
+                )
 
         return {
             "gaps_identified": len(prioritized_gaps),
-            "gaps_added_to_learning": len(added_gaps),
-            "gap_ids": added_gaps,
+            "gaps_added_to_learning": len(gap_ids),
+            "gap_ids": gap_ids,
         }
 
     def trigger_learning_cycle(self) -> Dict[str, Any]:
@@ -284,8 +411,8 @@ class ContinuousLearning:
                 "last_cycle": self.last_learning_cycle,
             }
 
-        # Exécuter un cycle d'apprentissage
-        cycle_results = self._execute_learning_cycle()
+        # Exécuter un cycle d'apprentissage complet
+        cycle_results = self._execute_learning_cycle(force=True)
 
         return {
             "status": "completed",
@@ -311,6 +438,36 @@ class ContinuousLearning:
             ),
         }
 
+    def get_learning_sessions(self, limit: Optional[int] = None) -> bytes:
+        """
+        Obtient l'historique des cycles d'apprentissage, sans le réencoder.
+
+        Args:
+            limit (Optional[int], optional): Nombre maximum de cycles (les plus récents). Par défaut à None (tous).
+
+        Returns:
+            bytes: Tableau JSON (UTF-8) des cycles, du plus ancien au plus récent
+        """
+        sessions = list(self.learning_sessions)
+        if limit is not None:
+            sessions = sessions[-limit:] if limit > 0 else []
+        return b"[" + b",".join(sessions) + b"]"
+
+    @staticmethod
+    def _serialize_session(session: Dict[str, Any]) -> bytes:
+        """
+        Sérialise un cycle d'apprentissage en JSON (UTF-8).
+
+        Args:
+            session (Dict[str, Any]): Cycle à sérialiser
+
+        Returns:
+            bytes: Document JSON
+        """
+        if orjson is not None:
+            return orjson.dumps(session, default=str, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(session, ensure_ascii=False, default=str).encode("utf-8")
+
     def _continuous_learning_loop(self) -> None:
         """
         Boucle principale du processus d'apprentissage continu.
@@ -323,35 +480,42 @@ class ContinuousLearning:
                 cycle_results = self._execute_learning_cycle()
 
                 # Enregistrer les résultats
-                self.learning_sessions.append(
-                    {
-                        "timestamp": datetime.now().isoformat(),
-                        "results": cycle_results,
-                    }
-                )
-
-                # Limiter le nombre de sessions enregistrées
-                if len(self.learning_sessions) > 100:
-                    self.learning_sessions = self.learning_sessions[-100:]
+                if not cycle_results.get("skipped"):
+                    self.learning_sessions.append(
+                        self._serialize_session(
+                            {
+                                "timestamp": cycle_results["timestamp"],
+                                "results": cycle_results,
+                            }
+                        )
+                    )
 
-                # Attendre jusqu'au prochain cycle
-                time.sleep(self.learning_interval)
+                # Attendre jusqu'au prochain cycle (interrompu par un arrêt)
+                if self._stop_event.wait(self.learning_interval):
+                    break
 
             except Exception as e:
                 self.logger.error(f"Erreur dans la boucle d'apprentissage: {e}")
-                time.sleep(60)  # Attendre avant de réessayer
+                # Attendre avant de réessayer
+                if self._stop_event.wait(60):
+                    break
 
         self.logger.info("Fin de la boucle d'apprentissage continu")
 
-    def _execute_learning_cycle(self) -> Dict[str, Any]:
+    def _execute_learning_cycle(self, force: bool = False) -> Dict[str, Any]:
         """
-        Exécute un cycle complet d'apprentissage.
+        Exécute un cycle complet d'apprentissage. La validation des
+        connaissances récentes n'a lieu qu'une fois par `validation_interval`,
+        et un cycle sans rien à traiter est ignoré.
+
+        Args:
+            force (bool, optional): Exécuter toutes les phases, validation comprise. Par défaut à False.
 
         Returns:
-            Dict[str, Any]: Résultats du cycle
+            Dict[str, Any]: Résultats du cycle (clé "skipped" si ignoré)
         """
-        self.logger.info("Exécution d'un cycle d'apprentissage")
-        start_time = time.time()
+        start_time = time.monotonic()
+        cycle_timestamp = datetime.now().isoformat()
 
         # Métriques du cycle
         cycle_metrics = {
@@ -361,8 +525,52 @@ class ContinuousLearning:
             "validation_issues_fixed": 0,
         }
 
-        # 1. Traiter les sources en attente
-        sources_processed = self._process_pending_sources()
+        validation_due = (
+            force
+            or self._last_validation_monotonic is None
+            or start_time - self._last_validation_monotonic >= self.validation_interval
+        )
+
+        # Rien à traiter: éviter les requêtes au graphe et l'historique
+        if not self.pending_sources and not self.learning_queue and not validation_due:
+            self.logger.debug("Cycle d'apprentissage ignoré: aucune tâche en attente")
+            self._last_cycle_monotonic = start_time
+            return {
+                "timestamp": cycle_timestamp,
+                "duration": 0.0,
+                "metrics": cycle_metrics,
+                "skipped": True,
+            }
+
+        self.logger.info("Exécution d'un cycle d'apprentissage")
+
+        # Les trois phases sont indépendantes et dominées par les entrées/sorties
+        # (HTTP, Neo4j, Weaviate): on les exécute en parallèle. La validation
+        # porte sur les concepts déjà enregistrés; ceux ajoutés par ce cycle
+        # peuvent n'être validés qu'au cycle suivant.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            # 1. Traiter les sources en attente
+            sources_future = executor.submit(
+                self._process_pending_sources, cycle_timestamp
+            )
+            # 2. Traiter les lacunes de connaissances
+            gaps_future = executor.submit(self._address_knowledge_gaps, cycle_timestamp)
+            # 3. Valider les connaissances récemment ajoutées (si l'intervalle
+            # de validation est écoulé)
+            validation_future = (
+                executor.submit(self._validate_recent_knowledge)
+                if validation_due
+                else None
+            )
+
+            sources_processed = sources_future.result()
+            gaps_addressed = gaps_future.result()
+            if validation_future is not None:
+                validation_results = validation_future.result()
+                self._last_validation_monotonic = start_time
+            else:
+                validation_results = {"status": "not_due", "issues_fixed": 0}
+
         cycle_metrics["sources_processed"] = len(sources_processed)
 
         # Calculer le nombre total de concepts ajoutés
@@ -371,20 +579,16 @@ class ContinuousLearning:
         )
         cycle_metrics["concepts_added"] = concepts_added
 
-        # 2. Traiter les lacunes de connaissances
-        gaps_addressed = self._address_knowledge_gaps()
         cycle_metrics["knowledge_gaps_addressed"] = len(gaps_addressed)
-
-        # 3. Valider les connaissances récemment ajoutées
-        validation_results = self._validate_recent_knowledge()
         cycle_metrics["validation_issues_fixed"] = validation_results.get(
             "issues_fixed", 0
         )
 
         # Mettre à jour le timestamp du dernier cycle
+        self._last_cycle_monotonic = time.monotonic()
         self.last_learning_cycle = {
-            "timestamp": datetime.now().isoformat(),
-            "duration_seconds": time.time() - start_time,
+            "timestamp": cycle_timestamp,
+            "duration_seconds": self._last_cycle_monotonic - start_time,
             "metrics": cycle_metrics,
         }
 
@@ -402,46 +606,67 @@ class ContinuousLearning:
             "validation_results": validation_results,
         }
 
-    def _process_pending_sources(self) -> List[Dict[str, Any]]:
+    def _process_pending_sources(
+        self, processed_at: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
         Traite les sources d'information en attente.
 
+        Args:
+            processed_at (Optional[str], optional): Horodatage ISO du cycle. Par défaut à maintenant.
+
         Returns:
             List[Dict[str, Any]]: Sources traitées
         """
         if not self.pending_sources:
             return []
 
-        # Trier par priorité (décroissante)
-        sorted_sources = sorted(
-            self.pending_sources, key=lambda x: x.get("priority", 1), reverse=True
-        )
+        processed_at = processed_at or datetime.now().isoformat()
 
-        # Traiter un maximum de 5 sources par cycle
-        sources_to_process = sorted_sources[:5]
+        # Extraire les 5 sources les plus prioritaires (maximum par cycle)
+        with self._queue_lock:
+            entries = [
+                heapq.heappop(self.pending_sources)
+                for _ in range(min(5, len(self.pending_sources)))
+            ]
+        if not entries:
+            return []
         results = []
 
-        for source in sources_to_process:
-            try:
-                # Extraire les connaissances de l'URL
-                extraction_result = self.url_extractor.extract_from_url(
-                    url=source["url"],
-                    domain=source.get("domain", "general"),
+        # Les extractions sont dominées par le réseau: on les lance en
+        # parallèle, la file n'étant mise à jour que depuis ce thread
+        with ThreadPoolExecutor(max_workers=len(entries)) as executor:
+            futures = [
+                (
+                    entry,
+                    executor.submit(
+                        self.url_extractor.extract_from_url,
+                        url=entry[2]["url"],
+                        domain=entry[2].get("domain", "general"),
+                    ),
                 )
+                for entry in entries
+            ]
+
+        for entry, future in futures:
+            source = entry[2]
+            try:
+                # Récupérer les connaissances extraites de l'URL
+                extraction_result = future.result()
 
                 # Créer l'entrée de résultat
                 result = {
                     **source,
-                    "processed_at": datetime.now().isoformat(),
+                    "processed_at": processed_at,
                     "status": extraction_result.get("status", "error"),
                     "concepts_added": extraction_result.get("concepts_added", 0),
                 }
 
                 results.append(result)
 
-                # Retirer de la file d'attente
-                if source in self.pending_sources:
-                    self.pending_sources.remove(source)
+                # La source quitte définitivement la file d'attente
+                with self._queue_lock:
+                    self._pending_urls.pop(source["url"], None)
 
             except Exception as e:
                 self.logger.error(
@@ -450,29 +675,38 @@ class ContinuousLearning:
                 # Marquer comme erreur mais conserver dans la file
                 source["status"] = "error"
                 source["error"] = str(e)
+                with self._queue_lock:
+                    heapq.heappush(self.pending_sources, entry)
                 results.append(source)
 
         return results
 
-    def _address_knowledge_gaps(self) -> List[Dict[str, Any]]:
+    def _address_knowledge_gaps(
+        self, processed_at: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
         Traite les lacunes de connaissances identifiées.
 
+        Args:
+            processed_at (Optional[str], optional): Horodatage ISO du cycle. Par défaut à maintenant.
+
         Returns:
             List[Dict[str, Any]]: Lacunes traitées
         """
         if not self.learning_queue:
             return []
 
-        # Trier par priorité (décroissante)
-        sorted_gaps = sorted(
-            self.learning_queue, key=lambda x: x.get("priority", 1), reverse=True
-        )
+        processed_at = processed_at or datetime.now().isoformat()
 
-        # Traiter un maximum de 3 lacunes par cycle
+        # Extraire les 3 lacunes les plus prioritaires (maximum par cycle)
+        with self._queue_lock:
+            entries = [
+                heapq.heappop(self.learning_queue)
+                for _ in range(min(3, len(self.learning_queue)))
+            ]
         gaps_to_process = [
             gap
-            for gap in sorted_gaps[:3]
+            for _, _, gap in entries
             if gap.get("type") == "knowledge_gap" and gap.get("status") == "pending"
         ]
 
@@ -492,17 +726,20 @@ class ContinuousLearning:
 
                 search_query = " ".join(search_terms[:2])
 
+                # Repérer les concepts déjà connus sur ce sujet
+                gap["known_concepts"] = [
+                    result["concept_id"]
+                    for result in self._search_gap_knowledge(search_query)
+                    if result.get("concept_id")
+                ]
+
                 # TODO: Implémenter l'acquisition de connaissance externe
                 # Cette partie pourrait être étendue pour utiliser des APIs externes,
                 # des modèles de langage, ou d'autres sources d'information
 
                 # Pour l'instant, marquer comme adressé
                 gap["status"] = "addressed"
-                gap["processed_at"] = datetime.now().isoformat()
-
-                # Retirer de la file d'apprentissage
-                if gap in self.learning_queue:
-                    self.learning_queue.remove(gap)
+                gap["processed_at"] = processed_at
 
                 results.append(gap)
 
@@ -523,37 +760,170 @@ class ContinuousLearning:
         Returns:
             Dict[str, Any]: Résultats de la validation
         """
-        # Obtenir les concepts récemment ajoutés (dernières 24h)
-        recent_concepts = self.kg.get_recent_concepts(hours=24, limit=50)
+        # Obtenir les IDs des concepts récemment ajoutés (dernières 24h)
+        recent_concept_ids = self.kg.get_recent_concept_ids(hours=24, limit=50)
 
-        if not recent_concepts:
+        if not recent_concept_ids:
             return {"status": "no_recent_concepts", "issues_fixed": 0}
 
         # Exécuter la validation
         validation_results = self.knowledge_validation.validate_concepts(
-            [concept.get("id") for concept in recent_concepts]
+            recent_concept_ids
         )
+        issues = validation_results.get("issues", [])
 
-        # Corriger les problèmes détectés
+        # Corriger en un seul lot les problèmes corrigeables automatiquement
         issues_fixed = 0
-        if validation_results.get("issues"):
-            for issue in validation_results.get("issues", []):
-                if issue.get("auto_fixable", False):
-                    try:
-                        self.knowledge_validation.fix_issue(issue.get("issue_id"))
-                        issues_fixed += 1
-                    except Exception as e:
-                        self.logger.error(
-                            f"Erreur lors de la correction de l'issue {issue.get('issue_id')}: {e}"
-                        )
+        auto_fixable = [issue for issue in issues if issue.get("auto_fixable", False)]
+        if auto_fixable:
+            try:
+                fix_results = self.knowledge_validation.fix_issues(
+                    auto_fixable, auto_fix=True
+                )
+                issues_fixed = len(fix_results.get("fixed", []))
+            except Exception as e:
+                self.logger.error(f"Erreur lors de la correction des problèmes: {e}")
 
         return {
             "status": "completed",
-            "concepts_validated": len(recent_concepts),
-            "issues_found": len(validation_results.get("issues", [])),
+            "concepts_validated": len(recent_concept_ids),
+            "issues_found": len(issues),
             "issues_fixed": issues_fixed,
         }
 
+    def _search_gap_knowledge(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Recherche les concepts existants liés à une lacune. Les résultats sont
+        mis en cache par requête normalisée, les mêmes sujets revenant souvent
+        d'un cycle à l'autre.
+
+        Args:
+            query (str): Requête synthétisée pour la lacune
+
+        Returns:
+            List[Dict[str, Any]]: Concepts similaires ("concept_id", "name", "certainty")
+        """
+        key = " ".join(query.lower().split())
+        now = time.monotonic()
+
+        with self._gap_query_lock:
+            entry = self._gap_query_cache.get(key)
+            if entry is not None and now - entry[0] <= self.GAP_QUERY_CACHE_TTL:
+                self._gap_query_cache.move_to_end(key)
+                return entry[1]
+
+        results = self.vs.search_similar(
+            key, self.GAP_SEARCH_LIMIT, fields=("concept_id", "name")
+        )
+
+        with self._gap_query_lock:
+            self._gap_query_cache[key] = (now, results)
+            self._gap_query_cache.move_to_end(key)
+            while len(self._gap_query_cache) > self.GAP_QUERY_CACHE_SIZE:
+                self._gap_query_cache.popitem(last=False)
+
+        return results
+
+    def _open_gap_db(self, path: Optional[str]) -> Optional[sqlite3.Connection]:
+        """
+        Ouvre le fichier des lacunes identifiées et recharge son contenu.
+
+        Args:
+            path (Optional[str]): Chemin du fichier SQLite (None pour désactiver)
+
+        Returns:
+            Optional[sqlite3.Connection]: Connexion ouverte ou None
+        """
+        if not path:
+            return None
+
+        try:
+            connection = sqlite3.connect(
+                path, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("CREATE TABLE IF NOT EXISTS gaps (sig TEXT PRIMARY KEY)")
+            for (signature,) in connection.execute("SELECT sig FROM gaps"):
+                self.identified_gaps.add(signature)
+            return connection
+        except sqlite3.Error as e:
+            self.logger.error(
+                f"Erreur lors de l'ouverture du fichier des lacunes {path}: {e}"
+            )
+            return None
+
+    def _remember_gaps(self, signatures: List[str]) -> None:
+        """
+        Marque des lacunes comme identifiées, et les enregistre sur disque si
+        la persistance est activée.
+
+        Args:
+            signatures (List[str]): Signatures ou identifiants des lacunes
+        """
+        for signature in signatures:
+            self.identified_gaps.add(signature)
+
+        if self._gap_db is None or not signatures:
+            return
+
+        try:
+            with self._gap_db_lock:
+                self._gap_db.executemany(
+                    "INSERT OR IGNORE INTO gaps VALUES (?)",
+                    [(signature,) for signature in signatures],
+                )
+        except sqlite3.Error as e:
+            self.logger.error(f"Erreur lors de l'enregistrement des lacunes: {e}")
+
+    def _push_bounded(
+        self,
+        queue: List[Tuple[int, int, Dict[str, Any]]],
+        item: Dict[str, Any],
+        max_size: int,
+    ) -> Tuple[Tuple[int, int, Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Ajoute un élément à une file de priorité bornée. Lorsque la file est
+        pleine, l'élément le moins prioritaire (le plus ancien à priorité égale)
+        est évincé.
+
+        Args:
+            queue (List[Tuple[int, int, Dict[str, Any]]]): Tas de la file
+            item (Dict[str, Any]): Élément à ajouter (clé "priority")
+            max_size (int): Taille maximale de la file
+
+        Returns:
+            Tuple[Tuple[int, int, Dict[str, Any]], Optional[Dict[str, Any]]]: Entrée
+            ajoutée et élément évincé (ou None)
+        """
+        evicted = None
+        if queue and len(queue) >= max_size:
+            worst = min(range(len(queue)), key=lambda i: (-queue[i][0], queue[i][1]))
+            evicted = queue[worst][2]
+            queue[worst] = queue[-1]
+            queue.pop()
+            heapq.heapify(queue)
+
+        entry = (-item.get("priority", 1), next(self._queue_counter), item)
+        heapq.heappush(queue, entry)
+        return entry, evicted
+
+    @staticmethod
+    def _queue_position(
+        queue: List[Tuple[int, int, Dict[str, Any]]],
+        entry: Tuple[int, int, Dict[str, Any]],
+    ) -> int:
+        """
+        Calcule le rang de traitement (à partir de 1) d'une entrée d'une file de priorité.
+
+        Args:
+            queue (List[Tuple[int, int, Dict[str, Any]]]): Tas de la file
+            entry (Tuple[int, int, Dict[str, Any]]): Entrée de la file
+
+        Returns:
+            int: Position de l'entrée dans l'ordre de traitement
+        """
+        return 1 + sum(1 for other in queue if other[:2] < entry[:2])
+
     def _estimate_processing_time(self, priority: int) -> int:
         """
         Estime le temps de traitement d'une source en fonction de sa priorité.
@@ -584,12 +954,12 @@ class ContinuousLearning:
         Returns:
             int: Temps restant en secondes
         """
-        if not self.last_learning_cycle:
+        if self._last_cycle_monotonic is None:
             return 0
 
-        # Calculer le temps écoulé depuis le dernier cycle
-        last_cycle_time = datetime.fromisoformat(self.last_learning_cycle["timestamp"])
-        elapsed = (datetime.now() - last_cycle_time).total_seconds()
+        # Calculer le temps écoulé depuis le dernier cycle (horloge monotone,
+        # insensible aux changements de l'heure système)
+        elapsed = time.monotonic() - self._last_cycle_monotonic
 
         # Temps restant
         remaining = max(0, self.learning_interval - elapsed)
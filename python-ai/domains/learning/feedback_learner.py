@@ -1,10 +1,12 @@
 from typing import Dict, List, Any, Optional, Union, Tuple, Set
 import logging
-import json
-import time
 from datetime import datetime
-import hashlib
-from collections import defaultdict
+import itertools
+import threading
+import uuid
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 from ..knowledge.knowledge_graph import KnowledgeGraph
 from ..knowledge.vector_store import VectorStore
@@ -13,12 +15,72 @@ from ..knowledge.knowledge_validation import KnowledgeValidation
 from .knowledge_gaps_identifier import KnowledgeGapsIdentifier
 
 
+@dataclass(slots=True)
+class FeedbackRecord:
+    """Entrée compacte de l'historique des feedbacks."""
+
+    feedback_id: str
+    timestamp: str
+    type: str
+    status: str
+    payload: Dict[str, Any]  # Feedback tel que reçu
+    processing_result: Optional[Dict[str, Any]] = None
+    # Sorti de l'historique (ses statuts ne sont plus comptés)
+    evicted: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convertit l'entrée au format exposé par l'API.
+
+        Returns:
+            Dict[str, Any]: Feedback enrichi de son id, horodatage, statut et résultat
+        """
+        record = {
+            **self.payload,
+            "feedback_id": self.feedback_id,
+            "timestamp": self.timestamp,
+            "status": self.status,
+        }
+        if self.processing_result is not None:
+            record["processing_result"] = self.processing_result
+        return record
+
+
 class FeedbackLearner:
     """
     Service d'apprentissage par rétroaction.
     Analyse, traite et intègre divers types de feedback pour améliorer la base de connaissances.
     """
 
+    # Méthode de traitement par type de feedback (les autres types passent par
+    # _process_general_feedback)
+    FEEDBACK_HANDLERS = {
+        "correction": "_process_correction_feedback",
+        "relation": "_process_relation_feedback",
+        "question_answer": "_process_qa_feedback",
+        "content_relevance": "_process_relevance_feedback",
+    }
+    # Corrections appliquées dont les concepts sont revalidés après un lot
+    VALIDATED_CORRECTIONS = ("property_update", "relation_added")
+    # Mapping des relations inverses courantes
+    INVERSE_RELATIONS = {
+        "contains": "is_part_of",
+        "is_part_of": "contains",
+        "depends_on": "is_dependency_for",
+        "is_dependency_for": "depends_on",
+        "parent_of": "child_of",
+        "child_of": "parent_of",
+        "related_to": "related_to",  # Relation symétrique
+        "causes": "caused_by",
+        "caused_by": "causes",
+        "precedes": "follows",
+        "follows": "precedes",
+        "similar_to": "similar_to",  # Relation symétrique
+        "opposite_of": "opposite_of",  # Relation symétrique
+    }
+    # Nombre maximal de threads pour le traitement d'un lot de feedbacks
+    BATCH_MAX_WORKERS = 8
+
     def __init__(
         self,
         knowledge_graph: KnowledgeGraph,
@@ -50,7 +112,7 @@ class FeedbackLearner:
             vector_store, knowledge_graph
         )
         self.knowledge_validation = knowledge_validation or KnowledgeValidation(
-            knowledge_graph, vector_store, self.semantic_search
+            knowledge_graph, vector_store
         )
         self.knowledge_gaps_identifier = (
             knowledge_gaps_identifier
@@ -65,8 +127,14 @@ class FeedbackLearner:
 
         # État interne
         self.pending_feedback = []
-        self.feedback_history = []
-        self.correction_counters = defaultdict(int)
+        # Historique borné aux 1000 derniers feedbacks
+        self.feedback_history: deque[FeedbackRecord] = deque(maxlen=1000)
+        # Répartition de l'historique par type et par statut, tenue à jour à
+        # chaque ajout, éviction et changement de statut
+        self._type_counts: Counter = Counter()
+        self._status_counts: Counter = Counter()
+        # Compteurs de feedbacks concordants, par clé (type, éléments identifiants)
+        self.correction_counters: Dict[Tuple[str, ...], int] = defaultdict(int)
         self.learning_stats = {
             "feedback_processed": 0,
             "knowledge_corrected": 0,
@@ -74,91 +142,168 @@ class FeedbackLearner:
             "entities_added": 0,
             "low_confidence_rejected": 0,
         }
-
-    def process_feedback(self, feedback: Dict[str, Any]) -> Dict[str, Any]:
+        # Protège l'historique et les compteurs lors du traitement parallèle
+        # des lots
+        self._state_lock = threading.RLock()
+        # Concepts déjà chargés par le lot en cours, propres à chaque thread
+        # de traitement: les appels concurrents de process_feedback et les
+        # autres lots ne le voient pas
+        self._batch_state = threading.local()
+
+    def process_feedback(
+        self, feedback: Dict[str, Any], timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Traite un feedback et l'intègre dans la base de connaissances si pertinent.
 
         Args:
             feedback (Dict[str, Any]): Feedback à traiter
+            timestamp (Optional[str], optional): Horodatage ISO du feedback. Par défaut à maintenant.
 
         Returns:
             Dict[str, Any]: Résultat du traitement
         """
-        feedback_id = self._generate_feedback_id(feedback)
-
-        # Ajouter timestamp et id
-        processed_feedback = {
-            **feedback,
-            "feedback_id": feedback_id,
-            "timestamp": datetime.now().isoformat(),
-            "status": "pending",
-        }
-
-        # Stocker dans l'historique
-        self.feedback_history.append(processed_feedback)
-
-        # Limiter la taille de l'historique
-        if len(self.feedback_history) > 1000:
-            self.feedback_history = self.feedback_history[-1000:]
-
         # Analyser le type de feedback
         feedback_type = feedback.get("type", "general")
 
-        # Traiter selon le type
-        if feedback_type == "correction":
-            result = self._process_correction_feedback(processed_feedback)
-        elif feedback_type == "relation":
-            result = self._process_relation_feedback(processed_feedback)
-        elif feedback_type == "question_answer":
-            result = self._process_qa_feedback(processed_feedback)
-        elif feedback_type == "content_relevance":
-            result = self._process_relevance_feedback(processed_feedback)
-        else:
-            result = self._process_general_feedback(processed_feedback)
+        record = FeedbackRecord(
+            feedback_id=self._generate_feedback_id(feedback),
+            timestamp=timestamp or datetime.now().isoformat(),
+            type=feedback_type,
+            status="pending",
+            payload=feedback,
+        )
+
+        # Ajouter timestamp et id pour les traitements
+        processed_feedback = record.to_dict()
 
-        # Mettre à jour les statistiques
-        self.learning_stats["feedback_processed"] += 1
+        # Stocker dans l'historique (les plus anciens sont évincés)
+        with self._state_lock:
+            if len(self.feedback_history) == self.feedback_history.maxlen:
+                evicted = self.feedback_history[0]
+                evicted.evicted = True
+                self._type_counts[evicted.type] -= 1
+                self._status_counts[evicted.status] -= 1
+            self.feedback_history.append(record)
+            self._type_counts[feedback_type] += 1
+            self._status_counts["pending"] += 1
 
-        # Mettre à jour le statut du feedback
-        processed_feedback["status"] = result.get("status", "processed")
+        # Traiter selon le type
+        handler = getattr(
+            self,
+            self.FEEDBACK_HANDLERS.get(feedback_type, "_process_general_feedback"),
+        )
+        result = handler(processed_feedback)
+
+        # Mettre à jour les statistiques et le statut du feedback (un feedback
+        # évincé pendant son traitement a déjà été décompté)
+        with self._state_lock:
+            self.learning_stats["feedback_processed"] += 1
+            record.status = result.get("status", "processed")
+            if not record.evicted:
+                self._status_counts["pending"] -= 1
+                self._status_counts[record.status] += 1
+        record.processing_result = result
+
+        # Les feedbacks conservés pour analyse reflètent aussi le résultat
+        processed_feedback["status"] = record.status
         processed_feedback["processing_result"] = result
 
         return result
 
-    def process_batch_feedback(self, feedbacks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def process_batch_feedback(
+        self, feedbacks: List[Dict[str, Any]], *, return_detailed: bool = False
+    ) -> Dict[str, Any]:
         """
         Traite un lot de feedbacks.
 
         Args:
             feedbacks (List[Dict[str, Any]]): Liste des feedbacks à traiter
+            return_detailed (bool, optional): Inclure le résultat de chaque feedback. Par défaut à False.
 
         Returns:
             Dict[str, Any]: Résumé des résultats
         """
-        results = []
-        success_count = 0
-        rejected_count = 0
+        # Les feedbacks d'un lot partagent le même horodatage
+        timestamp = datetime.now().isoformat()
+
+        # Regrouper les feedbacks par concept: les feedbacks d'un même concept
+        # sont traités dans l'ordre (seuils de correction), les groupes en
+        # parallèle
+        partitions: Dict[Optional[str], List[int]] = defaultdict(list)
+        for index, feedback in enumerate(feedbacks):
+            partitions[feedback.get("concept_id") or feedback.get("source_id")].append(
+                index
+            )
+
+        # Résultats détaillés conservés uniquement sur demande
+        results: Optional[List[Dict[str, Any]]] = (
+            [{}] * len(feedbacks) if return_detailed else None
+        )
 
-        for feedback in feedbacks:
-            result = self.process_feedback(feedback)
-            results.append(result)
+        # Charger en une requête les concepts référencés par le lot
+        concept_ids = {
+            feedback[key]
+            for feedback in feedbacks
+            for key in ("concept_id", "source_id", "target_id")
+            if feedback.get(key)
+        }
+        concepts = self.kg.get_concepts(list(concept_ids))
 
-            if result.get("status") == "applied":
-                success_count += 1
-            elif result.get("status") == "rejected":
-                rejected_count += 1
+        def process_partition(indices: List[int]) -> Tuple[Counter, Set[str]]:
+            statuses: Counter = Counter()
+            touched: Set[str] = set()
+            # Cache actif dans ce thread le temps de la partition seulement
+            self._batch_state.concepts = concepts
+            try:
+                for index in indices:
+                    result = self.process_feedback(feedbacks[index], timestamp)
+                    statuses[result.get("status")] += 1
+                    # Retenir les concepts modifiés par le lot
+                    if (
+                        result.get("status") == "applied"
+                        and result.get("correction_type") in self.VALIDATED_CORRECTIONS
+                    ):
+                        touched.update(
+                            result[key]
+                            for key in ("concept_id", "source_id", "target_id")
+                            if result.get(key)
+                        )
+                    if results is not None:
+                        results[index] = result
+            finally:
+                self._batch_state.concepts = None
+            return statuses, touched
+
+        if len(partitions) > 1:
+            workers = min(self.BATCH_MAX_WORKERS, len(partitions))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                tallies = list(executor.map(process_partition, partitions.values()))
+        else:
+            tallies = [process_partition(indices) for indices in partitions.values()]
 
-        # Après avoir traité tous les feedbacks, exécuter la validation
-        self._validate_after_batch()
+        statuses: Counter = Counter()
+        touched_concepts: Set[str] = set()
+        for partition_statuses, partition_touched in tallies:
+            statuses.update(partition_statuses)
+            touched_concepts.update(partition_touched)
 
-        return {
+        # Après avoir traité tous les feedbacks, valider les concepts modifiés
+        if touched_concepts:
+            self._validate_after_batch(list(touched_concepts))
+
+        success_count = statuses["applied"]
+        rejected_count = statuses["rejected"]
+        summary = {
             "total_processed": len(feedbacks),
             "success_count": success_count,
             "rejected_count": rejected_count,
             "pending_count": len(feedbacks) - success_count - rejected_count,
-            "detailed_results": results,
         }
+        if results is not None:
+            summary["detailed_results"] = results
+
+        return summary
 
     def get_learning_statistics(self) -> Dict[str, Any]:
         """
@@ -167,27 +312,16 @@ class FeedbackLearner:
         Returns:
             Dict[str, Any]: Statistiques d'apprentissage
         """
-        # Agréger les types de feedback
-        feedback_types = {}
-        for fb in self.feedback_history:
-            fb_type = fb.get("type", "general")
-            feedback_types[fb_type] = feedback_types.get(fb_type, 0) + 1
-
-        # Compter les feedbacks par statut
-        status_counts = {}
-        for fb in self.feedback_history:
-            status = fb.get("status", "unknown")
-            status_counts[status] = status_counts.get(status, 0) + 1
-
-        # Construire les statistiques
-        stats = {
-            **self.learning_stats,
-            "total_feedback_received": len(self.feedback_history),
-            "feedback_by_type": feedback_types,
-            "feedback_by_status": status_counts,
-            "pending_feedback": len(self.pending_feedback),
-            "active_correction_counters": len(self.correction_counters),
-        }
+        # Construire les statistiques (compteurs sans les entrées à zéro)
+        with self._state_lock:
+            stats = {
+                **self.learning_stats,
+                "total_feedback_received": len(self.feedback_history),
+                "feedback_by_type": dict(+self._type_counts),
+                "feedback_by_status": dict(+self._status_counts),
+                "pending_feedback": len(self.pending_feedback),
+                "active_correction_counters": len(self.correction_counters),
+            }
 
         return stats
 
@@ -208,28 +342,21 @@ class FeedbackLearner:
         Returns:
             List[Dict[str, Any]]: Historique des feedbacks
         """
-        filtered_history = self.feedback_history
-
-        # Filtrer par type si spécifié
-        if feedback_type:
-            filtered_history = [
-                fb for fb in filtered_history if fb.get("type") == feedback_type
-            ]
+        # Filtrer par type et par statut si spécifiés. L'historique est rempli
+        # dans l'ordre chronologique: le parcourir à rebours donne directement
+        # les plus récents, sans tri
+        with self._state_lock:
+            filtered_history = (
+                record
+                for record in reversed(self.feedback_history)
+                if (not feedback_type or record.type == feedback_type)
+                and (not status or record.status == status)
+            )
 
-        # Filtrer par statut si spécifié
-        if status:
-            filtered_history = [
-                fb for fb in filtered_history if fb.get("status") == status
+            return [
+                record.to_dict() for record in itertools.islice(filtered_history, limit)
             ]
 
-        # Trier par timestamp décroissant (plus récent d'abord)
-        sorted_history = sorted(
-            filtered_history, key=lambda x: x.get("timestamp", ""), reverse=True
-        )
-
-        # Limiter le nombre de résultats
-        return sorted_history[:limit]
-
     def reset_learning_statistics(self) -> Dict[str, Any]:
         """
         Réinitialise les statistiques d'apprentissage.
@@ -237,21 +364,18 @@ class FeedbackLearner:
         Returns:
             Dict[str, Any]: Nouvelles statistiques (vides)
         """
-        # Sauvegarder les anciennes statistiques
-        old_stats = self.get_learning_statistics()
+        with self._state_lock:
+            # Sauvegarder les anciennes statistiques
+            old_stats = self.get_learning_statistics()
 
-        # Réinitialiser
-        self.learning_stats = {
-            "feedback_processed": 0,
-            "knowledge_corrected": 0,
-            "relations_added": 0,
-            "entities_added": 0,
-            "low_confidence_rejected": 0,
-        }
+            # Réinitialiser (mêmes clés, valeurs à zéro)
+            self.learning_stats = dict.fromkeys(self.learning_stats, 0)
 
+        # Seuls les compteurs d'apprentissage changent : l'historique, les
+        # feedbacks en attente et les compteurs de correction sont conservés
         return {
             "previous_stats": old_stats,
-            "current_stats": self.get_learning_statistics(),
+            "current_stats": {**old_stats, **self.learning_stats},
         }
 
     def _process_correction_feedback(self, feedback: Dict[str, Any]) -> Dict[str, Any]:
@@ -272,26 +396,15 @@ class FeedbackLearner:
         confidence = feedback.get("confidence", 0.5)
         source = feedback.get("source", "user_feedback")
 
-        # Vérifier les informations obligatoires
-        if not concept_id or not property_name or not correct_value:
-            return {
-                "status": "rejected",
-                "reason": "missing_required_fields",
-                "message": "concept_id, property et correct_value sont requis",
-            }
-
-        # Vérifier le seuil de confiance
-        if confidence < self.min_feedback_confidence:
-            self.learning_stats["low_confidence_rejected"] += 1
-            return {
-                "status": "rejected",
-                "reason": "low_confidence",
-                "confidence": confidence,
-                "min_threshold": self.min_feedback_confidence,
-            }
+        # Vérifier les informations obligatoires et le seuil de confiance
+        rejection = self._check_feedback(
+            feedback, ("concept_id", "property", "correct_value"), confidence
+        )
+        if rejection:
+            return rejection
 
         # Vérifier si le concept existe
-        concept = self.kg.get_concept(concept_id)
+        concept = self._get_concept(concept_id)
         if not concept:
             return {
                 "status": "rejected",
@@ -300,23 +413,28 @@ class FeedbackLearner:
             }
 
         # Générer une clé unique pour ce type de correction
-        correction_key = f"{concept_id}:{property_name}:{correct_value}"
+        correction_key = ("correction", concept_id, property_name, str(correct_value))
 
         # Incrémenter le compteur de correction
-        self.correction_counters[correction_key] += 1
+        count = self._increment_counter(correction_key)
 
         # Vérifier si le seuil de correction est atteint
-        if self.correction_counters[correction_key] >= self.correction_threshold:
+        if count >= self.correction_threshold:
             # Appliquer la correction
+            self._forget_concept(concept_id)
             try:
+                name = concept.get("name", "")
+                description = concept.get("description", "")
+                metadata = KnowledgeGraph.get_concept_metadata(concept)
+
                 if property_name == "description":
                     self.kg.update_concept_description(concept_id, correct_value)
                     # Mettre également à jour le vecteur
                     self.vs.update_concept(
                         concept_id=concept_id,
-                        name=concept.get("name", ""),
+                        name=name,
                         description=correct_value,
-                        metadata=concept.get("metadata", {}),
+                        metadata=metadata,
                     )
                 elif property_name == "name":
                     self.kg.update_concept_name(concept_id, correct_value)
@@ -324,27 +442,25 @@ class FeedbackLearner:
                     self.vs.update_concept(
                         concept_id=concept_id,
                         name=correct_value,
-                        description=concept.get("description", ""),
-                        metadata=concept.get("metadata", {}),
-                    )
-                else:
-                    # Pour les autres propriétés, mettre à jour les métadonnées
-                    metadata = concept.get("metadata", {})
-                    metadata[property_name] = correct_value
-                    self.kg.update_concept_metadata(concept_id, metadata)
-                    # Mettre également à jour le vecteur
-                    self.vs.update_concept(
-                        concept_id=concept_id,
-                        name=concept.get("name", ""),
-                        description=concept.get("description", ""),
+                        description=description,
                         metadata=metadata,
                     )
+                else:
+                    # Les autres propriétés sont des métadonnées: écrire le
+                    # seul champ modifié, sous sa clé préfixée. Le vecteur,
+                    # calculé sur le nom et la description, et les propriétés
+                    # du stockage vectoriel ne dépendent pas des métadonnées:
+                    # inutile de le réencoder.
+                    if not self.kg.update_concept_metadata_field(
+                        concept_id, str(property_name), correct_value
+                    ):
+                        raise RuntimeError("échec de la mise à jour des métadonnées")
 
                 # Réinitialiser le compteur
-                del self.correction_counters[correction_key]
+                self._reset_counter(correction_key)
 
                 # Incrémenter les statistiques
-                self.learning_stats["knowledge_corrected"] += 1
+                self._increment_stat("knowledge_corrected")
 
                 return {
                     "status": "applied",
@@ -368,11 +484,10 @@ class FeedbackLearner:
             # Pas encore atteint le seuil, mettre en attente
             return {
                 "status": "pending",
-                "correction_key": correction_key,
-                "current_count": self.correction_counters[correction_key],
+                "correction_key": ":".join(correction_key[1:]),
+                "current_count": count,
                 "threshold": self.correction_threshold,
-                "remaining": self.correction_threshold
-                - self.correction_counters[correction_key],
+                "remaining": self.correction_threshold - count,
             }
 
     def _process_relation_feedback(self, feedback: Dict[str, Any]) -> Dict[str, Any]:
@@ -392,27 +507,16 @@ class FeedbackLearner:
         confidence = feedback.get("confidence", 0.5)
         bidirectional = feedback.get("bidirectional", False)
 
-        # Vérifier les informations obligatoires
-        if not source_id or not target_id or not relation_type:
-            return {
-                "status": "rejected",
-                "reason": "missing_required_fields",
-                "message": "source_id, target_id et relation_type sont requis",
-            }
-
-        # Vérifier le seuil de confiance
-        if confidence < self.min_feedback_confidence:
-            self.learning_stats["low_confidence_rejected"] += 1
-            return {
-                "status": "rejected",
-                "reason": "low_confidence",
-                "confidence": confidence,
-                "min_threshold": self.min_feedback_confidence,
-            }
+        # Vérifier les informations obligatoires et le seuil de confiance
+        rejection = self._check_feedback(
+            feedback, ("source_id", "target_id", "relation_type"), confidence
+        )
+        if rejection:
+            return rejection
 
         # Vérifier si les concepts existent
-        source_concept = self.kg.get_concept(source_id)
-        target_concept = self.kg.get_concept(target_id)
+        source_concept = self._get_concept(source_id)
+        target_concept = self._get_concept(target_id)
 
         if not source_concept:
             return {
@@ -429,13 +533,13 @@ class FeedbackLearner:
             }
 
         # Générer une clé unique pour ce type de relation
-        relation_key = f"{source_id}:{relation_type}:{target_id}"
+        relation_key = ("relation", source_id, relation_type, target_id)
 
         # Incrémenter le compteur
-        self.correction_counters[relation_key] += 1
+        count = self._increment_counter(relation_key)
 
         # Vérifier si le seuil est atteint
-        if self.correction_counters[relation_key] >= self.correction_threshold:
+        if count >= self.correction_threshold:
             # Appliquer la nouvelle relation
             try:
                 # Ajouter la relation
@@ -456,10 +560,10 @@ class FeedbackLearner:
                         )
 
                 # Réinitialiser le compteur
-                del self.correction_counters[relation_key]
+                self._reset_counter(relation_key)
 
                 # Incrémenter les statistiques
-                self.learning_stats["relations_added"] += 1
+                self._increment_stat("relations_added")
 
                 return {
                     "status": "applied",
@@ -484,11 +588,10 @@ class FeedbackLearner:
             # Pas encore atteint le seuil, mettre en attente
             return {
                 "status": "pending",
-                "relation_key": relation_key,
-                "current_count": self.correction_counters[relation_key],
+                "relation_key": ":".join(relation_key[1:]),
+                "current_count": count,
                 "threshold": self.correction_threshold,
-                "remaining": self.correction_threshold
-                - self.correction_counters[relation_key],
+                "remaining": self.correction_threshold - count,
             }
 
     def _process_qa_feedback(self, feedback: Dict[str, Any]) -> Dict[str, Any]:
@@ -508,26 +611,15 @@ class FeedbackLearner:
         relevance_score = feedback.get("relevance_score", 0)
         correctness_score = feedback.get("correctness_score", 0)
 
-        # Vérifier les informations obligatoires
-        if not question or not correct_answer:
-            return {
-                "status": "rejected",
-                "reason": "missing_required_fields",
-                "message": "question et correct_answer sont requis",
-            }
-
         # Calculer un score global pour la pertinence du feedback
         global_score = (relevance_score + correctness_score) / 2
 
-        # Vérifier si le score est suffisant pour traiter ce feedback
-        if global_score < self.min_feedback_confidence:
-            self.learning_stats["low_confidence_rejected"] += 1
-            return {
-                "status": "rejected",
-                "reason": "low_confidence",
-                "global_score": global_score,
-                "min_threshold": self.min_feedback_confidence,
-            }
+        # Vérifier les informations obligatoires et si le score est suffisant
+        rejection = self._check_feedback(
+            feedback, ("question", "correct_answer"), global_score, "global_score"
+        )
+        if rejection:
+            return rejection
 
         # Identifier les lacunes potentielles en se basant sur la question
         analysis = self.knowledge_gaps_identifier.analyze_question(question)
@@ -574,15 +666,12 @@ class FeedbackLearner:
         comment = feedback.get("comment", "")
 
         # Vérifier les informations obligatoires
-        if not concept_id or relevance_score == 0:
-            return {
-                "status": "rejected",
-                "reason": "missing_required_fields",
-                "message": "concept_id et relevance_score sont requis",
-            }
+        rejection = self._check_feedback(feedback, ("concept_id", "relevance_score"))
+        if rejection:
+            return rejection
 
         # Vérifier si le concept existe
-        concept = self.kg.get_concept(concept_id)
+        concept = self._get_concept(concept_id)
         if not concept:
             return {
                 "status": "rejected",
@@ -591,20 +680,19 @@ class FeedbackLearner:
             }
 
         # Générer une clé unique pour ce feedback de pertinence
-        relevance_key = (
-            f"{concept_id}:relevance:{query}" if query else f"{concept_id}:relevance"
-        )
+        relevance_key = ("relevance", concept_id, query or "")
 
         # Si la pertinence est négative, considérer comme un problème à corriger
         if relevance_score < 0:
             # Incrémenter le compteur
-            self.correction_counters[relevance_key] += 1
+            count = self._increment_counter(relevance_key)
 
             # Si le seuil est atteint, marquer pour révision
-            if self.correction_counters[relevance_key] >= self.correction_threshold:
+            if count >= self.correction_threshold:
                 # Ajouter un marqueur dans les métadonnées
-                metadata = concept.get("metadata", {})
-                review_list = metadata.get("needs_review", [])
+                self._forget_concept(concept_id)
+                metadata = KnowledgeGraph.get_concept_metadata(concept)
+                review_list = list(metadata.get("needs_review") or [])
 
                 if query:
                     review_item = f"Pertinence pour la requête: {query}"
@@ -617,14 +705,16 @@ class FeedbackLearner:
                 if review_item not in review_list:
                     review_list.append(review_item)
 
-                metadata["needs_review"] = review_list
-
-                # Mettre à jour le concept
+                # Mettre à jour la seule métadonnée modifiée, comme les
+                # corrections de propriétés
                 try:
-                    self.kg.update_concept_metadata(concept_id, metadata)
+                    if not self.kg.update_concept_metadata_field(
+                        concept_id, "needs_review", review_list
+                    ):
+                        raise RuntimeError("échec de la mise à jour des métadonnées")
 
                     # Réinitialiser le compteur
-                    del self.correction_counters[relevance_key]
+                    self._reset_counter(relevance_key)
 
                     return {
                         "status": "applied",
@@ -645,11 +735,14 @@ class FeedbackLearner:
                 # Pas encore atteint le seuil
                 return {
                     "status": "pending",
-                    "relevance_key": relevance_key,
-                    "current_count": self.correction_counters[relevance_key],
+                    "relevance_key": (
+                        f"{concept_id}:relevance:{query}"
+                        if query
+                        else f"{concept_id}:relevance"
+                    ),
+                    "current_count": count,
                     "threshold": self.correction_threshold,
-                    "remaining": self.correction_threshold
-                    - self.correction_counters[relevance_key],
+                    "remaining": self.correction_threshold - count,
                 }
         else:
             # Feedback positif, enregistrer pour analyse
@@ -678,24 +771,116 @@ class FeedbackLearner:
             "message": "Feedback général enregistré pour analyse future",
         }
 
-    def _validate_after_batch(self) -> None:
+    def _check_feedback(
+        self,
+        feedback: Dict[str, Any],
+        required: Tuple[str, ...],
+        confidence: Optional[float] = None,
+        confidence_key: str = "confidence",
+    ) -> Optional[Dict[str, Any]]:
         """
-        Exécute une validation après le traitement d'un lot de feedbacks.
+        Vérifie les champs obligatoires et le seuil de confiance d'un feedback.
+
+        Args:
+            feedback (Dict[str, Any]): Feedback à vérifier
+            required (Tuple[str, ...]): Champs obligatoires (non vides)
+            confidence (Optional[float], optional): Confiance à comparer au seuil. Par défaut à None (pas de vérification).
+            confidence_key (str, optional): Clé de la confiance dans le rejet. Par défaut à "confidence".
+
+        Returns:
+            Optional[Dict[str, Any]]: Résultat du rejet, ou None si le feedback est valide
         """
-        # Si des concepts ont été modifiés, exécuter une validation
-        if (
-            self.learning_stats["knowledge_corrected"] > 0
-            or self.learning_stats["relations_added"] > 0
-        ):
-            try:
-                # Pour l'instant, on ne valide que les concepts récemment modifiés
-                recent_concepts = self.kg.get_recent_concepts(hours=1, limit=50)
+        if not all(feedback.get(field) for field in required):
+            return {
+                "status": "rejected",
+                "reason": "missing_required_fields",
+                "message": f"{', '.join(required[:-1])} et {required[-1]} sont requis",
+            }
 
-                if recent_concepts:
-                    concept_ids = [c.get("id") for c in recent_concepts]
-                    self.knowledge_validation.validate_concepts(concept_ids)
-            except Exception as e:
-                self.logger.error(f"Erreur lors de la validation post-feedback: {e}")
+        if confidence is not None and confidence < self.min_feedback_confidence:
+            self._increment_stat("low_confidence_rejected")
+            return {
+                "status": "rejected",
+                "reason": "low_confidence",
+                confidence_key: confidence,
+                "min_threshold": self.min_feedback_confidence,
+            }
+
+        return None
+
+    def _get_concept(self, concept_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Récupère un concept, depuis le cache du lot en cours s'il est actif.
+
+        Args:
+            concept_id (str): ID du concept
+
+        Returns:
+            Optional[Dict[str, Any]]: Données du concept ou None si non trouvé
+        """
+        cache = getattr(self._batch_state, "concepts", None)
+        if cache is None:
+            return self.kg.get_concept(concept_id)
+        if concept_id not in cache:
+            cache[concept_id] = self.kg.get_concept(concept_id)
+        return cache[concept_id]
+
+    def _forget_concept(self, concept_id: str) -> None:
+        """
+        Retire un concept du cache du lot en cours avant sa modification.
+
+        Args:
+            concept_id (str): ID du concept
+        """
+        cache = getattr(self._batch_state, "concepts", None)
+        if cache is not None:
+            cache.pop(concept_id, None)
+
+    def _increment_counter(self, key: Tuple[str, ...]) -> int:
+        """
+        Incrémente le compteur de feedbacks concordants d'une clé.
+
+        Args:
+            key (Tuple[str, ...]): Clé du compteur
+
+        Returns:
+            int: Nouvelle valeur du compteur
+        """
+        with self._state_lock:
+            self.correction_counters[key] += 1
+            return self.correction_counters[key]
+
+    def _reset_counter(self, key: Tuple[str, ...]) -> None:
+        """
+        Réinitialise le compteur d'une clé après application de la correction.
+
+        Args:
+            key (Tuple[str, ...]): Clé du compteur
+        """
+        with self._state_lock:
+            self.correction_counters.pop(key, None)
+
+    def _increment_stat(self, name: str) -> None:
+        """
+        Incrémente une statistique d'apprentissage.
+
+        Args:
+            name (str): Nom de la statistique
+        """
+        with self._state_lock:
+            self.learning_stats[name] += 1
+
+    def _validate_after_batch(self, concept_ids: List[str]) -> None:
+        """
+        Exécute une validation des concepts modifiés par un lot de feedbacks.
+
+        Args:
+            concept_ids (List[str]): IDs des concepts corrigés ou reliés par le lot
+        """
+        try:
+            self.knowledge_validation.validate_concepts(concept_ids)
+        except Exception as e:
+            self.logger.error(f"Erreur lors de la validation post-feedback: {e}")
 
     def _generate_feedback_id(self, feedback: Dict[str, Any]) -> str:
         """
@@ -707,44 +892,9 @@ class FeedbackLearner:
         Returns:
             str: ID unique
         """
-        # Créer une représentation stable du feedback
-        fb_type = feedback.get("type", "general")
-        timestamp = str(int(time.time()))
-
-        # Différentes clés en fonction du type de feedback
-        if fb_type == "correction":
-            key_parts = [
-                fb_type,
-                feedback.get("concept_id", ""),
-                feedback.get("property", ""),
-                str(feedback.get("correct_value", "")),
-                timestamp,
-            ]
-        elif fb_type == "relation":
-            key_parts = [
-                fb_type,
-                feedback.get("source_id", ""),
-                feedback.get("relation_type", ""),
-                feedback.get("target_id", ""),
-                timestamp,
-            ]
-        elif fb_type == "question_answer":
-            key_parts = [
-                fb_type,
-                feedback.get("question", "")[:50],  # Limiter la longueur
-                timestamp,
-            ]
-        else:
-            # Cas général
-            key_parts = [
-                fb_type,
-                str(hash(json.dumps(feedback, sort_keys=True))),
-                timestamp,
-            ]
-
-        # Créer une empreinte unique
-        key_string = ":".join(key_parts)
-        return hashlib.md5(key_string.encode("utf-8")).hexdigest()
+        # L'identifiant sert uniquement à désigner le feedback: un UUID
+        # aléatoire évite de sérialiser et de hacher son contenu
+        return uuid.uuid4().hex
 
     def _get_inverse_relation(self, relation_type: str) -> Optional[str]:
         """
@@ -756,21 +906,4 @@ class FeedbackLearner:
         Returns:
             Optional[str]: Type de relation inverse, ou None si non défini
         """
-        # Mapping des relations inverses courantes
-        inverse_relations = {
-            "contains": "is_part_of",
-            "is_part_of": "contains",
-            "depends_on": "is_dependency_for",
-            "is_dependency_for": "depends_on",
-            "parent_of": "child_of",
-            "child_of": "parent_of",
-            "related_to": "related_to",  # Relation symétrique
-            "causes": "caused_by",
-            "caused_by": "causes",
-            "precedes": "follows",
-            "follows": "precedes",
-            "similar_to": "similar_to",  # Relation symétrique
-            "opposite_of": "opposite_of",  # Relation symétrique
-        }
-
-        return inverse_relations.get(relation_type)
+        return self.INVERSE_RELATIONS.get(relation_type)
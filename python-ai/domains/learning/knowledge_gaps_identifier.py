@@ -3,7 +3,6 @@ import logging
 import re
 from collections import Counter
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
 
 from ..knowledge.knowledge_graph import KnowledgeGraph
 from ..knowledge.vector_store import VectorStore
@@ -58,13 +57,13 @@ class KnowledgeGapsIdentifier:
         # Extraire les concepts clés de la question
         keywords = self._extract_keywords(question)
 
-        # Recherche sémantique pour chaque concept clé
-        search_results = []
-        for keyword in keywords:
-            results = self.semantic_search.search(
-                query=keyword, limit=3, enrich_with_relations=True
-            )
-            search_results.extend(results)
+        # Recherche sémantique des concepts clés, encodés en un seul lot
+        # (seuls le nom, la description et la certitude servent à la couverture)
+        search_results = [
+            result
+            for results in self.vs.search_similar_batch(keywords, limit=3)
+            for result in results
+        ]
 
         # Analyser les résultats pour détecter les lacunes
         coverage = self._analyze_coverage(keywords, search_results)
@@ -140,28 +139,31 @@ class KnowledgeGapsIdentifier:
         # Extraire des paragraphes du contenu
         paragraphs = re.split(r"\n\s*\n", content)
 
-        # Analyser chaque paragraphe
-        paragraph_analyses = []
-        all_keywords = set()
-        potential_new_concepts = set()
-
-        for paragraph in paragraphs:
-            if len(paragraph.strip()) < 50:  # Ignorer les paragraphes trop courts
-                continue
-
-            keywords = self._extract_keywords(paragraph)
-            all_keywords.update(keywords)
-
-            # Vérifier la couverture de chaque concept
-            for keyword in keywords:
-                results = self.semantic_search.search(query=keyword, limit=3)
+        # Ignorer les paragraphes trop courts
+        paragraphs = [p for p in paragraphs if len(p.strip()) >= 50]
+        paragraph_keywords = [self._extract_keywords(p) for p in paragraphs]
+        all_keywords = {k for keywords in paragraph_keywords for k in keywords}
+
+        # Vérifier la couverture de chaque concept: les mots-clés distincts
+        # sont encodés et recherchés en un seul lot
+        unique_keywords = list(all_keywords)
+        potential_new_concepts = {
+            keyword
+            for keyword, results in zip(
+                unique_keywords, self.vs.search_similar_batch(unique_keywords, limit=3)
+            )
+            # Si peu ou pas de résultats, c'est potentiellement un nouveau concept
+            if not results or results[0].get("certainty", 0) < 0.6
+        }
 
-                # Si peu ou pas de résultats, c'est potentiellement un nouveau concept
-                if not results or results[0].get("certainty", 0) < 0.6:
-                    potential_new_concepts.add(keyword)
+        # Vectoriser les paragraphes en un lot pour vérifier leur similarité globale
+        paragraph_embeddings = self.vs.get_embeddings(paragraphs) if paragraphs else []
 
-            # Vectoriser le paragraphe pour vérifier sa similarité globale
-            paragraph_embedding = self.vs.get_embedding(paragraph)
+        # Analyser chaque paragraphe
+        paragraph_analyses = []
+        for paragraph, keywords, paragraph_embedding in zip(
+            paragraphs, paragraph_keywords, paragraph_embeddings
+        ):
             most_similar_content = self._find_most_similar_content(paragraph_embedding)
 
             paragraph_analyses.append(
@@ -304,6 +306,41 @@ class KnowledgeGapsIdentifier:
 
         return gap_id
 
+    def register_knowledge_gaps_batch(
+        self, topics: List[str], descriptions: List[str]
+    ) -> List[str]:
+        """
+        Enregistre plusieurs lacunes de connaissances en une seule écriture
+        dans le graphe.
+
+        Args:
+            topics (List[str]): Sujets des lacunes
+            descriptions (List[str]): Descriptions détaillées, dans l'ordre des sujets
+
+        Returns:
+            List[str]: Identifiants des lacunes, dans l'ordre des sujets
+        """
+        timestamp = self._get_current_timestamp()
+        gap_ids = [f"gap:{topic.lower().replace(' ', '_')}" for topic in topics]
+
+        gaps = {
+            gap_id: {
+                "name": topic,
+                "description": description,
+                "type": "knowledge_gap",
+                "status": "identified",
+                "timestamp": timestamp,
+            }
+            for gap_id, topic, description in zip(gap_ids, topics, descriptions)
+        }
+
+        self.kg.add_concepts(gaps)
+
+        # Ajouter également à l'ensemble des lacunes connues
+        self.known_gaps.update(topic.lower() for topic in topics)
+
+        return gap_ids
+
     def _extract_keywords(self, text: str) -> List[str]:
         """
         Extrait les mots-clés et concepts d'un texte.
@@ -411,29 +448,31 @@ class KnowledgeGapsIdentifier:
         Returns:
             Dict[str, float]: Score de couverture pour chaque mot-clé
         """
-        coverage = {}
-
-        for keyword in keywords:
-            # Chercher les meilleurs résultats pour ce mot-clé
-            best_results = []
-            for result in search_results:
-                # Calculer une similarité simple entre le mot-clé et le concept
-                name = result.get("name", "")
-                description = result.get("description", "")
-                combined_text = f"{name}: {description}"
-
-                similarity = self._calculate_text_similarity(keyword, combined_text)
+        if not search_results:
+            return dict.fromkeys(keywords, 0.0)
 
-                if similarity > 0.3:  # Seuil arbitraire
-                    best_results.append((result, similarity))
+        # Encoder mots-clés et concepts trouvés en un seul lot
+        texts = [
+            f"{result.get('name', '')}: {result.get('description', '')}"
+            for result in search_results
+        ]
+        vectors = self._stack_embeddings(self.vs.get_embeddings(keywords + texts))
 
-            # Trier par similarité
-            best_results.sort(key=lambda x: x[1], reverse=True)
+        # Similarités cosinus mot-clé x concept, puis meilleur résultat de
+        # chaque mot-clé
+        similarities = np.clip(
+            vectors[: len(keywords)] @ vectors[len(keywords) :].T, 0.0, 1.0
+        )
+        best_indices = similarities.argmax(axis=1)
+        best_similarities = similarities[np.arange(len(keywords)), best_indices]
 
+        coverage = {}
+        for keyword, best_index, similarity in zip(
+            keywords, best_indices.tolist(), best_similarities.tolist()
+        ):
             # Score de couverture basé sur le meilleur résultat
-            if best_results:
-                best_result, similarity = best_results[0]
-                certainty = best_result.get("certainty", 0.5)
+            if similarity > 0.3:  # Seuil arbitraire
+                certainty = search_results[best_index].get("certainty", 0.5)
 
                 # Combinaison de similarité et certitude
                 coverage[keyword] = min(1.0, (similarity * 0.7) + (certainty * 0.3))
@@ -442,6 +481,29 @@ class KnowledgeGapsIdentifier:
 
         return coverage
 
+    @staticmethod
+    def _stack_embeddings(embeddings: List[Optional[np.ndarray]]) -> np.ndarray:
+        """
+        Empile des embeddings en une matrice de lignes de norme 1, les
+        embeddings manquants étant remplacés par des vecteurs nuls (similarité
+        nulle). Le produit de deux telles matrices donne les similarités
+        cosinus.
+
+        Args:
+            embeddings (List[Optional[np.ndarray]]): Embeddings à empiler
+
+        Returns:
+            np.ndarray: Matrice (n, dim) des embeddings normalisés
+        """
+        dim = next((e.shape[-1] for e in embeddings if e is not None), 1)
+        matrix = np.zeros((len(embeddings), dim), dtype=np.float32)
+        for index, embedding in enumerate(embeddings):
+            if embedding is not None:
+                matrix[index] = embedding
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return np.divide(matrix, norms, out=matrix, where=norms > 0)
+
     def _find_recurring_gaps(
         self, analyses: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
@@ -488,55 +550,33 @@ class KnowledgeGapsIdentifier:
 
         return recurring_gaps
 
-    def _find_most_similar_content(self, embedding: List[float]) -> Dict[str, Any]:
+    def _find_most_similar_content(
+        self, embedding: Optional[np.ndarray]
+    ) -> Dict[str, Any]:
         """
         Trouve le contenu le plus similaire à un embedding donné.
 
         Args:
-            embedding (List[float]): Embedding à comparer
+            embedding (Optional[np.ndarray]): Embedding à comparer
 
         Returns:
             Dict[str, Any]: Contenu le plus similaire trouvé
         """
-        # Utiliser directement la recherche par vecteur de Weaviate
-        # C'est une simplification, une implémentation complète utiliserait
-        # des requêtes plus sophistiquées
+        if embedding is None:
+            return {"concept_id": "", "name": "", "description": "", "certainty": 0}
 
-        try:
-            # Convertir l'embedding en format attendu
-            vector = np.array(embedding).reshape(1, -1)
-
-            # Effectuer une recherche par vecteur
-            results = (
-                self.vs.client.query.get(
-                    "Concept", ["concept_id", "name", "description", "category"]
-                )
-                .with_near_vector({"vector": embedding, "certainty": 0.7})
-                .with_limit(1)
-                .do()
-            )
+        # Recherche par vecteur: servie par l'index local du stockage
+        # vectoriel s'il est chargé, sinon par Weaviate
+        results = self.vs.search_similar_by_vector(
+            embedding, limit=1, fields=("concept_id", "name", "description", "category")
+        )
 
-            # Extraire le résultat
-            if (
-                "data" in results
-                and "Get" in results["data"]
-                and results["data"]["Get"]["Concept"]
-            ):
-                best_match = results["data"]["Get"]["Concept"][0]
-                # Calculer la certitude
-                certainty = 0.7  # Valeur par défaut
-                if (
-                    "_additional" in best_match
-                    and "certainty" in best_match["_additional"]
-                ):
-                    certainty = best_match["_additional"]["certainty"]
-
-                best_match["certainty"] = certainty
-                return best_match
-        except Exception as e:
-            self.logger.error(f"Erreur lors de la recherche de contenu similaire: {e}")
+        if results:
+            best_match = results[0]
+            best_match.setdefault("certainty", 0.7)  # Valeur par défaut
+            return best_match
 
-        # Retourner un résultat vide en cas d'erreur
+        # Retourner un résultat vide si aucun contenu similaire
         return {"concept_id": "", "name": "", "description": "", "certainty": 0}
 
     def _calculate_text_similarity(self, text1: str, text2: str) -> float:
@@ -551,20 +591,13 @@ class KnowledgeGapsIdentifier:
             float: Score de similarité entre 0 et 1
         """
         try:
-            # Générer les embeddings
-            embedding1 = self.vs.get_embedding(text1)
-            embedding2 = self.vs.get_embedding(text2)
-
-            if not embedding1 or not embedding2:
-                return 0.0
-
-            # Calculer la similarité cosinus
-            vec1 = np.array(embedding1).reshape(1, -1)
-            vec2 = np.array(embedding2).reshape(1, -1)
+            # Générer les embeddings en un lot
+            vec1, vec2 = self._stack_embeddings(self.vs.get_embeddings([text1, text2]))
 
-            similarity = cosine_similarity(vec1, vec2)[0][0]
+            # Calculer la similarité cosinus (nulle si un embedding manque)
+            similarity = float(vec1 @ vec2)
 
-            return float(max(0.0, min(1.0, similarity)))
+            return max(0.0, min(1.0, similarity))
         except Exception as e:
             self.logger.error(f"Erreur lors du calcul de similarité: {e}")
             return 0.0
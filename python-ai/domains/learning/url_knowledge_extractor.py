@@ -576,6 +576,7 @@ class URLKnowledgeExtractor:
             List[str]: IDs des concepts ajoutés
         """
         added_concepts = []
+        vector_concepts = []
 
         for concept in concepts:
             concept_id = concept["id"]
@@ -598,19 +599,16 @@ class URLKnowledgeExtractor:
                 concept_added = self.kg.add_concept(concept_id, concept_properties)
 
                 if concept_added:
-                    # Ajouter également au stockage vectoriel
-                    try:
-                        self.vs.add_concept(
-                            concept_id=concept_id,
-                            name=concept["name"],
-                            description=concept["description"],
-                            category=domain,
-                            source="web",
-                        )
-                    except Exception as e:
-                        self.logger.error(
-                            f"Erreur lors de l'ajout au stockage vectoriel: {e}"
-                        )
+                    # Ajouter également au stockage vectoriel (par lot, après la boucle)
+                    vector_concepts.append(
+                        {
+                            "concept_id": concept_id,
+                            "name": concept["name"],
+                            "description": concept["description"],
+                            "category": domain,
+                            "source": "web",
+                        }
+                    )
 
                     # Créer une relation avec l'URL source
                     self.kg.add_relationship(
@@ -636,6 +634,9 @@ class URLKnowledgeExtractor:
                     {"confidence": concept.get("confidence", 0.8)},
                 )
 
+        if vector_concepts and not self.vs.add_concepts(vector_concepts):
+            self.logger.error("Erreur lors de l'ajout au stockage vectoriel")
+
         return added_concepts
 
     def _get_timestamp(self) -> str:
@@ -5,6 +5,10 @@ import os
 with open("requirements.txt") as f:
     requirements = f.read().splitlines()
 
+# Optional accelerations (see requirements-optional.txt)
+with open("requirements-optional.txt") as f:
+    optional_requirements = f.read().splitlines()
+
 # Read the README for the long description
 with open("../README.md", "r", encoding="utf-8") as f:
     long_description = f.read()
@@ -27,6 +31,7 @@ setup(
     ],
     python_requires=">=3.11",
     install_requires=requirements,
+    extras_require={"optimized": optional_requirements},
     entry_points={
         "console_scripts": [
             "lucie-api=api.main:start_server",
@@ -0,0 +1,208 @@
+import unittest
+import sys
+import os
+from unittest.mock import MagicMock, Mock, patch
+import logging
+
+import numpy as np
+
+# Add the parent directory to the path so we can import the modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from domains.knowledge.knowledge_graph import KnowledgeGraph
+from domains.knowledge.knowledge_validation import KnowledgeValidation
+from domains.knowledge.relationship_discovery import RelationshipDiscovery
+
+
+class TestKnowledgeValidation(unittest.TestCase):
+    """Tests for the validation rules of KnowledgeValidation."""
+
+    def setUp(self):
+        """Set up a validator over a mocked knowledge graph and vector store."""
+        logging.basicConfig(level=logging.INFO)
+        self.kg = MagicMock()
+        self.session = self.kg.driver.session.return_value.__enter__.return_value
+        self.validation = KnowledgeValidation(self.kg, Mock())
+
+    def _edges(self, *edges):
+        """Build the records returned by the hierarchy edges query."""
+        return [
+            {
+                "source_id": source,
+                "source_name": source.upper(),
+                "target_id": target,
+                "target_name": target.upper(),
+            }
+            for source, target in edges
+        ]
+
+    def test_tarjan_fallback_when_gds_is_missing(self):
+        """Test that cycles are found locally when the GDS projection fails."""
+        edges = self._edges(
+            ("a", "b"), ("b", "c"), ("c", "a"), ("c", "d"), ("d", "e"), ("e", "d")
+        )
+
+        def run(query, **kwargs):
+            if query == KnowledgeValidation.HIERARCHY_EDGES_QUERY:
+                return edges
+            if query == KnowledgeValidation.GDS_PROJECT_QUERY:
+                raise RuntimeError("There is no procedure gds.graph.project.cypher")
+            return Mock()
+
+        self.session.run.side_effect = run
+
+        issues = self.validation.validate_circular_references()
+
+        self.assertFalse(self.validation._gds_available)
+        cycles = sorted(sorted(issue["cycle_members"]) for issue in issues)
+        self.assertEqual(cycles, [["a", "b", "c"], ["d", "e"]])
+        for issue in issues:
+            self.assertEqual(issue["rule"], "circular_references")
+            self.assertEqual(issue["concept_name"], issue["concept_id"].upper())
+
+    def test_no_cycle_in_a_dag(self):
+        """Test that an acyclic hierarchy yields no issue."""
+        self.validation._gds_available = False
+        self.session.run.return_value = self._edges(("a", "b"), ("b", "c"), ("a", "c"))
+
+        self.assertEqual(self.validation.validate_circular_references(), [])
+
+    def test_duplicate_names_at_the_threshold(self):
+        """Test that a name pair exactly at the threshold is not pruned."""
+        # 23 et 25 caractères: similarité 1 - 2/25 = 0.92, le seuil par défaut
+        name = "abcdefghijklmnopqrstuvw"
+        self.session.run.return_value = [
+            {"c": {"id": "a", "name": name + "xy", "type": "topic"}, "degree": 1},
+            {"c": {"id": "b", "name": name, "type": "topic"}, "degree": 1},
+        ]
+        self.validation._get_concept_embedding = Mock(
+            return_value=np.array([1.0, 0.0], dtype=np.float32)
+        )
+
+        issues = self.validation.validate_duplicate_concepts()
+
+        self.assertEqual(len(issues), 1)
+        self.assertEqual(issues[0]["concept_id"], "a")
+        self.assertEqual(issues[0]["duplicate_id"], "b")
+        self.assertIn("Noms très similaires", issues[0]["description"])
+
+    def test_concept_rules_share_one_scan(self):
+        """Test that completeness, orphans and duplicates use a single scan."""
+        for rule_id in ("relation_consistency", "circular_references"):
+            self.validation.rules[rule_id]["enabled"] = False
+        self.validation.rules["semantic_consistency"]["enabled"] = False
+        self.session.run.return_value = [
+            {"c": {"id": "a", "name": "Alpha", "type": "topic"}, "degree": 0},
+            {"c": {"id": "d", "name": "Domaine", "type": "domain"}, "degree": 0},
+            {"c": {"id": "b", "name": "Beta", "description": "b"}, "degree": 2},
+        ]
+        self.validation._get_concept_embedding = Mock(return_value=None)
+
+        results = self.validation.validate_knowledge_base()
+
+        self.assertEqual(self.session.run.call_count, 1)
+        by_rule = {}
+        for issue in results["issues"]:
+            by_rule.setdefault(issue["rule"], []).append(issue["concept_id"])
+        self.assertEqual(by_rule["concept_completeness"], ["a", "d"])
+        self.assertEqual(by_rule["orphaned_concepts"], ["a"])
+        # Seul le concept typé hors domaine est comparé
+        self.validation._get_concept_embedding.assert_called_once_with("a", "Alpha", "")
+
+    def test_strongly_connected_components(self):
+        """Test the iterative Tarjan algorithm on a graph with a self loop."""
+        graph = {"a": ["b"], "b": ["a", "c"], "c": ["c"], "d": []}
+
+        components = KnowledgeValidation._strongly_connected_components(graph)
+
+        self.assertEqual(
+            sorted(sorted(component) for component in components),
+            [["a", "b"], ["c"], ["d"]],
+        )
+
+
+class TestKnowledgeGraph(unittest.TestCase):
+    """Tests for the recent concepts query of KnowledgeGraph."""
+
+    def setUp(self):
+        """Set up a knowledge graph over a mocked Neo4j driver."""
+        with patch("domains.knowledge.knowledge_graph.GraphDatabase"):
+            self.kg = KnowledgeGraph("bolt://localhost", "neo4j", "secret")
+        self.session = self.kg.driver.session.return_value.__enter__.return_value
+
+    def test_recent_concepts_include_extracted_concepts(self):
+        """Test that concepts dated by extracted_at only are returned."""
+        self.session.run.return_value = [{"id": "concept:extrait"}]
+
+        concept_ids = self.kg.get_recent_concept_ids(hours=2, limit=10)
+
+        self.assertEqual(concept_ids, ["concept:extrait"])
+        (query,), params = self.session.run.call_args
+        self.assertIn("coalesce(c.extracted_at, c.timestamp)", query)
+        self.assertNotIn("WHERE c.timestamp", query)
+        self.assertEqual(set(params["excluded_types"]), {"url", "knowledge_gap"})
+        self.assertEqual(params["limit"], 10)
+        self.assertIsInstance(params["since"], str)
+
+
+class TestRelationshipDiscovery(unittest.TestCase):
+    """Tests for the exact similar pairs search of RelationshipDiscovery."""
+
+    def setUp(self):
+        """Set up a discovery service over mocked stores."""
+        self.discovery = RelationshipDiscovery(Mock(), Mock())
+
+    def _brute_force_pairs(self, embeddings, threshold):
+        """Compute the expected pairs (i < j) with a full similarity matrix."""
+        similarities = embeddings @ embeddings.T
+        return {
+            (i, j)
+            for i in range(len(embeddings))
+            for j in range(i + 1, len(embeddings))
+            if similarities[i, j] >= threshold
+        }
+
+    def test_similar_pairs_matches_brute_force(self):
+        """Test that the tiled upper-triangle search finds every pair once."""
+        rng = np.random.default_rng(0)
+        embeddings = rng.normal(size=(37, 8)).astype(np.float32)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        threshold = 0.3
+        expected = self._brute_force_pairs(embeddings, threshold)
+
+        for batch_size in (1, 5, 16, 37, 100):
+            pairs, scores = self.discovery._similar_pairs(
+                embeddings, threshold, batch_size
+            )
+            found = [tuple(pair) for pair in pairs.tolist()]
+
+            self.assertEqual(len(found), len(set(found)))
+            self.assertEqual(set(found), expected)
+            self.assertTrue(all(i < j for i, j in found))
+            np.testing.assert_allclose(
+                scores,
+                [embeddings[i] @ embeddings[j] for i, j in found],
+                rtol=1e-5,
+            )
+
+    def test_similar_pairs_ignores_self_similarity(self):
+        """Test that identical embeddings pair up but never with themselves."""
+        embeddings = np.array([[1.0, 0.0], [1.0, 0.0], [0.0, 1.0]], np.float32)
+
+        pairs, scores = self.discovery._similar_pairs(embeddings, 0.9, batch_size=2)
+
+        self.assertEqual(pairs.tolist(), [[0, 1]])
+        np.testing.assert_allclose(scores, [1.0])
+
+    def test_similar_pairs_empty(self):
+        """Test that an empty matrix yields no pair."""
+        pairs, scores = self.discovery._similar_pairs(
+            np.empty((0, 4), np.float32), 0.5, batch_size=8
+        )
+
+        self.assertEqual(pairs.shape, (0, 2))
+        self.assertEqual(scores.shape, (0,))
+
+
+if __name__ == "__main__":
+    unittest.main()
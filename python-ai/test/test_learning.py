@@ -0,0 +1,256 @@
+import unittest
+import sys
+import os
+from unittest.mock import Mock
+import logging
+import threading
+
+import numpy as np
+
+# Add the parent directory to the path so we can import the modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from domains.learning.continuous_learning import ContinuousLearning
+from domains.learning.feedback_learner import FeedbackLearner
+from domains.learning.knowledge_gaps_identifier import KnowledgeGapsIdentifier
+
+
+class TestContinuousLearningQueues(unittest.TestCase):
+    """Tests for the priority queue of pending sources."""
+
+    def setUp(self):
+        """Set up the service over mocked stores and collaborators."""
+        logging.basicConfig(level=logging.INFO)
+        self.url_extractor = Mock()
+        self.url_extractor.extract_from_url.return_value = {
+            "status": "success",
+            "concepts_added": 1,
+        }
+        self.learning = ContinuousLearning(
+            Mock(),
+            Mock(),
+            knowledge_gaps_identifier=Mock(),
+            url_extractor=self.url_extractor,
+            knowledge_validation=Mock(),
+            semantic_search=Mock(),
+            max_pending_sources=3,
+        )
+
+    def _add(self, url, priority):
+        """Queue a source with a priority below the urgent threshold."""
+        return self.learning.add_learning_source(url, priority=priority)
+
+    def test_sources_are_processed_by_priority_then_arrival(self):
+        """Test that the heap yields the highest priority, oldest first."""
+        self._add("http://a", 2)
+        self._add("http://b", 5)
+        self._add("http://c", 5)
+
+        processed = self.learning._process_pending_sources()
+
+        self.assertEqual(
+            [source["url"] for source in processed],
+            ["http://b", "http://c", "http://a"],
+        )
+        self.assertEqual(self.learning.pending_sources, [])
+        self.assertEqual(self.learning._pending_urls, {})
+
+    def test_duplicate_source_is_not_queued_twice(self):
+        """Test that a queued URL is reported with its position."""
+        self._add("http://a", 2)
+        self._add("http://b", 5)
+
+        result = self._add("http://a", 7)
+
+        self.assertEqual(result["status"], "already_queued")
+        self.assertEqual(result["position"], 2)
+        self.assertEqual(len(self.learning.pending_sources), 2)
+
+    def test_eviction_forgets_the_evicted_url(self):
+        """Test that a full queue evicts its lowest priority source."""
+        self._add("http://a", 3)
+        self._add("http://low", 1)
+        self._add("http://b", 3)
+
+        result = self._add("http://c", 4)
+
+        self.assertEqual(result["status"], "queued")
+        self.assertEqual(result["position"], 1)
+        self.assertEqual(
+            set(self.learning._pending_urls), {"http://a", "http://b", "http://c"}
+        )
+        self.assertEqual(len(self.learning.pending_sources), 3)
+        # L'URL évincée peut être proposée à nouveau
+        self.assertEqual(self._add("http://low", 5)["status"], "queued")
+
+    def test_failed_source_stays_queued(self):
+        """Test that a failed extraction keeps the source and its URL queued."""
+        self.url_extractor.extract_from_url.side_effect = RuntimeError("timeout")
+        self._add("http://a", 2)
+
+        processed = self.learning._process_pending_sources()
+
+        self.assertEqual(processed[0]["status"], "error")
+        self.assertEqual(len(self.learning.pending_sources), 1)
+        self.assertEqual(self._add("http://a", 2)["status"], "already_queued")
+
+
+class TestFeedbackLearner(unittest.TestCase):
+    """Tests for the batch processing and the counters of FeedbackLearner."""
+
+    def setUp(self):
+        """Set up the learner over a mocked knowledge graph."""
+        self.kg = Mock()
+        self.kg.get_concepts.side_effect = lambda ids: {
+            concept_id: {"id": concept_id, "name": concept_id}
+            for concept_id in ids
+            if concept_id != "missing"
+        }
+        self.kg.get_concept.return_value = None
+        self.knowledge_validation = Mock()
+        self.learner = FeedbackLearner(
+            self.kg,
+            Mock(),
+            semantic_search=Mock(),
+            knowledge_validation=self.knowledge_validation,
+            knowledge_gaps_identifier=Mock(),
+            correction_threshold=2,
+        )
+
+    def _correction(self, concept_id, value="v"):
+        """Build a confident correction feedback."""
+        return {
+            "type": "correction",
+            "concept_id": concept_id,
+            "property": "category",
+            "correct_value": value,
+            "confidence": 0.9,
+        }
+
+    def test_batch_partitions_keep_per_concept_order(self):
+        """Test that each concept reaches its threshold within its partition."""
+        feedbacks = [
+            self._correction("a"),
+            self._correction("b"),
+            self._correction("a"),
+            self._correction("b"),
+            self._correction("missing"),
+        ]
+
+        summary = self.learner.process_batch_feedback(feedbacks, return_detailed=True)
+
+        statuses = [result["status"] for result in summary["detailed_results"]]
+        self.assertEqual(
+            statuses, ["pending", "pending", "applied", "applied", "rejected"]
+        )
+        self.assertEqual(summary["success_count"], 2)
+        self.assertEqual(summary["rejected_count"], 1)
+        self.assertEqual(summary["pending_count"], 2)
+        # Concepts chargés en une seule requête, sauf le concept inexistant
+        self.kg.get_concepts.assert_called_once()
+        self.kg.get_concept.assert_called_once_with("missing")
+        # Seuls les concepts corrigés sont revalidés
+        (concept_ids,), _ = self.knowledge_validation.validate_concepts.call_args
+        self.assertEqual(sorted(concept_ids), ["a", "b"])
+        # Le cache du lot n'est plus visible après le lot
+        self.assertIsNone(getattr(self.learner._batch_state, "concepts", None))
+
+    def test_statistics_are_counted_incrementally(self):
+        """Test the per-type and per-status counts, including evictions."""
+        self.kg.get_concept.side_effect = lambda concept_id: {"id": concept_id}
+        self.learner.feedback_history = type(self.learner.feedback_history)(maxlen=3)
+
+        self.learner.process_feedback({"type": "general"})
+        self.learner.process_feedback(self._correction("a"))
+        self.learner.process_feedback(self._correction("a"))
+        self.learner.process_feedback({"type": "correction", "confidence": 0.9})
+
+        stats = self.learner.get_learning_statistics()
+        self.assertEqual(stats["total_feedback_received"], 3)
+        self.assertEqual(stats["feedback_by_type"], {"correction": 3})
+        self.assertEqual(
+            stats["feedback_by_status"], {"pending": 1, "applied": 1, "rejected": 1}
+        )
+        self.assertEqual(stats["feedback_processed"], 4)
+        self.assertEqual(stats["knowledge_corrected"], 1)
+
+    def test_concurrent_feedback_counts(self):
+        """Test that the counters stay consistent under concurrent calls."""
+        self.learner.feedback_history = type(self.learner.feedback_history)(maxlen=50)
+
+        def submit():
+            for _ in range(40):
+                self.learner.process_feedback({"type": "general"})
+
+        threads = [threading.Thread(target=submit) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = self.learner.get_learning_statistics()
+        self.assertEqual(stats["feedback_processed"], 160)
+        self.assertEqual(stats["feedback_by_type"], {"general": 50})
+        self.assertEqual(stats["feedback_by_status"], {"stored_for_analysis": 50})
+
+
+class TestKnowledgeGapsIdentifier(unittest.TestCase):
+    """Tests for the vectorized keyword coverage analysis."""
+
+    def setUp(self):
+        """Set up the identifier over a mocked vector store."""
+        self.vs = Mock()
+        self.identifier = KnowledgeGapsIdentifier(Mock(), self.vs, Mock())
+
+    def test_stack_embeddings_normalizes_rows(self):
+        """Test that rows have unit norm and missing embeddings are zero."""
+        matrix = KnowledgeGapsIdentifier._stack_embeddings(
+            [np.array([3.0, 4.0]), None, np.array([0.0, 0.0])]
+        )
+
+        self.assertEqual(matrix.dtype, np.float32)
+        np.testing.assert_allclose(matrix, [[0.6, 0.8], [0.0, 0.0], [0.0, 0.0]])
+
+    def test_stack_embeddings_all_missing(self):
+        """Test that a list of missing embeddings yields zero rows."""
+        matrix = KnowledgeGapsIdentifier._stack_embeddings([None, None])
+
+        self.assertEqual(matrix.shape, (2, 1))
+        self.assertFalse(matrix.any())
+
+    def test_analyze_coverage(self):
+        """Test that each keyword is scored against its closest result."""
+        embeddings = {
+            "chat": np.array([1.0, 0.0, 0.0]),
+            "chien": np.array([0.0, 1.0, 0.0]),
+            "inconnu": None,
+            "Chat: félin": np.array([2.0, 0.0, 0.0]),
+            "Loup: canidé": np.array([0.0, 1.0, 1.0]),
+        }
+        self.vs.get_embeddings.side_effect = lambda texts: [
+            embeddings[text] for text in texts
+        ]
+        results = [
+            {"name": "Chat", "description": "félin", "certainty": 0.9},
+            {"name": "Loup", "description": "canidé"},
+        ]
+
+        coverage = self.identifier._analyze_coverage(
+            ["chat", "chien", "inconnu"], results
+        )
+
+        self.vs.get_embeddings.assert_called_once()
+        self.assertAlmostEqual(coverage["chat"], 0.7 + 0.9 * 0.3)
+        self.assertAlmostEqual(coverage["chien"], np.sqrt(0.5) * 0.7 + 0.5 * 0.3)
+        self.assertEqual(coverage["inconnu"], 0.0)
+
+    def test_analyze_coverage_without_results(self):
+        """Test that keywords are uncovered when the search found nothing."""
+        coverage = self.identifier._analyze_coverage(["chat", "chien"], [])
+
+        self.assertEqual(coverage, {"chat": 0.0, "chien": 0.0})
+        self.vs.get_embeddings.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()